@@ -1,3 +1,7 @@
+from lya_vm import PRINT_INT, PRINT_CHAR, PRINT_BOOL
+
+# Stack cells held by a counted loop while it runs
+LOOP_CELLS = 3
 
 class NodeVisitor(object):
     """
@@ -71,6 +75,16 @@ class AST(object):
 
     is_returning_from_loc_procedure_stack = [False]
 
+    # Stack cells held by the counted loops around the code being generated
+    loop_cells = 0
+    exit_cells = dict()
+
+    # Source line and procedure label of the code being generated, and the
+    # (pc, line, procedure) where they changed, see sites
+    line = 0
+    procedure = None
+    marks = []
+
     def __init__(self, *args, **kwargs):
         assert len(args) == len(self._fields)
         for name,value in zip(self._fields, args):
@@ -79,6 +93,22 @@ class AST(object):
         for name,value in kwargs.items():
             setattr(self,name,value)
 
+    def mark(line, procedure):
+        AST.line = line
+        AST.procedure = procedure
+        AST.marks.append((len(AST.code), line, procedure))
+
+    def sites():
+        """
+        Return the (line, procedure) of every instruction of AST.code.
+        """
+        sites = []
+        marks = AST.marks + [(len(AST.code), None, None)]
+        for i in range(len(marks) - 1):
+            pc, line, procedure = marks[i]
+            sites += [(line, procedure)] * (marks[i + 1][0] - pc)
+        return sites
+
     def print(self, show_values, tabbing):
         print(tabbing, end='')
         print(self.__class__.__name__, end='')
@@ -118,6 +148,9 @@ class Program(AST):
 
         AST.code = []
         AST.label_counter = 0
+        AST.loop_cells = 0
+        AST.marks = []
+        AST.mark(self.lineno, None)
 
         AST.code.append(("stp", ))
         super(Program, self).generate_code()
@@ -131,6 +164,12 @@ class Program(AST):
 class Declaration_Statement(AST):
     _fields = ['declaration_list']
 
+    def generate_code(self):
+        outer = AST.line
+        AST.mark(self.lineno, AST.procedure)
+        super(Declaration_Statement, self).generate_code()
+        AST.mark(outer, AST.procedure)
+
 # declaration_list
 
 class Declaration(AST):
@@ -546,10 +585,18 @@ class Action_Statement(AST):
     _fields = ['label_id', 'action']
 
     def generate_code(self):
+        outer = AST.line
+        AST.mark(self.lineno, AST.procedure)
+
         if self.action.__class__ in [Do_Action, If_Action] and self.label_id != None:
             AST.end_label_dict[self.label_id.identifier.ID] = AST.label_counter + 1
+            AST.exit_cells[self.label_id.identifier.ID] = AST.loop_cells
+            if self.action.__class__ == Do_Action:
+                AST.exit_cells[self.label_id.identifier.ID] += self.action.loop_cells()
         super(Action_Statement, self).generate_code()
 
+        AST.mark(outer, AST.procedure)
+
 
 class Label_Id(AST):
     _fields = ['identifier']
@@ -677,6 +724,13 @@ class Else_Clause(AST):
 class Do_Action(AST):
     _fields = ['control_part', 'action_statement_list']
 
+    # Counted loops keep the address of the counter, the end value and the
+    # step on the stack, see Step_Enumeration
+    def loop_cells(self):
+        if self.control_part != None and self.control_part.for_control != None:
+            return LOOP_CELLS
+        return 0
+
     def generate_code(self):
         # WARNING: end_label MUST be the first label declared.
         # Take a look at class Action_Statement and you will understand
@@ -688,6 +742,9 @@ class Do_Action(AST):
             control_label = AST.label_counter
             AST.label_counter += 1
 
+            cells = self.loop_cells()
+            AST.loop_cells += cells
+
             control_instructions = self.control_part.generate_code(control_label, end_label)
 
             if self.action_statement_list != None:
@@ -695,9 +752,14 @@ class Do_Action(AST):
                     action.generate_code()
             for instruction in control_instructions:
                 AST.code.append(instruction)
-            AST.code.append(("jmp", control_label))
+            if cells == 0:
+                AST.code.append(("jmp", control_label))
             AST.code.append(("lbl", end_label))
 
+            AST.loop_cells -= cells
+            if cells > 0:
+                AST.code.append(("dlc", cells))
+
         else:
             for action_statement in self.action_statement_list:
                 action_statement.generate_code()
@@ -727,39 +789,36 @@ class For_Control(AST):
 
 class Step_Enumeration(AST):
     _fields = ['loop_counter', 'start_value', 'step_value', 'end_value']
+    down = False
 
+    # The counter address, start, end and step values are evaluated once.
+    # "for" stores the start value in the counter, leaves the address, end
+    # and step on the stack and skips the loop if it must not run. "nxt"
+    # steps the counter and jumps back while it has not passed the end.
+    # Both leave the stack as is; Do_Action pops it after the loop.
     def generate_code(self, control_label, end_label):
-        offset = self.loop_counter.identifier.offset
-        scope = self.loop_counter.identifier.scope
-
+        self.loop_counter.generate_address()
         self.start_value.generate_code()
-        AST.code.append(("stv", scope, offset))
-        AST.code.append(("lbl", control_label))
-        self.loop_counter.generate_code()
-        loop_counter_code = AST.code[-1]
-
         self.end_value.generate_code()
-        AST.code.append(("leq",))
-        AST.code.append(("jof", end_label))
-
-        control_instructions = []
 
         if self.step_value != None:
-            leng = len(AST.code)
             self.step_value.generate_code()
-            control_instructions = AST.code[leng:]
-            del AST.code[leng:]
         else:
-            control_instructions.append(("ldc", 1))
+            AST.code.append(("ldc", 1))
 
-        control_instructions.append(loop_counter_code)
-        control_instructions.append(("add",))
-        control_instructions.append(("stv", scope, offset))
-        return control_instructions
+        AST.code.append(("for", end_label, self.down))
+        AST.code.append(("lbl", control_label))
+        return [("nxt", control_label, self.down)]
 
 class Loop_Counter(AST):
     _fields = ['identifier']
 
+    def generate_address(self):
+        if self.identifier.loc:
+            AST.code.append(("ldv", self.identifier.scope, self.identifier.offset))
+        else:
+            AST.code.append(("ldr", self.identifier.scope, self.identifier.offset))
+
 # start_value
 # step_value
 # end_value
@@ -768,6 +827,31 @@ class Loop_Counter(AST):
 
 class Range_Enumeration(AST):
     _fields = ['loop_counter', 'discrete_mode']
+    down = False
+
+    # Same loop as Step_Enumeration, from the lower to the upper bound of
+    # the mode (or the other way around for down loops), by 1
+    def generate_code(self, control_label, end_label):
+        self.loop_counter.generate_address()
+
+        if self.discrete_mode.__class__ == Discrete_Range_Mode:
+            literal_range = self.discrete_mode.literal_range
+            bounds = [literal_range.lower_bound.expression, literal_range.upper_bound.expression]
+            if self.down:
+                bounds.reverse()
+            for bound in bounds:
+                bound.generate_code()
+        else:
+            bounds = [self.discrete_mode.lower_bound_value, self.discrete_mode.upper_bound_value]
+            if self.down:
+                bounds.reverse()
+            for bound in bounds:
+                AST.code.append(("ldc", bound))
+
+        AST.code.append(("ldc", 1))
+        AST.code.append(("for", end_label, self.down))
+        AST.code.append(("lbl", control_label))
+        return [("nxt", control_label, self.down)]
 
 class While_Control(AST):
     _fields = ['boolean_expression']
@@ -826,6 +910,9 @@ class Exit_Label_Id(AST):
     _fields = ['identifier']
 
     def generate_code(self):
+        cells = AST.loop_cells - AST.exit_cells[self.identifier.ID]
+        if cells > 0:
+            AST.code.append(("dlc", cells))
         AST.code.append(("jmp",self.end_label_dict[self.identifier.ID]))
 
 class Return_Action(AST):
@@ -841,8 +928,8 @@ class Return_Action(AST):
                 self.result.generate_code()
             AST.code.append(("stv", self.scope, self.offset))
 
-        if AST.scope_offset[self.scope] > 0:
-            AST.code.append(("dlc", AST.scope_offset[self.scope]))
+        if AST.scope_offset[self.scope] + AST.loop_cells > 0:
+            AST.code.append(("dlc", AST.scope_offset[self.scope] + AST.loop_cells))
         AST.code.append(("ret", self.scope, self.parameter_space))
 
 class Result_Action(AST):
@@ -867,9 +954,11 @@ class Builtin_Call(AST):
                 else:
                     param.expression.generate_code()
                     if param.expression.raw_type == 'char':
-                        AST.code.append(('prv', 1))
+                        AST.code.append(('prv', PRINT_CHAR))
+                    elif param.expression.raw_type == 'bool':
+                        AST.code.append(('prv', PRINT_BOOL))
                     else:
-                        AST.code.append(('prv', 0))
+                        AST.code.append(('prv', PRINT_INT))
 
         elif self.builtin_name.name == 'read':
             for param in self.parameter_list:
@@ -941,7 +1030,10 @@ class Procedure_Statement(AST):
     # Pass label_id object as parameter, since we must first write the "jmp" to
     # the end of the procedure, and only then write the "lbl"
     def generate_code(self):
+        outer = AST.line
+        AST.mark(self.lineno, AST.procedure)
         self.procedure_definition.generate_code(self.label_id)
+        AST.mark(outer, AST.procedure)
 
 class Procedure_Definition(AST):
     _fields = ['formal_procedure_head', 'statement_list']
@@ -953,6 +1045,8 @@ class Procedure_Definition(AST):
         AST.code.append(("jmp", end_label))
 
         label_id.generate_code()
+        outer = AST.procedure
+        AST.mark(AST.line, AST.label_dict[label_id.identifier.ID])
         self.formal_procedure_head.generate_code()
 
         for statement in self.statement_list:
@@ -962,6 +1056,7 @@ class Procedure_Definition(AST):
             AST.code.append(("dlc", AST.scope_offset[self.scope]))
 
         AST.code.append(("ret", self.scope, self.parameter_space))
+        AST.mark(AST.line, outer)
         AST.code.append(("lbl", end_label))
         AST.end_label_dict[label_id.identifier.ID] = end_label
 
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Batch runner: compile Lya programs once and run them on many inputs in
+# parallel.
+#
+# Every program is run once for every input file found for it, files named
+# <program name>.in or <program name>.<case>.in in its directory (or in
+# --inputs=dir), and once on empty input if there are none. When a file with the same name as the
+# input but ending in .out exists, the output of the run is compared with
+# it. The parser and the compiled programs are built before the worker
+# processes are forked, so the workers only run them, with the budget engine
+# (see lya_budget) so a job stops itself at its timeout. A job that is
+# still running GRACE seconds later gets its worker killed, which the pool
+# replaces, and a TIME verdict.
+
+import glob
+import io
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from multiprocessing.sharedctypes import RawArray
+
+from lya_vm import Output, Input
+import lya_budget
+import lya_object
+import lya_pyjit
+from peephole import Peephole
+from parser import Parser
+from semantic import *
+
+# Seconds a job may run
+TIMEOUT = 10
+
+# Seconds past its timeout before the worker of a job is killed, and
+# between two looks at the running jobs
+GRACE = 1.0
+POLL = 0.1
+
+# (file name, lvm code, heap, translation) of every program, filled in
+# before the workers are forked
+PROGRAMS = []
+
+# Process id of the worker of every job and time.monotonic() when it
+# started (0 before, -1 once it is done), shared with the workers
+WORKERS = None
+STARTED = None
+
+def get_option(name, default):
+    for arg in sys.argv[1:]:
+        if arg.startswith(name + '='):
+            return arg[len(name) + 1:]
+    return default
+
+def load_program(parser, file_name, optimize):
+    """
+    Compile file_name and return its lvm code and heap, or None if it
+    has errors. Object files (see lya_object) are only read.
+    """
+    if lya_object.is_object(file_name):
+        loaded = lya_object.load(file_name)
+        return loaded.program, loaded.heap
+
+    ast = parser.parse(open(file_name, "r").read())
+    if ast == None:
+        return None
+
+    nv = Visitor()
+    nv.visit(ast)
+    if nv.semantic_error:
+        return None
+
+    ast.generate_code()
+    code = AST.code
+    if optimize:
+        code = Peephole().optimize(code)
+    return code, nv.string_literals
+
+def find_jobs(index, file_name, inputs):
+    directory = inputs if inputs != None else os.path.dirname(file_name)
+    name = os.path.splitext(os.path.basename(file_name))[0]
+    jobs = []
+
+    pattern = os.path.join(directory, glob.escape(name))
+    for input_file in sorted(glob.glob(pattern + '.in') + glob.glob(pattern + '.*.in')):
+        expected = input_file[:-len('.in')] + '.out'
+        jobs.append((index, input_file, expected if os.path.exists(expected) else None))
+
+    if len(jobs) == 0:
+        jobs.append((index, None, None))
+    return jobs
+
+def run_job(number, job, limits):
+    index, input_file, expected = job
+    file_name, code, heap, translation = PROGRAMS[index]
+    WORKERS[number] = os.getpid()
+    STARTED[number] = time.monotonic()
+
+    stream = io.StringIO()
+    output = Output('end', stream = stream)
+    budget = lya_budget.Budget(**limits)
+    with open(input_file, 'rb') if input_file != None else io.BytesIO(b'') as data:
+        source = Input(data, output = output)
+        lya_budget.execute(code, heap, output = output, source = source, budget = budget, code = translation)
+
+    result = budget.record()
+    result['program'] = file_name
+    result['input'] = input_file
+    result['stdout'] = stream.getvalue()
+    result['passed'] = None
+    if expected != None:
+        result['passed'] = result['verdict'] == 'ok' and result['stdout'] == open(expected, "r").read()
+    STARTED[number] = -1
+    return result
+
+def killed(job, limits, seconds):
+    """
+    Return the result of a job whose worker was killed after seconds.
+    """
+    index, input_file, expected = job
+    budget = lya_budget.Budget(**limits)
+    budget.verdict = 'time'
+    budget.message = 'killed after ' + str(round(seconds, 3)) + ' seconds'
+    budget.seconds = seconds
+
+    result = budget.record()
+    result['program'] = PROGRAMS[index][0]
+    result['input'] = input_file
+    result['stdout'] = ''
+    result['passed'] = False if expected != None else None
+    return result
+
+def wait(number, job, pending, limits):
+    """
+    Return the result of job, killing its worker once it runs GRACE seconds
+    past its timeout.
+    """
+    while True:
+        try:
+            return pending.get(POLL)
+        except multiprocessing.TimeoutError:
+            pass
+        started = STARTED[number]
+        if started > 0 and time.monotonic() - started > limits['seconds'] + GRACE:
+            try:
+                os.kill(WORKERS[number], signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            return killed(job, limits, time.monotonic() - started)
+
+def status(result):
+    if result['verdict'] != 'ok':
+        return result['verdict'].upper()
+    if result['passed'] == None:
+        return 'RAN'
+    return 'PASS' if result['passed'] else 'FAIL'
+
+def main():
+    global WORKERS, STARTED
+    files = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+
+    if len(files) == 0:
+        print("Usage: python3 batch.py file.lya... <--inputs=dir> <--jobs=n> <--timeout=s> <--max-instructions=n> <--results=file> <--no-peephole>")
+        print("--inputs: directory of the <name>.in and <name>.<case>.in input files and their .out expected outputs, default the directory of each program")
+        print("--jobs: worker processes, default one per cpu")
+        print("--timeout: seconds a job may run, default " + str(TIMEOUT))
+        print("--max-instructions: instructions a job may run")
+        print("--results: write the result of every job to file, one json line each")
+        print("--no-peephole: do not optimize the generated lvm code")
+        return 1
+
+    inputs = get_option('--inputs', None)
+    workers = int(get_option('--jobs', os.cpu_count()))
+    limits = {'seconds': float(get_option('--timeout', TIMEOUT))}
+    if get_option('--max-instructions', None) != None:
+        limits['instructions'] = int(get_option('--max-instructions', None))
+    results_file = get_option('--results', None)
+    optimize = '--no-peephole' not in sys.argv
+
+    parser = Parser(frozen = True)
+    jobs = []
+    failed = 0
+
+    for file_name in files:
+        program = load_program(parser, file_name, optimize)
+        if program == None:
+            print("ERROR " + file_name)
+            failed += 1
+            continue
+        code, heap = program
+        jobs += find_jobs(len(PROGRAMS), file_name, inputs)
+        PROGRAMS.append((file_name, code, heap, lya_pyjit.translated(code, lya_budget.BudgetBlock)))
+
+    results = open(results_file, 'w') if results_file != None else None
+    counts = {}
+
+    WORKERS = RawArray('i', len(jobs))
+    STARTED = RawArray('d', len(jobs))
+
+    with multiprocessing.get_context('fork').Pool(workers) as pool:
+        pending = [pool.apply_async(run_job, (number, job, limits)) for number, job in enumerate(jobs)]
+        for number, job in enumerate(jobs):
+            result = wait(number, job, pending[number], limits)
+            verdict = status(result)
+            counts[verdict] = counts.get(verdict, 0) + 1
+            if verdict not in ('PASS', 'RAN'):
+                failed += 1
+
+            print("{:<12} {} {} {:.3f}s".format(verdict, result['program'], result['input'] or '-', result['seconds']))
+            if results != None:
+                results.write(json.dumps(result) + '\n')
+
+    if results != None:
+        results.close()
+
+    print(str(len(jobs)) + " jobs: " + ", ".join(str(n) + " " + verdict for verdict, n in sorted(counts.items())))
+    return 1 if failed > 0 else 0
+
+if __name__ == "__main__": exit(main())
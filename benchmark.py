@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Benchmarks of the front end.
+#
+#   python3 benchmark.py startup <runs> <file.lya>
+#   python3 benchmark.py comments
+#   python3 benchmark.py scanner
+#   python3 benchmark.py columns
+#
+# startup: every compile.py run starts a new interpreter and builds a
+# Parser, so this starts runs interpreters for every way of building it,
+# yacc (reflection over parser.py, tables from parsetab.py) and frozen
+# (tables from parsetab.marshal), and prints the best and median time of
+# importing parser.py and building the Parser, of building a second Parser
+# in the same process, and of the whole process. With a file, the process
+# also compiles it, without the compilation cache. The modules are compiled
+# to bytecode first, so no run pays for it.
+#
+# comments: tokenizes sources of growing size made of one large block
+# comment, of many small block and line comments between statements, and of
+# many multiline comments, with the lexer and with a lexer using the single
+# regular expression comment rule it had before, which scans to the last */
+# of the source at every comment. The old lexer is skipped at the sizes
+# after the first one that takes longer than OLD_LIMIT seconds.
+#
+# scanner: tokenizes sources of growing size, the samples repeated and
+# generated programs of short statements, with the ply lexer built from the
+# rules of lexer.Lexer and with the scanner scangen.py writes from them,
+# checks that both return the same tokens, and prints how many tokens a
+# second each one scans.
+#
+# columns: tokenizes the sources of the scanner benchmark into a list of
+# token objects and into a lya_tokens.TokenStream, checks that both have the
+# same tokens, and prints how many tokens a second each one scans and how
+# many bytes a token each one keeps.
+
+import compileall
+import glob
+import os
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter
+
+import ply.lex as lex
+
+import lexer
+import lya_tokens
+
+RUNS = 20
+
+# Sizes of the sources of the comments benchmark, in bytes
+SIZES = [16 * 1024, 64 * 1024, 256 * 1024, 1024 * 1024]
+
+OLD_LIMIT = 10.0
+
+# The comment rule replaced by lexer.Lexer.t_COMMENT
+OLD_COMMENT = r'((/\*(. | \n)*\*/)|//.*)'
+
+# Run by every process: build the parser, then another one, and print how
+# long each took
+BUILD = '''
+from time import perf_counter
+start = perf_counter()
+from parser import Parser
+parser = Parser({0})
+middle = perf_counter()
+Parser({0})
+print(middle - start, perf_counter() - middle)
+'''
+
+COMPILE = '''
+import sys
+from semantic import AST, Visitor
+from peephole import Peephole
+ast = parser.parse(open(sys.argv[1]).read())
+Visitor().visit(ast)
+ast.generate_code()
+Peephole().optimize(AST.code, AST.sites())
+'''
+
+MODES = {
+    'yacc': '',
+    'frozen': 'frozen = True',
+}
+
+def measure(mode, file_name):
+    """
+    Run a process that builds the parser in mode, and return how long it
+    took to build it, to build another one, and to run.
+    """
+    code = BUILD.format(MODES[mode])
+    args = []
+    if file_name != None:
+        code += COMPILE
+        args = [file_name]
+
+    start = perf_counter()
+    result = subprocess.run([sys.executable, '-c', code] + args, stdout = subprocess.PIPE, stderr = subprocess.DEVNULL, check = True)
+    total = perf_counter() - start
+    build, again = map(float, result.stdout.split())
+    return build, again, total
+
+def startup(args):
+    runs = int(args[0]) if len(args) > 0 else RUNS
+    file_name = args[1] if len(args) > 1 else None
+
+    # Let yacc bring parsetab.py up to date, and compile the modules it and
+    # freeze rewrote, so neither is timed
+    subprocess.run([sys.executable, 'parser.py'], check = True)
+    compileall.compile_dir(os.path.dirname(os.path.abspath(__file__)), quiet = 1)
+
+    # The modes take turns, so a slower stretch of the machine hits both
+    times = {mode: [] for mode in MODES}
+    for _ in range(runs):
+        for mode in MODES:
+            times[mode].append(measure(mode, file_name))
+
+    print('{:<8} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10}'.format('parser', 'best', 'median', 'best', 'median', 'best', 'median'))
+    print('{:<8} {:>21} {:>21} {:>21}'.format('', 'import, Parser() (ms)', 'again (ms)', 'process (ms)'))
+    for mode in MODES:
+        build, again, total = zip(*times[mode])
+        print('{:<8} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.1f} {:>10.1f}'.format(mode, 1000 * min(build), 1000 * statistics.median(build), 1000 * min(again), 1000 * statistics.median(again), 1000 * min(total), 1000 * statistics.median(total)))
+
+def large_comment(size):
+    return '/*' + 'dcl x int; x = x * 2; /* ** / *\n' * (size // 32) + '*/\ndcl y int;\n'
+
+def small_comments(size):
+    return 'x = x + 1; /* one */ y = x * 2; // two\n' * (size // 40)
+
+def multiline_comments(size):
+    return '/*\n * three\n */\nx = 1;\n' * (size // 24)
+
+SOURCES = {
+    'large': large_comment,
+    'small': small_comments,
+    'multiline': multiline_comments,
+}
+
+def old_lexer():
+    """
+    Return a ply lexer with the rules of lexer.Lexer, but the old comment
+    rule.
+    """
+    rules = {name: rule for name, rule in vars(lexer.Lexer).items() if name.startswith('t_') and name != 't_COMMENT'}
+    rules['t_ignore_COMMENNT'] = OLD_COMMENT
+    rules['tokens'] = lexer.Lexer.tokens
+    rules['reserved'] = lexer.Lexer.reserved
+    return lex.lex(type('OldLexer', (), rules)())
+
+def tokenize(scanner, source):
+    start = perf_counter()
+    scanner.input(source)
+    count = 0
+    while scanner.token() != None:
+        count += 1
+    return perf_counter() - start, count
+
+def comments(args):
+    new = lexer.Lexer()
+    old = old_lexer()
+
+    print('{:<10} {:>8} {:>8} {:>10} {:>10}'.format('comments', 'KB', 'tokens', 'new (s)', 'old (s)'))
+    for name, make in SOURCES.items():
+        slow = False
+        for size in SIZES:
+            source = make(size)
+            new_time, count = tokenize(new, source)
+            old_time = '-'
+            if not slow:
+                seconds, old_count = tokenize(old, source)
+                slow = seconds > OLD_LIMIT
+                old_time = '{:.3f}'.format(seconds)
+                if old_count != count:
+                    old_time += ' ({} tokens)'.format(old_count)
+            print('{:<10} {:>8} {:>8} {:>10.3f} {:>10}'.format(name, len(source) // 1024, count, new_time, old_time))
+
+def samples(size):
+    text = ''.join(open(name).read() + '\n' for name in sorted(glob.glob('samples/*.lya')))
+    return text * (size // len(text) + 1)
+
+def statements(size):
+    block = ('dcl a{0}, b{0} int = {0}, s{0} chars[8] = "s{0}";\n'
+             'b{0} += a{0} * ({0} - 1) / 2; s{0}[1] = \'x\';\n'
+             'if a{0} >= b{0} && a{0} != {0} then print(a{0}, s{0}[0:3]); fi;\n')
+    text = ''
+    i = 0
+    while len(text) < size:
+        text += block.format(i)
+        i += 1
+    return text
+
+SCANNER_SOURCES = {
+    'samples': samples,
+    'statements': statements,
+}
+
+def tokens(scanner, source):
+    scanner.input(source)
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in iter(scanner.token, None)]
+
+def scanner(args):
+    new = lexer.Lexer()
+    old = lexer.Lexer()
+    old.lexer = old.ply()
+
+    print('{:<10} {:>8} {:>8} {:>10} {:>10} {:>12} {:>12}'.format('source', 'KB', 'tokens', 'ply (s)', 'new (s)', 'ply tok/s', 'new tok/s'))
+    for name, make in SCANNER_SOURCES.items():
+        for size in SIZES:
+            source = make(size)
+            if tokens(new, source) != tokens(old, source):
+                print(name + ': the scanner and the ply lexer return different tokens')
+                return
+            old_time = min(tokenize(old, source)[0] for _ in range(3))
+            new_time, count = min(tokenize(new, source) for _ in range(3))
+            print('{:<10} {:>8} {:>8} {:>10.3f} {:>10.3f} {:>12.0f} {:>12.0f}'.format(name, len(source) // 1024, count, old_time, new_time, count / old_time, count / new_time))
+
+def columns(args):
+    scanner = lexer.Lexer()
+
+    print('{:<10} {:>8} {:>8} {:>10} {:>10} {:>12} {:>12} {:>8} {:>8}'.format('source', 'KB', 'tokens', 'list (s)', 'arrays (s)', 'list tok/s', 'arrays tok/s', 'list B', 'arrays B'))
+    for name, make in SCANNER_SOURCES.items():
+        for size in SIZES:
+            source = make(size)
+            stream = lya_tokens.tokenize(source, scanner)
+            if [(t.type, t.value, t.lineno, t.lexpos) for t in stream.tokens()] != tokens(scanner, source):
+                print(name + ': the token stream and the scanner have different tokens')
+                return
+            list_time = min(timed(lambda: list(iter(scanner.token, None)), scanner, source) for _ in range(3))
+            arrays_time = min(timed(lambda: lya_tokens.tokenize(source, scanner)) for _ in range(3))
+            list_bytes = kept(lambda: list(iter(scanner.token, None)), scanner, source)
+            arrays_bytes = kept(lambda: lya_tokens.tokenize(source, scanner))
+            count = len(stream)
+            print('{:<10} {:>8} {:>8} {:>10.3f} {:>10.3f} {:>12.0f} {:>12.0f} {:>8.1f} {:>8.1f}'.format(name, len(source) // 1024, count, list_time, arrays_time, count / list_time, count / arrays_time, list_bytes / count, arrays_bytes / count))
+
+def timed(function, scanner = None, source = None):
+    if scanner != None:
+        scanner.input(source)
+    start = perf_counter()
+    function()
+    return perf_counter() - start
+
+def kept(function, scanner = None, source = None):
+    """
+    Bytes allocated by function and still kept by its result.
+    """
+    if scanner != None:
+        scanner.input(source)
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+BENCHMARKS = {
+    'startup': startup,
+    'comments': comments,
+    'scanner': scanner,
+    'columns': columns,
+}
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print("Usage: python3 benchmark.py startup <runs> <file.lya>")
+        print("       python3 benchmark.py comments")
+        print("       python3 benchmark.py scanner")
+        print("       python3 benchmark.py columns")
+        return 1
+    BENCHMARKS[sys.argv[1]](sys.argv[2:])
+    return 0
+
+if __name__ == "__main__": exit(main())
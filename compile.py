@@ -1,55 +1,214 @@
 
-from lya_vm import VirtualMachine
-import lexer as lex
-from parser import Parser
-from semantic import *
+from lya_vm import VirtualMachine, MEMORY_SIZE, ListMemory, TypedMemory, Output, Input, VMError
+import lya_pyjit
+import lya_tracejit
+import lya_steptrace
+import lya_profile
+import lya_budget
+import lya_object
+import lya_cache
+import json
 import sys
 
-def main():
-    if len(sys.argv) < 2 or len(sys.argv) > 4:
-        print("Usage: python3 compile.py file.lya <-d> <-o>")
+ENGINES = {
+    'classic': VirtualMachine.execute,
+    'table': VirtualMachine.execute_table,
+    'threaded': VirtualMachine.execute_threaded,
+    'pyjit': lya_pyjit.execute,
+    'trace': lya_tracejit.execute,
+}
+
+MEMORY_MODELS = {
+    'list': ListMemory,
+    'typed': TypedMemory,
+}
+
+def get_option(name, default):
+    for arg in sys.argv[2:]:
+        if arg.startswith(name + '='):
+            return arg[len(name) + 1:]
+    return default
+
+def main(parser = None):
+    if len(sys.argv) < 2:
+        print("Usage: python3 compile.py file.lya <-d> <-o> <--engine=name> <--no-peephole> <--stack-size=n> <--memory=model> <--flush=policy> <--input=file> <--trace=file> <--trace-pc=a:b> <--trace-proc=label> <--profile[=file]> <--sample=file> <--sample-every=n> <--max-instructions=n> <--max-time=s> <--max-cells=n> <--max-output=n> <--accounting=file> <--object=file> <--cache=dir> <--no-cache>")
         print("-d: debug mode")
         print("-o: generate lvm code only")
+        print("--engine: execution engine (" + ", ".join(ENGINES) + "), default table")
+        print("--no-peephole: do not optimize the generated lvm code")
+        print("--stack-size: initial size of the lvm stack, in cells, default " + str(MEMORY_SIZE))
+        print("--memory: lvm memory (" + ", ".join(MEMORY_MODELS) + "), default list")
+        print("--flush: when printed text is written (size, line, end), default size")
+        print("--input: file read by the program instead of stdin")
+        print("--trace: run with the tracing engine, writing one json line per instruction to file")
+        print("--trace-pc: only trace the instructions at pc a to b - 1")
+        print("--trace-proc: only trace the instructions of the procedure at label")
+        print("--profile: run with the profiling engine and print instructions and time by procedure and line to stderr, or to file")
+        print("--sample: run with the profiling engine and write samples of the call stack to file, in the folded stack format")
+        print("--sample-every: instructions between two samples, default " + str(lya_profile.SAMPLE_EVERY))
+        print("--max-instructions, --max-time, --max-cells, --max-output: run with the budget engine, stopping the program past that many instructions, seconds, memory cells or printed characters")
+        print("--accounting: run with the budget engine and write the verdict and resource usage of the run to file, as json")
+        print("--object: also write the lvm code to file as an object file, which can be given instead of file.lya")
+        print("--cache: directory of the compilation cache, default " + lya_cache.default_directory())
+        print("--no-cache: compile file.lya again even if it is in the cache, and do not store it")
         return 1
 
     file_name = sys.argv[1]
 
     debug = '-d' in sys.argv
     code = '-o' in sys.argv
+    engine = get_option('--engine', 'table')
+    optimize = '--no-peephole' not in sys.argv
+    stack_size = int(get_option('--stack-size', MEMORY_SIZE))
+    memory = get_option('--memory', None)
+    flush = get_option('--flush', 'size')
+    input_file = get_option('--input', None)
+    trace_file = get_option('--trace', None)
+    trace_pcs = get_option('--trace-pc', None)
+    trace_procedure = get_option('--trace-proc', None)
+    profile_file = get_option('--profile', '-' if '--profile' in sys.argv else None)
+    sample_file = get_option('--sample', None)
+    sample_every = int(get_option('--sample-every', lya_profile.SAMPLE_EVERY))
+    limits = {
+        'instructions': get_option('--max-instructions', None),
+        'seconds': get_option('--max-time', None),
+        'cells': get_option('--max-cells', None),
+        'output': get_option('--max-output', None),
+    }
+    limits = {name: float(value) if name == 'seconds' else int(value) for name, value in limits.items() if value != None}
+    accounting_file = get_option('--accounting', None)
+    object_file = get_option('--object', None)
+    cache_directory = get_option('--cache', None)
+    # The AST is only printed by the compiler itself
+    use_cache = '--no-cache' not in sys.argv and not debug
+
+    if engine not in ENGINES:
+        print("Unknown engine '" + engine + "'")
+        return 1
+
+    if memory != None and memory not in MEMORY_MODELS:
+        print("Unknown memory '" + memory + "'")
+        return 1
 
-    # Read given file
-    file = open(file_name, "r")
+    if flush not in ('size', 'line', 'end'):
+        print("Unknown flush policy '" + flush + "'")
+        return 1
+
+    cache = None
+    if lya_object.is_object(file_name):
+        # Compiled already, see lya_object
+        try:
+            loaded = lya_object.load(file_name)
+        except ValueError as error:
+            print(error)
+            return 1
+    else:
+        # Read given file
+        file = open(file_name, "r")
+
+        s = file.read()
+
+        loaded = None
+        if use_cache:
+            cache = lya_cache.Cache(cache_directory)
+            key = cache.key(s, ['peephole' if optimize else 'no-peephole'])
+            loaded = cache.get(key)
 
-    s = file.read()
+    if loaded != None:
+        program = loaded.program
+        H = loaded.heap
+        sites = loaded.sites
+        names = loaded.names
+        if debug:
+            print("Printing LVM Code")
+    else:
+        # The front end is only loaded when there is something to compile
+        from peephole import Peephole
+        from parser import Parser
+        from semantic import AST, Visitor
 
-    result = Parser()
-    ast = result.parse(s)
+        result = parser if parser != None else Parser(frozen = True)
+        ast = result.parse(s)
 
-    nv = Visitor()
-    nv.visit(ast)
+        nv = Visitor()
+        nv.visit(ast)
 
-    if nv.semantic_error:
-        print("Error found. Terminating execution")
-        exit(1)
+        if nv.semantic_error:
+            print("Error found. Terminating execution")
+            exit(1)
 
-    ast.generate_code()
+        ast.generate_code()
 
-    if debug:
-        # Print undecorated AST
-        print("Printing Undecorated AST")
-        ast.print(False,'')
-        print("Printing Decorated AST")
-        ast.print(True,'')
-        print("Printing LVM Code")
+        if optimize:
+            peephole = Peephole()
+            size = len(AST.code)
+            AST.code = peephole.optimize(AST.code, AST.sites())
+
+        if debug:
+            # Print undecorated AST
+            print("Printing Undecorated AST")
+            ast.print(False,'')
+            print("Printing Decorated AST")
+            ast.print(True,'')
+            if optimize:
+                print("Peephole: " + str(size) + " -> " + str(len(AST.code)) + " instructions")
+                peephole.print_stats()
+            print("Printing LVM Code")
+
+        program = AST.code
+        H = nv.string_literals
+        sites = peephole.sites if optimize else AST.sites()
+        names = {label: name for name, label in AST.label_dict.items()}
+        if cache != None:
+            cache.put(key, program, H, sites, names)
 
     if code or debug:
         print('[')
-        for st in AST.code:
+        for st in program:
             print(st)
         print(']')
 
-    H = nv.string_literals
+    if object_file != None:
+        lya_object.write(object_file, program, H, sites, names)
+
     if not code:
-        VirtualMachine.execute(AST.code, H, False)
+        output = Output(flush)
+        options = {'stack_size': stack_size, 'output': output}
+        if input_file != None:
+            options['source'] = Input(open(input_file, 'rb'), output = output)
+        if memory != None:
+            options['model'] = MEMORY_MODELS[memory]
+        try:
+            if profile_file != None:
+                profile = lya_profile.Profile(program, sites, names)
+                peak = lya_profile.execute(program, H, profile = profile, **options)
+                profile.report(open(profile_file, 'w') if profile_file != '-' else sys.stderr)
+            elif limits or accounting_file != None:
+                budget = lya_budget.Budget(**limits)
+                peak = lya_budget.execute(program, H, budget = budget, **options)
+                if accounting_file != None:
+                    with open(accounting_file, 'w') as file:
+                        json.dump(budget.record(), file)
+                        file.write('\n')
+                if budget.verdict != 'ok':
+                    exit(1)
+            elif sample_file != None:
+                sampler = lya_profile.Sampler(program, sites, names, sample_every, open(sample_file, 'w'))
+                peak = lya_profile.execute(program, H, profile = sampler, **options)
+            elif trace_file != None:
+                pcs = lya_steptrace.parse_pcs(trace_pcs) if trace_pcs != None else None
+                procedure = int(trace_procedure) if trace_procedure != None else None
+                options['trace'] = lya_steptrace.StepTrace(program, open(trace_file, 'w'), pcs, procedure)
+                peak = lya_steptrace.execute(program, H, **options)
+            elif loaded != None and engine == 'table':
+                peak = VirtualMachine.execute_table(program, H, decoded = loaded.decoded(), **options)
+            else:
+                peak = ENGINES[engine](program, H, **options)
+        except VMError as error:
+            output.flush()
+            print(error)
+            exit(1)
+        if debug:
+            print("Peak stack depth: " + str(peak) + " cells")
 
 if __name__ == "__main__": main()
@@ -1,18 +1,91 @@
 
 import sys
+import hashlib
+import os
 import ply.lex as lex
 import re
 
+# Module of the lexer tables, written by freeze() next to this file
+LEXTAB = 'lextab'
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# Module of the scanner written by scangen.py, and the files it is written from
+SCANTAB = 'scantab'
+SCANNER_SOURCES = ('lexer.py', 'scangen.py')
+
+def scanner_signature():
+    """
+    Hash of the files the scanner is written from.
+    """
+    digest = hashlib.sha256()
+    for name in SCANNER_SOURCES:
+        with open(os.path.join(DIRECTORY, name), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
 class Lexer:
 
+    # The scanner (or ply lexer) of the first Lexer of the process. The
+    # others are clones.
+    master = None
+
     def __init__(self):
         self.build()
 
     def build(self):
-        self.lexer = lex.lex(self)
+        if Lexer.master == None:
+            Lexer.master = self.load()
+        self.lexer = Lexer.master.clone(self)
+        self.lexer.begin('INITIAL')
+
+    def signature(self):
+        """
+        Hash of the tokens and of the rules, in the order ply reads them.
+        """
+        rules = [' '.join(self.tokens)]
+        for name, rule in vars(Lexer).items():
+            if name.startswith('t_'):
+                rules.append(name + ' ' + (rule if isinstance(rule, str) else rule.__doc__ or ''))
+        return hashlib.sha256('\n'.join(rules).encode()).hexdigest()
+
+    def load(self):
+        """
+        Return the scanner in SCANTAB, if it was written from the current
+        rules, or else the ply lexer.
+        """
+        try:
+            scanner = __import__(SCANTAB)
+            current = getattr(scanner, 'SIGNATURE', None) == scanner_signature()
+        except ImportError:
+            current = False
+
+        if not current:
+            sys.stderr.write(os.path.join(DIRECTORY, SCANTAB + '.py') + " is missing or out of date, run python3 parser.py\n")
+            return self.ply()
+        return scanner.Scanner(self)
+
+    def ply(self):
+        """
+        Build the ply lexer from the tables in LEXTAB, in optimized mode,
+        which does not validate the rules again, if they were written for
+        the current rules. Otherwise build it from the rules.
+        """
+        try:
+            tables = __import__(LEXTAB)
+            current = getattr(tables, '_lexsignature', None) == self.signature()
+        except ImportError:
+            current = False
+
+        if not current:
+            sys.stderr.write(os.path.join(DIRECTORY, LEXTAB + '.py') + " is missing or out of date, run python3 parser.py\n")
+            return lex.lex(self)
+        return lex.lex(self, optimize = True, lextab = tables)
 
     def input(self, input):
+        self.lexer.lineno = 1
         self.lexer.input(input)
+        # yacc takes token after input, and then calls the scanner directly
+        self.token = self.lexer.token
 
     def token(self):
         return self.lexer.token() #guardar ultima token?
@@ -113,8 +186,12 @@ class Lexer:
     t_NOT = r'!'
     t_MOD = r'%'
 
-    # Comments
-    t_ignore_COMMENNT = r'((/\*(. | \n)*\*/)|//.*)'
+    # Comments. A block comment ends at the first */: the stars are matched
+    # in runs, and everything else one class at a time, so the match never
+    # backtracks.
+    def t_COMMENT(self, t):
+        r'/\*[^*]*\*+([^/*][^*]*\*+)*/|//.*'
+        t.lexer.lineno += t.value.count("\n")
 
     # Identifier
     def t_ID(self, t):
@@ -166,6 +243,29 @@ class Lexer:
             print("Illegal character '%s'" % t.value[0])
             t.lexer.skip(1)
 
+def freeze():
+    """
+    Write the lexer tables, with the signature of the rules they come from,
+    and the scanner.
+    """
+    lexer = Lexer.__new__(Lexer)
+    tables = lex.lex(lexer)
+    tables.writetab(LEXTAB, DIRECTORY)
+
+    file_name = os.path.join(DIRECTORY, LEXTAB + '.py')
+    with open(file_name, 'r') as file:
+        lines = file.readlines()
+    with open(file_name, 'w') as file:
+        for line in lines:
+            # ply writes the tokens in set order, which changes from run to run
+            if line.startswith('_lextokens'):
+                line = '_lextokens    = set(%r)\n' % (tuple(sorted(tables.lextokens)),)
+            file.write(line)
+        file.write('_lexsignature = %r\n' % lexer.signature())
+
+    import scangen
+    scangen.write()
+
 # Run lexer on given file
 def main():
     file_name = sys.argv[1]
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.10). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ABS', 'AND', 'ARRAY', 'ARROW', 'ASC', 'ASSIGN', 'BOOL', 'BY', 'CCONST', 'CHAR', 'CHARS', 'COLON', 'COMMA', 'DCL', 'DECREASE', 'DIFF', 'DIVCREASE', 'DIVIDE', 'DO', 'DOWN', 'ELSE', 'ELSIF', 'END', 'EQUAL', 'EXIT', 'FALSE', 'FI', 'FOR', 'GREATER', 'GREATEREQ', 'ICONST', 'ID', 'IF', 'IN', 'INCREASE', 'INT', 'LBRACKET', 'LENGTH', 'LESS', 'LESSEQ', 'LOC', 'LOWER', 'LPAREN', 'MINUS', 'MOD', 'MODCREASE', 'MULCREASE', 'NOT', 'NULL', 'NUM', 'OD', 'OR', 'PLUS', 'PRINT', 'PROC', 'RBRACKET', 'READ', 'REF', 'RESULT', 'RETURN', 'RETURNS', 'RPAREN', 'SCONST', 'SEMI', 'STRCAT', 'SYN', 'THEN', 'TIMES', 'TO', 'TRUE', 'TYPE', 'UPPER', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_COMMENT>/\\*[^*]*\\*+([^/*][^*]*\\*+)*/|//.*)|(?P<t_ID>[A-Za-z_][a-zA-Z0-9_]*)|(?P<t_ICONST>\\d+)|(?P<t_CCONST>\\\'(\\\\\\"|\\\\\\\'|[^\\\'\\"])\\\')|(?P<t_SCONST>\\"(\\\\\\"|\\\\\\\'|[^\\\'\\"\\n])*\\")|(?P<t_newline>\\n+)|(?P<t_error_STRING>\\".*)|(?P<t_DIVIDE>/(?!\\*))|(?P<t_OR>\\|\\|)|(?P<t_INCREASE>\\+=)|(?P<t_MULCREASE>\\*=)|(?P<t_AND>&&)|(?P<t_ARROW>->)|(?P<t_DECREASE>-=)|(?P<t_DIFF>!=)|(?P<t_DIVCREASE>/=)|(?P<t_EQUAL>==)|(?P<t_GREATEREQ>>=)|(?P<t_LBRACKET>\\[)|(?P<t_LESSEQ><=)|(?P<t_LPAREN>\\()|(?P<t_MODCREASE>%=)|(?P<t_PLUS>\\+)|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_ASSIGN>=)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_MINUS>-)|(?P<t_MOD>%)|(?P<t_NOT>!)|(?P<t_SEMI>;)|(?P<t_STRCAT>&)', [None, ('t_COMMENT', 'COMMENT'), None, ('t_ID', 'ID'), ('t_ICONST', 'ICONST'), ('t_CCONST', 'CCONST'), None, ('t_SCONST', 'SCONST'), None, ('t_newline', 'newline'), ('t_error_STRING', 'error_STRING'), (None, 'DIVIDE'), (None, 'OR'), (None, 'INCREASE'), (None, 'MULCREASE'), (None, 'AND'), (None, 'ARROW'), (None, 'DECREASE'), (None, 'DIFF'), (None, 'DIVCREASE'), (None, 'EQUAL'), (None, 'GREATEREQ'), (None, 'LBRACKET'), (None, 'LESSEQ'), (None, 'LPAREN'), (None, 'MODCREASE'), (None, 'PLUS'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'ASSIGN'), (None, 'COLON'), (None, 'COMMA'), (None, 'GREATER'), (None, 'LESS'), (None, 'MINUS'), (None, 'MOD'), (None, 'NOT'), (None, 'SEMI'), (None, 'STRCAT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_lexsignature = 'cebdba71591bc54a7ec870d444c9eb1bd646c5ed286ebfeabbda1a93e87041b0'
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Engine for untrusted programs.
+#
+# Runs the program translated by lya_pyjit under a Budget: limits on
+# instructions, wall time, memory cells and printed characters. Every basic
+# block adds its length to an instruction counter, and only backward jumps
+# and cfu compare it with the instruction limit, so a program cannot loop
+# or recurse past a check. Wall time is enforced by a SIGALRM timer instead,
+# as a single instruction, such as a mul of growing numbers or a read, can
+# take any time. Memory is checked whenever alc or cfu take the stack past
+# its peak, and output when it is written. The run ends with a verdict and an
+# accounting record, see Budget.record.
+
+import signal
+from time import perf_counter
+
+from lya_vm import MEMORY_SIZE, ListMemory, Output, Input, VMError, render
+from lya_pyjit import Block, load
+
+# Instructions that can start another iteration of a loop when they jump
+BACKWARD = ('jmp', 'jof', 'cjf', 'nxt')
+
+class LimitExceeded(Exception):
+
+    def __init__(self, limit, message):
+        Exception.__init__(self, message)
+        self.limit = limit
+
+class BudgetBlock(Block):
+
+    def __init__(self, start):
+        Block.__init__(self, start)
+        self.size = 0
+        self.emit('')
+
+    def translate(self, pc, name, a, b, c = None):
+        self.size += 1
+        self.lines[0] = 'usage[0] += {}'.format(self.size)
+        if name == 'cfu' or (name in BACKWARD and a <= pc):
+            self.emit('if usage[0] > horizon[0]:')
+            self.emit('    check()')
+        if name == 'cfu':
+            self.emit('usage[1] += 1')
+        Block.translate(self, pc, name, a, b, c)
+
+    def reserve(self, k):
+        Block.reserve(self, k)
+        self.emit('    touch(peak)')
+
+class Budget:
+
+    def __init__(self, instructions = None, seconds = None, cells = None, output = None):
+        """
+        Limits of a run. None means no limit. cells bounds the lvm memory
+        cells the frames of the program reach, up to its deepest alc or
+        cfu (the memory model holds more, as it is preallocated and grows
+        by doubling) and output the characters printed.
+        """
+        self.max_instructions = instructions
+        self.max_seconds = seconds
+        self.max_cells = cells
+        self.max_output = output
+
+        # Instructions and calls, and the instruction count of the next check
+        self.usage = [0, 0]
+        # SIGALRM handler replaced while the timer is set
+        self.armed = False
+        self.previous = None
+        self.horizon = [0]
+        self.cells = 0
+        self.written = 0
+        self.bytes_read = 0
+        self.started = 0.0
+        self.seconds = 0.0
+        self.peak = None
+
+        self.verdict = 'ok'
+        self.message = None
+
+    def start(self):
+        self.horizon[0] = self.max_instructions if self.max_instructions != None else float('inf')
+        self.started = perf_counter()
+        if self.max_seconds != None:
+            self.previous = signal.signal(signal.SIGALRM, self.alarm)
+            self.armed = True
+            # A zero interval would clear the timer instead
+            signal.setitimer(signal.ITIMER_REAL, max(self.max_seconds, 1e-6))
+
+    def disarm(self):
+        """
+        Clear the timer set by start, if it is set.
+        """
+        if self.armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.previous)
+            self.armed = False
+
+    def stop(self, source):
+        self.disarm()
+        self.seconds = perf_counter() - self.started
+        self.bytes_read = source.consumed
+
+    def alarm(self, signum, frame):
+        raise LimitExceeded('time', 'limit of ' + str(self.max_seconds) + ' seconds reached')
+
+    def check(self):
+        if self.max_instructions != None and self.usage[0] > self.max_instructions:
+            raise LimitExceeded('instructions', 'limit of ' + str(self.max_instructions) + ' instructions reached')
+
+    def touch(self, peak):
+        """
+        Charge the cells up to peak, the new deepest sp of alc or cfu.
+        """
+        if self.max_cells != None and peak + 1 > self.max_cells:
+            raise LimitExceeded('memory', 'limit of ' + str(self.max_cells) + ' memory cells reached')
+        self.cells = peak + 1
+
+    def write(self, write):
+        def run(text):
+            self.written += len(text)
+            if self.max_output != None and self.written > self.max_output:
+                self.written -= len(text)
+                raise LimitExceeded('output', 'limit of ' + str(self.max_output) + ' printed characters reached')
+            write(text)
+        return run
+
+    def record(self):
+        """
+        Return the verdict of the run ('ok', the limit it exceeded, or
+        'error') and what it used, as a dict.
+        """
+        return {
+            'verdict': self.verdict,
+            'message': self.message,
+            'instructions': self.usage[0],
+            'calls': self.usage[1],
+            'seconds': round(self.seconds, 6),
+            'memory_cells': self.cells,
+            'peak_stack': self.peak,
+            'bytes_read': self.bytes_read,
+            'chars_written': self.written,
+        }
+
+def execute(program, heap = [], stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None, budget = None, code = None):
+    """
+    Run program within budget and return the peak stack depth, or None if
+    it did not finish. Limits and runtime errors end the run instead of the
+    process: budget.verdict tells how it ended. code is
+    lya_pyjit.translated(program, BudgetBlock), if it is already known.
+    """
+    if output == None:
+        output = Output()
+    if source == None:
+        source = Input(output = output)
+    if budget == None:
+        budget = Budget()
+
+    names = {
+        'usage': budget.usage,
+        'horizon': budget.horizon,
+        'check': budget.check,
+        'touch': budget.touch,
+        'write': budget.write(output.write),
+    }
+    run = load(program, stack_size, model, output, source, BudgetBlock, names, code)
+
+    try:
+        try:
+            budget.start()
+            budget.peak = run(heap, render(heap))
+        finally:
+            # The alarm may only interrupt the program
+            budget.disarm()
+    except LimitExceeded as e:
+        budget.verdict = e.limit
+        budget.message = str(e)
+    except VMError as e:
+        budget.verdict = 'error'
+        budget.message = str(e)
+    except Exception as e:
+        budget.verdict = 'error'
+        budget.message = e.__class__.__name__ + ': ' + str(e)
+    finally:
+        budget.stop(source)
+        output.flush()
+
+    if budget.message != None:
+        output.write((budget.message if budget.verdict == 'error' else 'LimitExceeded: ' + budget.message) + '\n')
+        output.flush()
+
+    return budget.peak
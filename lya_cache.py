@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Compilation cache.
+#
+# compile.py keeps the lvm code of the programs it compiles in a directory,
+# as object files (see lya_object) named by a hash of the source text, the
+# options that change the code, and the source of the compiler itself, so a
+# change to any of them misses the cache instead of running stale code.
+# Running the same program again then skips the lexer, parser and semantic
+# analysis. Entries are touched when they are used, and the least recently
+# used ones are removed once the directory holds more than its size.
+
+import hashlib
+import os
+import tempfile
+
+import lya_object
+
+# Bytes the cache directory may hold
+CACHE_SIZE = 64 * 1024 * 1024
+
+# Files that decide the code generated for a program. scantab.py is written
+# by scangen.py, lextab.py by ply and parsetab.marshal by parser.freeze, and
+# the compiler runs without them while they are missing.
+COMPILER = ('lexer.py', 'lextab.py', 'scangen.py', 'scantab.py', 'lya_tokens.py', 'parser.py', 'parsetab.marshal', 'ast.py', 'semantic.py', 'peephole.py', 'lya_vm.py', 'lya_object.py')
+
+def default_directory():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'lya')
+
+def compiler_version():
+    """
+    Return a hash of the source of the compiler.
+    """
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in COMPILER:
+        try:
+            with open(os.path.join(directory, name), 'rb') as file:
+                digest.update(file.read())
+        except FileNotFoundError:
+            digest.update(b'\0missing ' + name.encode())
+    return digest.hexdigest()
+
+class Cache:
+
+    def __init__(self, directory = None, size = CACHE_SIZE):
+        """
+        Cache in directory (by default lya under the user cache directory)
+        holding up to size bytes of object files.
+        """
+        self.directory = directory if directory != None else default_directory()
+        self.size = size
+        self.version = compiler_version()
+
+    def key(self, source, options = ()):
+        """
+        Return the key of the program with text source compiled with
+        options, a sequence of strings.
+        """
+        digest = hashlib.sha256()
+        digest.update(self.version.encode())
+        for option in options:
+            digest.update(b'\0' + option.encode())
+        digest.update(b'\0\0' + source.encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.o')
+
+    def get(self, key):
+        """
+        Return the lya_object.ObjectFile stored for key, or None.
+        """
+        path = self.path(key)
+        try:
+            loaded = lya_object.load(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return loaded
+
+    def put(self, key, program, heap, sites = None, names = None):
+        """
+        Store the result of compiling a program under key, then evict the
+        least recently used entries past the size of the cache. A cache
+        that cannot be written, or a program that cannot be written as an
+        object file, is skipped.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok = True)
+            # Written aside and renamed, so other runs never read half an entry
+            fd, temporary = tempfile.mkstemp(dir = self.directory, suffix = '.tmp')
+            os.close(fd)
+            try:
+                lya_object.write(temporary, program, heap, sites, names)
+                os.replace(temporary, self.path(key))
+            except BaseException:
+                os.unlink(temporary)
+                raise
+            self.evict()
+        except (OSError, ValueError, OverflowError):
+            pass
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.o'):
+                try:
+                    info = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((info.st_mtime, info.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.size:
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# LVM object files.
+#
+# A compiled program, as written by compile.py --object and run again by
+# compile.py without the lexer, parser and semantic analysis:
+#
+#   header    magic, version, flags and the size of every section
+#   ops       one byte per instruction, its index in lya_vm.OPCODES
+#   shapes    one byte per instruction, the kind of each operand, 2 bits each
+#   operands  the operands that are present, packed, 8 bytes each
+#   labels    (label, pc) of every lbl, 8 bytes each
+#   heap      the length of every string literal, 8 bytes each, then their
+#             characters, 4 bytes each
+#   lines     with FLAG_LINES, the (line, procedure label) of every pc, as
+#             returned by ast.AST.sites, 8 bytes each, -1 for None
+#   names     with FLAG_NAMES, the number of procedures, their labels and
+#             the lengths of their names, 8 bytes each, then the characters
+#             of the names, 4 bytes each
+#   wide      with FLAG_WIDE, the number of int operands that do not fit in
+#             8 bytes (0 in operands), their indexes in operands and their
+#             lengths in bytes, 8 bytes each, then their bytes, signed
+#
+# Numbers are little endian and sections start at multiples of 8 bytes. The
+# loader maps the file and reads the sections through memoryviews. Version
+# 2 added the wide section, so version 1 files are still read.
+
+import mmap
+import struct
+import sys
+from array import array
+
+from lya_vm import OPCODES, OPCODE, JUMPS
+
+MAGIC = b'LVMO'
+VERSION = 2
+
+# Magic, version, flags, instructions, operands, labels, strings, characters
+HEADER = struct.Struct('<4sHHIIIII')
+
+# The object holds a line table, the names of the procedures, and wide
+# operands
+FLAG_LINES = 1
+FLAG_NAMES = 2
+FLAG_WIDE = 4
+
+# Kinds of operands, in the shape of an instruction
+ABSENT = 0
+INT = 1
+BOOL = 2
+NAME = 3
+
+# Array codes of 8 and 4 byte numbers
+LONG = 'q'
+CHAR = 'I'
+
+# Range of the operands packed in 8 bytes
+LONG_MIN = -2 ** 63
+LONG_MAX = 2 ** 63 - 1
+
+def aligned(offset):
+    return (offset + 7) & ~7
+
+def packed(code, values):
+    data = array(code, values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data.tobytes()
+
+def unpacked(buffer, offset, count, code):
+    """
+    Return the count numbers of type code at offset of buffer, as a list.
+    """
+    size = array(code).itemsize
+    with memoryview(buffer)[offset : offset + count * size] as view:
+        if sys.byteorder == 'little':
+            with view.cast(code) as numbers:
+                return numbers.tolist()
+        data = array(code, view.tobytes())
+        data.byteswap()
+        return data.tolist()
+
+def operand(value):
+    """
+    Return the kind of value and its packed number.
+    """
+    if isinstance(value, bool):
+        return BOOL, int(value)
+    if isinstance(value, int):
+        return INT, value
+    if isinstance(value, str) and value in OPCODE:
+        return NAME, OPCODE[value]
+    raise ValueError("cannot write operand " + repr(value))
+
+def write(file_name, program, heap = [], sites = None, names = None):
+    """
+    Write program, its heap (the string literals, as lists of character
+    codes) and optionally its sites and the names of its procedures (a
+    dict from label to name) to file_name.
+    """
+    ops = bytearray()
+    shapes = bytearray()
+    operands = []
+    labels = []
+    # (index in operands, value) of the wide operands
+    wide = []
+
+    for pc, t in enumerate(program):
+        if t[0] not in OPCODE or len(t) > 4:
+            raise ValueError("cannot write instruction " + repr(t))
+
+        shape = 0
+        for i, value in enumerate(t[1:]):
+            kind, number = operand(value)
+            if not LONG_MIN <= number <= LONG_MAX:
+                wide.append((len(operands), number))
+                number = 0
+            shape |= kind << (2 * i)
+            operands.append(number)
+
+        ops.append(OPCODE[t[0]])
+        shapes.append(shape)
+        if t[0] == 'lbl':
+            labels += [t[1], pc]
+
+    chars = [c for s in heap for c in s]
+    flags = (FLAG_LINES if sites != None else 0) | (FLAG_NAMES if names != None else 0) | (FLAG_WIDE if wide else 0)
+    header = HEADER.pack(MAGIC, VERSION, flags, len(program), len(operands), len(labels) // 2, len(heap), len(chars))
+
+    sections = [
+        header,
+        bytes(ops),
+        bytes(shapes),
+        packed(LONG, operands),
+        packed(LONG, labels),
+        packed(LONG, [len(s) for s in heap]),
+        packed(CHAR, chars),
+    ]
+    if sites != None:
+        sections.append(packed(LONG, [-1 if x == None else x for site in sites for x in site]))
+    if names != None:
+        sections.append(packed(LONG, [len(names)] + list(names) + [len(name) for name in names.values()]))
+        sections.append(packed(CHAR, [ord(c) for name in names.values() for c in name]))
+    if wide:
+        numbers = [number.to_bytes(number.bit_length() // 8 + 1, 'little', signed = True) for _, number in wide]
+        sections.append(packed(LONG, [len(wide)] + [index for index, _ in wide] + [len(number) for number in numbers]))
+        sections.append(b''.join(numbers))
+
+    with open(file_name, 'wb') as file:
+        for section in sections:
+            file.write(section)
+            file.write(bytes(aligned(len(section)) - len(section)))
+
+def is_object(file_name):
+    """
+    Return whether file_name starts like an object file.
+    """
+    with open(file_name, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+class ObjectFile:
+    """
+    A program read from an object file: program (the LVM tuples), heap,
+    labels (label: pc), sites (None without a line table) and names
+    (label: procedure name, empty without them).
+    """
+
+    def __init__(self, ops, shapes, operands, labels, heap, sites, names):
+        self.ops = ops
+        self.labels = labels
+        self.heap = heap
+        self.sites = sites
+        self.names = names
+        self.program = []
+
+        k = 0
+        for op, shape in zip(ops, shapes):
+            t = [OPCODES[op]]
+            while shape != 0:
+                kind = shape & 3
+                if kind == BOOL:
+                    t.append(operands[k] != 0)
+                elif kind == NAME:
+                    t.append(OPCODES[operands[k]])
+                else:
+                    t.append(operands[k])
+                shape >>= 2
+                k += 1
+            self.program.append(tuple(t))
+
+    def decoded(self):
+        """
+        Return the program as lya_vm.decode would, with the jumps resolved
+        through the label table instead of a pass over the program.
+        """
+        arg1 = []
+        arg2 = []
+        arg3 = []
+
+        for pc, t in enumerate(self.program):
+            a = t[1] if len(t) > 1 else None
+            if t[0] in JUMPS:
+                a = self.labels.get(a, pc)
+            arg1.append(a)
+            arg2.append(t[2] if len(t) > 2 else None)
+            arg3.append(t[3] if len(t) > 3 else None)
+
+        return list(self.ops), arg1, arg2, arg3
+
+def load(file_name):
+    """
+    Read the object file file_name. Raises ValueError if it is not one, or
+    if it is cut short.
+    """
+    with open(file_name, 'rb') as file, mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as data:
+        def need(offset, size):
+            # Every section must fit in the file
+            if size < 0 or offset + size > len(data):
+                raise ValueError(file_name + " is truncated")
+
+        if len(data) < HEADER.size:
+            raise ValueError(file_name + " is not an lvm object file")
+        magic, version, flags, n, n_operands, n_labels, n_strings, n_chars = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(file_name + " is not an lvm object file")
+        if not 1 <= version <= VERSION:
+            raise ValueError(file_name + " has object version " + str(version) + ", expected 1 to " + str(VERSION))
+
+        offset = aligned(HEADER.size)
+        need(offset, 2 * aligned(n) + 8 * n_operands + 16 * n_labels + 8 * n_strings + 4 * n_chars)
+        ops = data[offset : offset + n]
+        offset = aligned(offset + n)
+        shapes = data[offset : offset + n]
+        offset = aligned(offset + n)
+        operands = unpacked(data, offset, n_operands, LONG)
+        offset = aligned(offset + 8 * n_operands)
+        pairs = unpacked(data, offset, 2 * n_labels, LONG)
+        offset = aligned(offset + 16 * n_labels)
+        heap_lengths = unpacked(data, offset, n_strings, LONG)
+        offset = aligned(offset + 8 * n_strings)
+        heap_chars = unpacked(data, offset, n_chars, CHAR)
+        offset = aligned(offset + 4 * n_chars)
+
+        sites = None
+        if flags & FLAG_LINES:
+            need(offset, 16 * n)
+            numbers = [None if x == -1 else x for x in unpacked(data, offset, 2 * n, LONG)]
+            sites = list(zip(numbers[0::2], numbers[1::2]))
+            offset = aligned(offset + 16 * n)
+
+        names = {}
+        if flags & FLAG_NAMES:
+            need(offset, 8)
+            count = unpacked(data, offset, 1, LONG)[0]
+            need(offset + 8, 16 * count)
+            numbers = unpacked(data, offset + 8, 2 * count, LONG)
+            offset = aligned(offset + 8 + 16 * count)
+            lengths = numbers[count:]
+            need(offset, 4 * sum(lengths))
+            chars = unpacked(data, offset, sum(lengths), CHAR)
+            start = 0
+            for label, length in zip(numbers[:count], lengths):
+                names[label] = ''.join(map(chr, chars[start : start + length]))
+                start += length
+            offset = aligned(offset + 4 * sum(lengths))
+
+        if flags & FLAG_WIDE:
+            need(offset, 8)
+            count = unpacked(data, offset, 1, LONG)[0]
+            need(offset + 8, 16 * count)
+            numbers = unpacked(data, offset + 8, 2 * count, LONG)
+            offset = aligned(offset + 8 + 16 * count)
+            for index, length in zip(numbers[:count], numbers[count:]):
+                need(offset, length)
+                if not 0 <= index < n_operands:
+                    raise ValueError(file_name + " has a wide operand past its operands")
+                operands[index] = int.from_bytes(data[offset : offset + length], 'little', signed = True)
+                offset += length
+
+    labels = dict(zip(pairs[0::2], pairs[1::2]))
+    heap = []
+    start = 0
+    for length in heap_lengths:
+        heap.append(heap_chars[start : start + length])
+        start += length
+
+    return ObjectFile(ops, shapes, operands, labels, heap, sites, names)
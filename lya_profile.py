@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Profiling engine.
+#
+# Runs the program translated by lya_pyjit, with every basic block counting
+# how many times it is entered and every cfu and ret telling the Profile
+# which procedure is running. The instructions of a block run once per
+# entry, so the block counts give the count of every pc, which is then
+# summed by source line and procedure (see ast.AST.sites). Time is only
+# read at calls and returns.
+#
+# A Sampler instead has every block subtract its length from a countdown.
+# When it runs out, the Lya call stack is rebuilt from the frames on the
+# stack and counted, and the countdown starts again.
+
+import sys
+from time import perf_counter
+
+from lya_vm import MEMORY_SIZE, OPCODES, ListMemory, Output, Input, decode, render
+from lya_pyjit import Block, load, find_leaders
+
+# Instructions between two samples
+SAMPLE_EVERY = 10000
+
+class ProfileBlock(Block):
+
+    def __init__(self, start):
+        Block.__init__(self, start)
+        self.emit('counts[{}] += 1'.format(start))
+
+    def translate(self, pc, name, a, b, c = None):
+        if name == 'ret':
+            self.emit('leave()')
+        Block.translate(self, pc, name, a, b, c)
+        if name == 'cfu':
+            self.emit('enter({})'.format(a))
+
+class SampleBlock(Block):
+
+    def __init__(self, start):
+        Block.__init__(self, start)
+        self.size = 0
+        self.emit('')
+        self.emit('if ticks[0] <= 0:')
+        self.emit('    ticks[0] = sample({}, sp, memory, display)'.format(start))
+
+    def translate(self, pc, name, a, b, c = None):
+        self.size += 1
+        self.lines[0] = 'ticks[0] -= {}'.format(self.size)
+        Block.translate(self, pc, name, a, b, c)
+
+def procedure_name(names, label):
+    if label == None:
+        return '<main>'
+    return '{} (label {})'.format(names.get(label, '?'), label)
+
+class Profile:
+
+    def __init__(self, program, sites = None, names = {}):
+        """
+        Profile program, whose instructions come from sites, a list of
+        (line, procedure label) pairs as returned by ast.AST.sites. names
+        maps procedure labels to the names printed in the report.
+        """
+        self.program = program
+        self.sites = sites if sites != None else [(None, None)] * len(program)
+        self.names = names
+        self.counts = [0] * len(program)
+        # ncalls, tottime and cumtime of every procedure label
+        self.stats = {}
+        self.active = {}
+        self.frames = []
+
+    block_class = ProfileBlock
+
+    def globals(self):
+        return {
+            'counts': self.counts,
+            'enter': self.enter,
+            'leave': self.leave,
+        }
+
+    def enter(self, pc):
+        label = self.program[pc][1]
+        self.active[label] = self.active.get(label, 0) + 1
+        self.frames.append([label, perf_counter(), 0.0])
+
+    def leave(self):
+        label, start, children = self.frames.pop()
+        elapsed = perf_counter() - start
+        if self.frames:
+            self.frames[-1][2] += elapsed
+
+        if label not in self.stats:
+            self.stats[label] = [0, 0.0, 0.0]
+        stats = self.stats[label]
+        stats[0] += 1
+        stats[1] += elapsed - children
+
+        # Recursive calls only count once in cumtime
+        self.active[label] -= 1
+        if self.active[label] == 0:
+            stats[2] += elapsed
+
+    def start(self):
+        # The main program is procedure None
+        self.active[None] = 1
+        self.frames = [[None, perf_counter(), 0.0]]
+
+    def stop(self):
+        # Procedures still running when the program stops are closed too
+        while self.frames:
+            self.leave()
+
+    def instructions(self):
+        """
+        Return how many times every pc was executed.
+        """
+        ops, arg1, _, _ = decode(self.program)
+        names = [OPCODES[op] for op in ops]
+        leaders = find_leaders(names, arg1) + [len(names)]
+        counts = [0] * len(names)
+
+        for i in range(len(leaders) - 1):
+            n = self.counts[leaders[i]]
+            for pc in range(leaders[i], leaders[i + 1]):
+                counts[pc] = n
+
+        return counts
+
+    def report(self, stream = None):
+        stream = stream if stream != None else sys.stdout
+        counts = self.instructions()
+        total = sum(counts)
+
+        by_procedure = {}
+        by_line = {}
+        for pc, n in enumerate(counts):
+            line, procedure = self.sites[pc]
+            by_procedure[procedure] = by_procedure.get(procedure, 0) + n
+            by_line[line] = by_line.get(line, 0) + n
+
+        main = self.stats.get(None, [1, 0.0, 0.0])
+        stream.write('{} instructions in {:.3f} seconds\n\n'.format(total, main[2]))
+
+        stream.write('{:>9} {:>13} {:>9} {:>9}  {}\n'.format('ncalls', 'instructions', 'tottime', 'cumtime', 'procedure'))
+        labels = sorted(self.stats, key = lambda label: -self.stats[label][1])
+        for label in labels:
+            ncalls, tottime, cumtime = self.stats[label]
+            stream.write('{:>9} {:>13} {:>9.3f} {:>9.3f}  {}\n'.format(ncalls, by_procedure.get(label, 0), tottime, cumtime, procedure_name(self.names, label)))
+
+        stream.write('\n{:>9} {:>13} {:>9}\n'.format('line', 'instructions', 'percent'))
+        lines = sorted((line for line in by_line if by_line[line] > 0), key = lambda line: -by_line[line])
+        for line in lines:
+            stream.write('{:>9} {:>13} {:>9.1f}\n'.format(line if line != None else '-', by_line[line], 100.0 * by_line[line] / max(total, 1)))
+
+class Sampler:
+
+    def __init__(self, program, sites = None, names = {}, every = SAMPLE_EVERY, stream = None):
+        """
+        Sample the Lya call stack of program about every `every`
+        instructions, and write the samples to stream in the folded stack
+        format (one 'proc;proc;proc count' line per distinct stack, the
+        outermost procedure first) when the run stops. sites and names are
+        as for Profile.
+        """
+        self.program = program
+        self.sites = sites if sites != None else [(None, None)] * len(program)
+        self.names = names
+        self.every = every
+        self.stream = stream if stream != None else sys.stdout
+        self.ticks = [every]
+        self.samples = {}
+
+        # pc of the enf of every procedure, and the display level it sets
+        self.entries = {}
+        self.levels = {}
+        for pc, t in enumerate(program):
+            if t[0] == 'lbl':
+                for k in range(pc + 1, len(program)):
+                    if program[k][0] == 'enf':
+                        self.entries[t[1]] = k
+                        self.levels[t[1]] = program[k][1]
+                        break
+                    if program[k][0] != 'lbl':
+                        break
+
+    block_class = SampleBlock
+
+    def globals(self):
+        return {
+            'ticks': self.ticks,
+            'sample': self.sample,
+        }
+
+    def stack(self, pc, sp, memory, display):
+        """
+        Return the labels of the procedures running at pc, innermost first.
+        cfu leaves its pc below the frame built by enf, which saves the
+        display entry it replaces: following those undoes the calls as ret
+        would.
+        """
+        labels = []
+        display = list(display)
+
+        while True:
+            label = self.sites[pc][1]
+            labels.append(label)
+            if label == None or len(labels) > len(memory):
+                return labels
+
+            if pc <= self.entries[label]:
+                # Called, but its frame is not built yet
+                caller = memory[sp]
+            else:
+                level = self.levels[label]
+                base = display[level]
+                caller = memory[base - 2]
+                display[level] = memory[base - 1]
+            pc = caller
+
+    def sample(self, pc, sp, memory, display):
+        stack = tuple(self.stack(pc, sp, memory, display))
+        self.samples[stack] = self.samples.get(stack, 0) + 1
+        return self.every
+
+    def start(self):
+        self.ticks[0] = self.every
+
+    def stop(self):
+        folded = {}
+        for stack, n in self.samples.items():
+            names = [procedure_name(self.names, label) for label in reversed(stack)]
+            folded[';'.join(names)] = n
+        for stack in sorted(folded):
+            self.stream.write(stack + ' ' + str(folded[stack]) + '\n')
+        self.stream.flush()
+
+def execute(program, heap = [], stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None, profile = None):
+    """
+    Run program with profile, a Profile or a Sampler.
+    """
+    if output == None:
+        output = Output()
+    if source == None:
+        source = Input(output = output)
+    if profile == None:
+        profile = Profile(program)
+
+    run = load(program, stack_size, model, output, source, profile.block_class, profile.globals())
+
+    profile.start()
+    try:
+        return run(heap, render(heap))
+    finally:
+        profile.stop()
+        output.flush()
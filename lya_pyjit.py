@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Whole-program LVM to Python translator.
+#
+# The program is split into basic blocks, and every block becomes a branch of
+# a state machine inside one generated Python function. sp, memory and display
+# are locals of that function. Inside a block the stack pointer is tracked at
+# translation time, so instructions address the stack as memory[sp + k] and sp
+# itself is only updated when the block ends. Values pushed on the stack are
+# still written to memory, exactly as the interpreter does, but are also kept
+# in Python locals so the instructions that pop them do not read them back.
+
+from lya_vm import MEMORY_SIZE, DISPLAY_SIZE, OPCODES, JUMPS, PRINT_CHAR, PRINT_BOOL
+from lya_vm import ListMemory, Output, Input, VMError, decode, stack_margin, render, overflow
+
+# Instructions after which the next pc starts a new block
+BLOCK_ENDS = ('jmp', 'jof', 'cjf', 'for', 'nxt', 'cfu', 'ret', 'end', '???')
+
+BINARY = {
+    'add': '{} + {}',
+    'sub': '{} - {}',
+    'mul': '{} * {}',
+    'div': 'int({} / {})',
+    'mod': '{} % {}',
+    'and': '({} and {})',
+    'lor': '({} or {})',
+    'les': '{} < {}',
+    'leq': '{} <= {}',
+    'grt': '{} > {}',
+    'gre': '{} >= {}',
+    'equ': '{} == {}',
+    'neq': '{} != {}',
+}
+
+UNARY = {
+    'neg': '-{}',
+    'abs': 'abs({})',
+    'not': 'not {}',
+    'low': 'low({})',
+    'upp': 'upp({})',
+}
+
+def find_leaders(names, arg1):
+    leaders = {0}
+
+    for pc in range(len(names)):
+        if names[pc] in BLOCK_ENDS:
+            leaders.add(pc + 1)
+        if names[pc] in JUMPS:
+            leaders.add(arg1[pc] + 1)
+
+    return sorted(l for l in leaders if l < len(names))
+
+class Block:
+    """
+    Translates the instructions of one basic block. self.depth is the
+    distance between the real sp and the top of the stack at the current
+    instruction, and self.known maps a stack position (relative to sp) to
+    the Python expression that holds its value.
+    """
+
+    def __init__(self, start):
+        self.start = start
+        self.lines = []
+        self.depth = 0
+        self.known = {}
+
+    def emit(self, line):
+        self.lines.append(line)
+
+    def slot(self, k):
+        if k == 0:
+            return 'memory[sp]'
+        elif k > 0:
+            return 'memory[sp + ' + str(k) + ']'
+        return 'memory[sp - ' + str(-k) + ']'
+
+    def local(self, k):
+        if k >= 0:
+            return 'v' + str(k)
+        return 'w' + str(-k)
+
+    def variable(self, i, j):
+        if j < 0:
+            return 'display[{}] - {}'.format(i, -j)
+        return 'display[{}] + {}'.format(i, j)
+
+    def get(self, k):
+        if k in self.known:
+            return self.known[k]
+        name = self.local(k)
+        self.emit(name + ' = ' + self.slot(k))
+        self.known[k] = name
+        return name
+
+    def set(self, expression):
+        k = self.depth
+        if expression.lstrip('-').isdigit() or expression in ('True', 'False'):
+            value = expression
+        else:
+            value = self.local(k)
+            self.emit(value + ' = ' + expression)
+        self.emit(self.slot(k) + ' = ' + value)
+        self.known[k] = value
+
+    def push(self, expression):
+        self.depth += 1
+        self.set(expression)
+
+    def jumps(self, name, c):
+        """
+        Pop the operands of a conditional jump (jof or cjf, whose
+        comparison is c) and return the condition under which it jumps.
+        """
+        k = self.depth
+
+        if name == 'cjf':
+            left = self.get(k - 1)
+            right = self.get(k)
+            self.depth -= 2
+            return 'not ' + BINARY[c].format(left, right)
+
+        value = self.get(k)
+        self.depth -= 1
+        return 'not ' + value
+
+    def step(self, down):
+        """
+        Emit the counter update of nxt, and return the condition under
+        which it jumps back.
+        """
+        self.flush()
+        self.emit('adr = memory[sp - 2]')
+        if down:
+            self.emit('c = memory[adr] - memory[sp]')
+        else:
+            self.emit('c = memory[adr] + memory[sp]')
+        self.emit('memory[adr] = c')
+
+        if down:
+            return 'c >= memory[sp - 1]'
+        return 'c <= memory[sp - 1]'
+
+    def reserve(self, k):
+        """
+        Emit the stack high-water mark check of alc and cfu for the slot
+        at depth k, see VirtualMachine.execute.
+        """
+        if k == 0:
+            top = 'sp'
+        elif k > 0:
+            top = 'sp + ' + str(k)
+        else:
+            top = 'sp - ' + str(-k)
+        self.emit('if {} > peak:'.format(top))
+        self.emit('    peak = ' + top)
+        self.emit('    if peak + STACK_MARGIN >= len(memory):')
+        self.emit('        grow(memory, peak + STACK_MARGIN)')
+
+    def forget(self):
+        self.known = {}
+
+    def flush(self):
+        # Make sp real again, so the next instructions can be emitted
+        # exactly as the interpreter runs them.
+        if self.depth > 0:
+            self.emit('sp += ' + str(self.depth))
+        elif self.depth < 0:
+            self.emit('sp -= ' + str(-self.depth))
+        self.depth = 0
+        self.forget()
+
+    def translate(self, pc, name, a, b, c = None):
+        d = self.depth
+
+        if name == 'ldc':
+            self.push(repr(a))
+
+        elif name == 'ldv':
+            self.push('memory[' + self.variable(a, b) + ']')
+
+        elif name == 'ldr':
+            self.push(self.variable(a, b))
+
+        elif name == 'stv':
+            self.emit('memory[{}] = {}'.format(self.variable(a, b), self.get(d)))
+            self.depth -= 1
+
+        elif name == 'lrv':
+            self.push('memory[memory[' + self.variable(a, b) + ']]')
+
+        elif name == 'srv':
+            self.emit('memory[memory[{}]] = {}'.format(self.variable(a, b), self.get(d)))
+            self.depth -= 1
+            self.forget()
+
+        elif name in BINARY:
+            left = self.get(d - 1)
+            right = self.get(d)
+            self.depth -= 1
+            self.set(BINARY[name].format(left, right))
+
+        elif name in UNARY:
+            self.set(UNARY[name].format(self.get(d)))
+
+        elif name == 'idx':
+            left = self.get(d - 1)
+            right = self.get(d)
+            self.depth -= 1
+            self.set('{} + {} * {}'.format(left, right, a))
+
+        elif name == 'grc':
+            self.set('memory[{}]'.format(self.get(d)))
+
+        elif name == 'ldx':
+            left = self.get(d - 1)
+            right = self.get(d)
+            self.depth -= 1
+            self.set('memory[{} + {} * {}]'.format(left, right, a))
+
+        elif name == 'inv':
+            self.emit('memory[{}] += {}'.format(self.variable(a, b), c))
+
+        elif name == 'alc':
+            for k in range(d + 1, d + a + 1):
+                self.known.pop(k, None)
+            self.depth += a
+            self.reserve(self.depth)
+
+        elif name == 'dlc':
+            self.depth -= a
+
+        elif name == 'enf':
+            self.depth += 1
+            self.known.pop(self.depth, None)
+            self.emit('{} = display[{}]'.format(self.slot(self.depth), a))
+            self.emit('display[{}] = sp + {}'.format(a, self.depth + 1))
+
+        elif name == 'rdv':
+            self.push('read_int()')
+
+        elif name == 'rdc':
+            self.push('read_char()')
+
+        elif name == 'prv':
+            if a == PRINT_CHAR:
+                self.emit("write(chr({}))".format(self.get(d)))
+            elif a == PRINT_BOOL:
+                self.emit("write('True ' if {} else 'False ')".format(self.get(d)))
+            else:
+                self.emit("write(str({}) + ' ')".format(self.get(d)))
+            self.depth -= 1
+
+        elif name == 'prc':
+            self.emit('write(heap_text[{}])'.format(a))
+
+        elif name == 'stp':
+            self.emit('memory = allocate(max(STACK_SIZE, STACK_MARGIN))')
+            self.emit('display = [0] * DISPLAY_SIZE')
+            self.emit('sp = -1')
+            self.emit('peak = -1')
+            self.emit('display[0] = 0')
+            self.depth = 0
+            self.forget()
+
+        elif name in ('lbl', 'nop'):
+            pass
+
+        elif name == 'jmp':
+            self.flush()
+            self.emit('pc = {}'.format(a + 1))
+
+        elif name in ('jof', 'cjf'):
+            condition = self.jumps(name, b)
+            self.flush()
+            self.emit('if {}:'.format(condition))
+            self.emit('    pc = {}'.format(a + 1))
+            self.emit('else:')
+            self.emit('    pc = {}'.format(pc + 1))
+
+        elif name == 'for':
+            self.flush()
+            self.emit('adr = memory[sp - 3]')
+            self.emit('memory[adr] = memory[sp - 2]')
+            self.emit('memory[sp - 2] = memory[sp - 1]')
+            self.emit('memory[sp - 1] = memory[sp]')
+            self.emit('sp -= 1')
+            if b:
+                self.emit('if memory[adr] < memory[sp - 1]:')
+            else:
+                self.emit('if memory[adr] > memory[sp - 1]:')
+            self.emit('    pc = {}'.format(a + 1))
+            self.emit('else:')
+            self.emit('    pc = {}'.format(pc + 1))
+
+        elif name == 'nxt':
+            self.emit('if {}:'.format(self.step(b)))
+            self.emit('    pc = {}'.format(a + 1))
+            self.emit('else:')
+            self.emit('    pc = {}'.format(pc + 1))
+
+        elif name == 'cfu':
+            self.push(repr(pc))
+            self.flush()
+            self.reserve(0)
+            self.emit('pc = {}'.format(a + 1))
+
+        elif name == 'ret':
+            self.emit('display[{}] = {}'.format(a, self.get(d)))
+            self.emit('pc = {} + 1'.format(self.get(d - 1)))
+            self.depth -= b + 2
+            self.flush()
+
+        elif name == 'end':
+            self.flush()
+            self.emit('return peak + 1')
+
+        elif name == '???':
+            self.emit('raise VMError("UnknownCall: \'" + {} + "\' is not declared")'.format(repr(a)))
+
+        else:
+            # Memory block moves and string I/O are emitted as the
+            # interpreter runs them, on a real sp.
+            self.flush()
+            for line in SLOW_PATHS[name].format(a).split('\n'):
+                self.emit(line)
+
+SLOW_PATHS = {
+    'num': '''memory[sp] = num(memory, memory[sp])''',
+    'lmv': '''move(memory, sp, memory[sp], {0})
+sp += {0} - 1''',
+    'smv': '''move(memory, memory[sp - {0}], sp - {0} + 1, {0})
+sp -= {0} + 1''',
+    'smr': '''move(memory, memory[sp - 1], memory[sp], {0})
+sp -= 1''',
+    'sts': '''store(memory, memory[sp], heap[{0}])
+sp -= 1''',
+    'rds': '''store(memory, memory[sp], read_string())
+sp -= 1''',
+    'prt': '''write(str(list(memory[sp - {0} + 1 : sp + 1])))
+sp -= {0} - 1''',
+    'prs': '''write(text(memory, memory[sp]))
+sp -= 1''',
+}
+
+def dispatch(blocks, lo, hi, indent, out):
+    pad = '    ' * indent
+
+    if hi - lo == 1:
+        block = blocks[lo]
+        out.append(pad + '# block at pc ' + str(block.start))
+        for line in block.lines:
+            out.append(pad + line)
+        return
+
+    mid = (lo + hi) // 2
+    out.append(pad + 'if pc < ' + str(blocks[mid].start) + ':')
+    dispatch(blocks, lo, mid, indent + 1, out)
+    out.append(pad + 'else:')
+    dispatch(blocks, mid, hi, indent + 1, out)
+
+def translate(program, block_class = Block):
+    """
+    Return the Python source of a function run(heap, heap_text) equivalent
+    to running program on VirtualMachine.execute. It expects STACK_SIZE,
+    STACK_MARGIN (see lya_vm.stack_margin), the functions of a memory
+    model (see lya_vm.ListMemory), write and flush of an Output and the
+    read functions of an Input in its globals.
+    """
+    ops, arg1, arg2, arg3 = decode(program)
+    names = [OPCODES[op] for op in ops]
+
+    leaders = find_leaders(names, arg1)
+    blocks = []
+
+    for i, start in enumerate(leaders):
+        stop = leaders[i + 1] if i + 1 < len(leaders) else len(names)
+        block = block_class(start)
+
+        for pc in range(start, stop):
+            block.translate(pc, names[pc], arg1[pc], arg2[pc], arg3[pc])
+
+        if names[stop - 1] not in BLOCK_ENDS:
+            block.flush()
+            if stop < len(names):
+                block.emit('pc = ' + str(stop))
+            else:
+                block.emit('raise IndexError("list index out of range")')
+
+        blocks.append(block)
+
+    out = [
+        'def run(heap, heap_text):',
+        '    memory = []',
+        '    display = []',
+        '    sp = 0',
+        '    peak = -1',
+        '    pc = 0',
+        '    while True:'
+    ]
+    dispatch(blocks, 0, len(blocks), 2, out)
+
+    return '\n'.join(out) + '\n'
+
+def low(c):
+    if c >= 65 and c <= 90:
+        c += 32
+    return c
+
+def upp(c):
+    if c >= 97 and c <= 122:
+        c -= 32
+    return c
+
+def num(memory, t):
+    n = 0
+    for i in range(0, memory[t]):
+        n *= 10
+        n += memory[t + i + 1] - ord('0')
+    return n
+
+def translated(program, block_class = Block):
+    """
+    Return the translation of program, compiled to a Python code object.
+    """
+    return compile(translate(program, block_class), '<lya>', 'exec')
+
+def load(program, stack_size, model, output, source, block_class = Block, names = {}, code = None):
+    """
+    Translate program with block_class and return its run function. names
+    are added to its globals. code is translated(program, block_class),
+    if it is already known.
+    """
+    namespace = {
+        'STACK_SIZE': stack_size,
+        'STACK_MARGIN': stack_margin(program),
+        'DISPLAY_SIZE': DISPLAY_SIZE,
+        'low': low,
+        'upp': upp,
+        'num': num,
+        'allocate': model.allocate,
+        'grow': model.grow,
+        'move': model.move,
+        'store': model.store,
+        'text': model.text,
+        'read_int': source.read_int,
+        'read_char': source.read_char,
+        'read_string': source.read_string,
+        'write': output.write,
+        'flush': output.flush,
+        'VMError': VMError,
+    }
+    namespace.update(names)
+    if code == None:
+        code = translated(program, block_class)
+    exec(code, namespace)
+    translation = namespace['run']
+
+    def run(heap, heap_text):
+        try:
+            return translation(heap, heap_text)
+        except OverflowError as error:
+            raise overflow(error)
+
+    return run
+
+def execute(program, heap = [], stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None):
+    if output == None:
+        output = Output()
+    if source == None:
+        source = Input(output = output)
+
+    run = load(program, stack_size, model, output, source)
+    try:
+        return run(heap, render(heap))
+    finally:
+        output.flush()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Instruction tracing engine.
+#
+# Runs VirtualMachine.execute_table with every handler wrapped by a
+# StepTrace, which writes one JSON line per executed instruction:
+#
+#     {"pc": 12, "op": "stv", "sp": 3, "cells": [[5, 42]]}
+#
+# sp is the stack pointer after the instruction and cells holds the
+# [address, value] pairs it wrote. The cells are found from the operands
+# and the state before the instruction (see WRITES), so tracing a step does
+# not depend on the size of the memory. A "display" entry is added when
+# enf, ret or stp change the display. The other engines never see the
+# wrapper, so they keep no debug checks.
+
+import json
+import sys
+
+from lya_vm import VirtualMachine, MEMORY_SIZE, ListMemory, Output
+
+def pushed(a, b, sp, memory, display):
+    return range(sp + 1, sp + 2)
+
+def top(a, b, sp, memory, display):
+    return range(sp, sp + 1)
+
+def below(a, b, sp, memory, display):
+    return range(sp - 1, sp)
+
+def variable(a, b, sp, memory, display):
+    return range(display[a] + b, display[a] + b + 1)
+
+def reference(a, b, sp, memory, display):
+    adr = memory[display[a] + b]
+    return range(adr, adr + 1)
+
+# Cells written by an instruction, from its operands and the sp, memory and
+# display before it runs. Instructions that are not here write no cells.
+# sts and rds write a string, whose length is only known after they run.
+WRITES = {
+    'ldc': pushed, 'ldv': pushed, 'ldr': pushed, 'lrv': pushed,
+    'cfu': pushed, 'enf': pushed, 'rdv': pushed, 'rdc': pushed,
+    'stv': variable, 'inv': variable,
+    'srv': reference,
+    'add': below, 'sub': below, 'mul': below, 'div': below, 'mod': below,
+    'and': below, 'lor': below, 'les': below, 'leq': below, 'grt': below,
+    'gre': below, 'equ': below, 'neq': below, 'idx': below, 'ldx': below,
+    'neg': top, 'abs': top, 'num': top, 'low': top, 'upp': top, 'not': top,
+    'grc': top,
+    'lmv': lambda k, b, sp, memory, display: range(sp, sp + k),
+    'smv': lambda k, b, sp, memory, display: range(memory[sp - k], memory[sp - k] + k),
+    'smr': lambda k, b, sp, memory, display: range(memory[sp - 1], memory[sp - 1] + k),
+    'for': lambda a, b, sp, memory, display: [memory[sp - 3], sp - 2, sp - 1],
+    'nxt': lambda a, b, sp, memory, display: range(memory[sp - 2], memory[sp - 2] + 1),
+}
+
+STRINGS = ('sts', 'rds')
+
+# Instructions that change the display
+DISPLAY = ('enf', 'ret', 'stp')
+
+class StepTrace:
+
+    def __init__(self, program, stream, pcs = None, procedure = None):
+        """
+        Write the trace of program to stream. Only instructions whose pc is
+        in pcs (a range) are written, and, if procedure is given, only those
+        run by the procedure declared with that label, not by the
+        procedures it calls. The main program is procedure None.
+        """
+        self.program = program
+        self.stream = stream
+        self.pcs = pcs
+        self.procedure = procedure
+        self.calls = [None]
+
+    def wanted(self, pc):
+        if self.pcs != None and pc not in self.pcs:
+            return False
+        return self.procedure == None or self.calls[-1] == self.procedure
+
+    def watch(self, handler, state):
+        def run(a, b):
+            pc, sp, memory, display, _ = state()
+            op = self.program[pc][0]
+            wanted = self.wanted(pc)
+
+            if op == 'cfu':
+                self.calls.append(self.program[pc][1])
+            elif op == 'ret':
+                self.calls.pop()
+
+            if not wanted:
+                handler(a, b)
+                return
+
+            writes = WRITES.get(op)
+            cells = writes(a, b, sp, memory, display) if writes != None else ()
+            string = memory[sp] if op in STRINGS else None
+            frames = list(display) if op in DISPLAY else None
+            try:
+                handler(a, b)
+            finally:
+                self.write(pc, op, cells, string, frames, state)
+        return run
+
+    def write(self, pc, op, cells, string, frames, state):
+        _, sp, memory, display, _ = state()
+        if string != None:
+            cells = range(string, string + 1 + memory[string])
+
+        record = {'pc': pc, 'op': op, 'sp': sp}
+        written = [[i, memory[i]] for i in cells if 0 <= i < len(memory)]
+        if written:
+            record['cells'] = written
+        if frames != None and list(display) != frames:
+            record['display'] = list(display)
+        self.stream.write(json.dumps(record) + '\n')
+
+def parse_pcs(text):
+    """
+    Return the range given by 'a:b' (either bound may be left out), or by a
+    single pc.
+    """
+    if ':' not in text:
+        return range(int(text), int(text) + 1)
+    low, high = text.split(':')
+    return range(int(low) if low else 0, int(high) if high else sys.maxsize)
+
+def execute(program, heap = [], stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None, trace = None):
+    if output == None:
+        output = Output()
+    try:
+        return VirtualMachine.execute_table(program, heap, None, stack_size, model, output, source, trace)
+    finally:
+        if trace != None:
+            trace.stream.flush()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Columnar token streams.
+#
+# tokenize scans a whole source into a TokenStream, which keeps its tokens in
+# parallel arrays instead of a token object each:
+#
+#   kinds   the code of the type of every token, its index in types, which
+#           starts with lexer.Lexer.tokens, so the codes of the declared
+#           tokens are the same for every source
+#   starts  where every token starts in the source (its lexpos)
+#   lines   the line of every token (its lineno)
+#   values  the index of the value of every token in table, which holds
+#           every distinct value once
+#
+# Tools that only look at the tokens of many programs, such as similarity
+# checks and token statistics, read the arrays. Parser.parse also takes a
+# stream, through a reader that makes the tokens again one at a time. The
+# rules of the lexer print their errors while the source is tokenized, not
+# while it is parsed.
+
+from array import array
+from functools import partial
+
+from ply.lex import LexToken
+
+from lexer import Lexer
+
+class TokenStream:
+
+    def __init__(self, types):
+        """
+        Empty stream, with the codes of the token types in types. Other
+        types get codes after them as they are added.
+        """
+        self.types = list(types)
+        self.codes = {kind: code for code, kind in enumerate(self.types)}
+        self.kinds = array('H')
+        self.starts = array('I')
+        self.lines = array('I')
+        self.values = array('I')
+        self.table = []
+        # Index in table of every value, by the value for str and by its
+        # class and value (a tuple for lists) for the others
+        self.interned = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def intern(self, value):
+        """
+        Return the index of value in table, adding it if it is not there.
+        """
+        key = value
+        if value.__class__ is not str:
+            key = (value.__class__, tuple(value) if isinstance(value, list) else value)
+        try:
+            index = self.interned.get(key)
+        except TypeError:
+            # Not hashable, so not interned
+            index = None
+            key = None
+        if index == None:
+            index = len(self.table)
+            self.table.append(value)
+            if key != None:
+                self.interned[key] = index
+        return index
+
+    def add(self, t):
+        """
+        Add the token t after the others.
+        """
+        code = self.codes.get(t.type)
+        if code == None:
+            code = self.codes[t.type] = len(self.types)
+            self.types.append(t.type)
+        self.kinds.append(code)
+        self.starts.append(t.lexpos)
+        self.lines.append(t.lineno)
+        self.values.append(self.intern(t.value))
+
+    def tokens(self):
+        """
+        Yield the tokens as LexTokens, equal to the ones the lexer returns.
+        """
+        types = self.types
+        table = self.table
+        for kind, start, line, index in zip(self.kinds, self.starts, self.lines, self.values):
+            t = LexToken()
+            t.type = types[kind]
+            t.value = table[index]
+            if t.value.__class__ is list:
+                # Every token has its own list, as from the lexer
+                t.value = list(t.value)
+            t.lineno = line
+            t.lexpos = start
+            yield t
+
+    def reader(self):
+        return Reader(self)
+
+class Reader:
+
+    def __init__(self, stream):
+        """
+        The token method of a lexer, for yacc, reading the tokens of stream
+        and then None.
+        """
+        self.token = partial(next, stream.tokens(), None)
+
+def tokenize(source, lexer = None):
+    """
+    Return the TokenStream of source, scanned by lexer, a lexer.Lexer (by
+    default a new one).
+    """
+    if lexer == None:
+        lexer = Lexer()
+    lexer.input(source)
+
+    scanner = lexer.lexer
+    if hasattr(scanner, 'columns'):
+        stream = TokenStream(scanner.types)
+        scanner.columns(stream)
+        return stream
+
+    # The ply lexer, while the scanner is out of date
+    stream = TokenStream(lexer.tokens)
+    for t in iter(lexer.token, None):
+        stream.add(t)
+    return stream
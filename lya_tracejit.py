@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Tracing JIT for hot LVM loops.
+#
+# VirtualMachine.execute_table counts the backward jumps (jmp or nxt) that
+# close every do for/do while loop. When one of them gets hot, the instructions run by
+# the next iteration are recorded and compiled here into a Python function
+# that loops over that path. Every jof or cjf on the path becomes a guard: if the
+# condition goes the other way, the function returns the pc the interpreter
+# must continue at. Cold code never gets translated.
+
+from lya_vm import VirtualMachine, MEMORY_SIZE, OPCODES, ListMemory, Output, render
+from lya_pyjit import Block, low, upp, num
+
+# Iterations a loop runs in the interpreter before it is traced
+HOT_LOOP = 50
+
+# Longer iterations are not worth compiling
+MAX_TRACE_LENGTH = 1000
+
+# Instructions a trace cannot contain. Loops running them stay interpreted.
+UNTRACEABLE = ('alc', 'cfu', 'ret', 'stp', 'end', 'rdv', 'rdc', 'rds', 'for', '???', 'lop', 'trc')
+
+class TraceBlock(Block):
+
+    def side_exit(self, condition, pc):
+        self.emit('if ' + condition + ':')
+        if self.depth > 0:
+            self.emit('    sp += ' + str(self.depth))
+        elif self.depth < 0:
+            self.emit('    sp -= ' + str(-self.depth))
+        self.emit('    return ' + str(pc) + ', sp')
+
+class TraceCompiler:
+    threshold = HOT_LOOP
+    limit = MAX_TRACE_LENGTH
+
+    def __init__(self, heap, model = ListMemory, output = None):
+        self.heap = heap
+        self.model = model
+        self.output = output if output != None else Output()
+        self.heap_text = render(heap)
+
+    def translate(self, trace, ops, arg1, arg2, arg3):
+        """
+        Return the Python source of trace(memory, display, sp), or None if
+        the recorded path cannot be compiled.
+        """
+        block = TraceBlock(trace[0])
+
+        for i, pc in enumerate(trace):
+            name = OPCODES[ops[pc]]
+            a = arg1[pc]
+
+            if name in UNTRACEABLE:
+                return None
+
+            if name == 'jmp':
+                # The trace already follows the jump
+                continue
+
+            if name == 'nxt':
+                # Steps the loop, exits the trace when it is over
+                block.side_exit('not (' + block.step(arg2[pc]) + ')', pc + 1)
+                continue
+
+            if name in ('jof', 'cjf'):
+                condition = block.jumps(name, arg2[pc])
+
+                # The last instruction is followed by the head of the trace
+                after = trace[i + 1] if i + 1 < len(trace) else trace[0]
+                if a == pc:
+                    # Undeclared label, jof falls through either way
+                    continue
+                elif after == a + 1:
+                    block.side_exit('not (' + condition + ')', pc + 1)
+                else:
+                    block.side_exit(condition, a + 1)
+                continue
+
+            block.translate(pc, name, a, arg2[pc], arg3[pc])
+
+        block.flush()
+
+        out = [
+            'def trace(memory, display, sp):',
+            '    while True:'
+        ]
+        for line in block.lines:
+            out.append('        ' + line)
+
+        return '\n'.join(out) + '\n'
+
+    def compile(self, trace, ops, arg1, arg2, arg3):
+        if len(trace) == 0:
+            return None
+
+        source = self.translate(trace, ops, arg1, arg2, arg3)
+        if source == None:
+            return None
+
+        namespace = {
+            'heap': self.heap,
+            'heap_text': self.heap_text,
+            'low': low,
+            'upp': upp,
+            'num': num,
+            'move': self.model.move,
+            'store': self.model.store,
+            'text': self.model.text,
+            'write': self.output.write,
+        }
+        exec(compile(source, '<lya trace>', 'exec'), namespace)
+        return namespace['trace']
+
+def execute(program, heap = [], stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None):
+    if output == None:
+        output = Output()
+    tracer = TraceCompiler(heap, model, output)
+    return VirtualMachine.execute_table(program, heap, tracer, stack_size, model, output, source)
@@ -1,340 +1,1794 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import operator
+import sys
+from array import array
+
 MEMORY_SIZE = 64
 DISPLAY_SIZE = 8
 
+# Characters buffered by Output before it writes them, with the size policy
+OUTPUT_SIZE = 8192
+
+# Bytes Input asks for at a time
+INPUT_CHUNK = 65536
+
+# Memory cells are signed 64 bit integers
+CELL = 'q'
+
+# Operand of prv: how the value is printed
+PRINT_INT = 0
+PRINT_CHAR = 1
+PRINT_BOOL = 2
+
+# Instruction set, in opcode order. The decoded instruction stream refers to
+# instructions by their index in this list.
+OPCODES = [
+    'ldc', 'ldv', 'ldr', 'stv', 'lrv', 'srv',
+    'add', 'sub', 'mul', 'div', 'mod', 'neg', 'abs', 'num', 'low', 'upp',
+    'and', 'lor', 'not', 'les', 'leq', 'grt', 'gre', 'equ', 'neq',
+    'jmp', 'jof', 'alc', 'dlc', 'cfu', 'enf', 'ret',
+    'idx', 'grc', 'lmv', 'smv', 'smr', 'sts',
+    'rdv', 'rdc', 'rds', 'prv', 'prt', 'prc', 'prs',
+    'stp', 'lbl', 'nop', 'end',
+    # Superinstructions, see peephole.FUSION_RULES
+    'inv', 'cjf', 'ldx',
+    # Counted loops, see ast.Step_Enumeration
+    'for', 'nxt',
+    # Anything the decoder does not recognize. Reported when executed.
+    '???',
+    # Produced by the tracing engine: a counted backward jump, and a jump
+    # into a compiled trace.
+    'lop', 'trc'
+]
+OPCODE = {name: code for code, name in enumerate(OPCODES)}
+
+# Instructions whose first operand is a label
+JUMPS = ('jmp', 'jof', 'cfu', 'cjf', 'for', 'nxt')
+
+# Comparisons fused into cjf
+COMPARE = {
+    'les': operator.lt,
+    'leq': operator.le,
+    'grt': operator.gt,
+    'gre': operator.ge,
+    'equ': operator.eq,
+    'neq': operator.ne,
+}
+
+# Instructions that push one cell. lmv k pushes k - 1 cells but writes k.
+PUSHES = ('ldc', 'ldv', 'ldr', 'lrv', 'cfu', 'enf', 'rdv', 'rdc')
+
+class Halt(Exception):
+    pass
+
+class VMError(Exception):
+    """
+    Error of a running program. Its text is the message printed for it,
+    such as "ValueError: expected an 'int', found 'string'".
+    """
+    pass
+
+def overflow(error):
+    """
+    Return the VMError of an OverflowError of a running program, such as a
+    value past the 64 bit cells of TypedMemory.
+    """
+    return VMError("OverflowError: " + str(error))
+
+# Change of sp made by every instruction that neither checks the stack (alc,
+# cfu, stp) nor leaves the code that follows it (ret, end). The ones with an
+# operand k are functions of it.
+STACK_EFFECT = {
+    'ldc': 1, 'ldv': 1, 'ldr': 1, 'lrv': 1, 'enf': 1, 'rdv': 1, 'rdc': 1,
+    'stv': -1, 'srv': -1, 'idx': -1, 'ldx': -1, 'smr': -1, 'sts': -1,
+    'rds': -1, 'prv': -1, 'prs': -1, 'jof': -1, 'for': -1, 'cjf': -2,
+    'add': -1, 'sub': -1, 'mul': -1, 'div': -1, 'mod': -1, 'and': -1,
+    'lor': -1, 'les': -1, 'leq': -1, 'grt': -1, 'gre': -1, 'equ': -1,
+    'neq': -1,
+    'neg': 0, 'abs': 0, 'num': 0, 'low': 0, 'upp': 0, 'not': 0, 'grc': 0,
+    'inv': 0, 'prc': 0, 'jmp': 0, 'nxt': 0, 'lbl': 0, 'nop': 0,
+    'dlc': lambda k: -k,
+    'lmv': lambda k: k - 1,
+    'smv': lambda k: -(k + 1),
+    'prt': lambda k: -(k - 1),
+}
+
+def stack_margin(program):
+    """
+    Upper bound on how many cells sp can get past the depth checked by the
+    last alc or cfu: the deepest stack any path of the program reaches
+    after one of them, which for generated code is the deepest expression
+    of a statement above the cells of the for loops around it. Code whose
+    stack grows around a loop, or with an unknown instruction, gets every
+    push of the program instead.
+    """
+    labels = find_labels(program)
+    pushes = 0
+    for t in program:
+        if t[0] in PUSHES:
+            pushes += 1
+        elif t[0] == 'lmv':
+            pushes += t[1]
+
+    # Deepest sp past the last check on the way to every pc
+    depth = {0: 0}
+    pending = [0]
+    margin = 0
+
+    while pending:
+        pc = pending.pop()
+        if pc >= len(program):
+            continue
+        t = program[pc]
+        d = depth[pc]
+        name = t[0]
+
+        if name in ('alc', 'cfu', 'stp'):
+            # After a check sp is at most the peak it grew memory for; past
+            # a call it is below the return address
+            d = 0
+        elif name in ('ret', 'end'):
+            continue
+        elif name in STACK_EFFECT:
+            effect = STACK_EFFECT[name]
+            d += effect(t[1]) if callable(effect) else effect
+        else:
+            return pushes
+
+        if d > pushes:
+            return pushes
+        margin = max(margin, d)
+
+        following = [pc + 1]
+        if name in JUMPS:
+            target = labels.get(t[1], pc)
+            if name == 'jmp':
+                following = [target]
+            else:
+                following.append(target)
+        for after in following:
+            if after not in depth or depth[after] < d:
+                depth[after] = d
+                pending.append(after)
+
+    return margin
+
+def doubled(size, top):
+    """
+    Return size, doubled until it is past top.
+    """
+    size = max(size, 1)
+
+    while size <= top:
+        size *= 2
+
+    return size
+
+class ListMemory:
+    """
+    VM memory as a list of Python ints. Fastest to index, but every cell
+    holds a pointer to an int object. Engines only touch memory through
+    indexing, slicing and these functions, so TypedMemory can replace it.
+    """
+
+    def allocate(size):
+        """
+        Return a memory of size cells, all 0.
+        """
+        return [0] * size
+
+    def grow(memory, top):
+        """
+        Extend memory in place, doubling its size, until memory[top] exists.
+        """
+        memory.extend([0] * (doubled(len(memory), top) - len(memory)))
+
+    def move(memory, dst, src, k):
+        """
+        Copy the k cells at src to dst. Both ranges may overlap.
+        """
+        memory[dst : dst + k] = memory[src : src + k]
+
+    def store(memory, adr, chars):
+        """
+        Store a string at adr: its length, then its character codes.
+        """
+        memory[adr] = len(chars)
+        memory[adr + 1 : adr + 1 + len(chars)] = chars
+
+    def text(memory, adr):
+        """
+        Return the string stored at adr, see store.
+        """
+        return ''.join(map(chr, memory[adr + 1 : adr + 1 + memory[adr]]))
+
+class TypedMemory(ListMemory):
+    """
+    VM memory as an array of 64 bit cells: 8 bytes per cell, and bulk
+    moves are done by memoryview copies, without temporary lists. Reading a
+    cell creates an int object, so it is slower to index than ListMemory.
+    """
+
+    def allocate(size):
+        return array(CELL, [0]) * size
+
+    def grow(memory, top):
+        memory.extend(TypedMemory.allocate(doubled(len(memory), top) - len(memory)))
+
+    def move(memory, dst, src, k):
+        with memoryview(memory) as view:
+            view[dst : dst + k] = view[src : src + k]
+
+    def store(memory, adr, chars):
+        memory[adr] = len(chars)
+        memory[adr + 1 : adr + 1 + len(chars)] = array(CELL, chars)
+
+class Output:
+    """
+    Write buffer for the print instructions. Text is written to stream
+    according to flush:
+      'size': once size characters are buffered
+      'line': after every write that contains a newline
+      'end': only when the engines flush it, at the end of the program
+    The engines also flush it before waiting for input and when they
+    stop, also on a VMError, so prompts and errors show up in order.
+    """
+
+    def __init__(self, flush = 'size', size = OUTPUT_SIZE, stream = None):
+        self.stream = stream if stream != None else sys.stdout
+        self.size = size
+        self.parts = []
+        self.length = 0
+
+        self.write = {
+            'size': self.write_size,
+            'line': self.write_line,
+            'end': self.parts.append,
+        }[flush]
+
+    def write_size(self, text):
+        self.parts.append(text)
+        self.length += len(text)
+        if self.length >= self.size:
+            self.flush()
+
+    def write_line(self, text):
+        self.parts.append(text)
+        if '\n' in text:
+            self.flush()
+
+    def flush(self):
+        if len(self.parts) > 0:
+            self.stream.write(''.join(self.parts))
+            self.parts.clear()
+            self.length = 0
+        self.stream.flush()
+
+class Input:
+    """
+    Reader for the read instructions. stream (stdin by default, or any
+    binary file) is read in chunks of up to chunk bytes and split into
+    whitespace separated tokens, as input().split() did line by line. A
+    chunk is a single read1, so on a terminal it is one line. output, if
+    given, is flushed before every read, so prompts show up first. A read
+    past the end of stream raises a VMError.
+    """
+
+    def __init__(self, stream = None, chunk = INPUT_CHUNK, output = None):
+        if stream == None:
+            stream = sys.stdin.buffer if hasattr(sys.stdin, 'buffer') else sys.stdin
+        self.read = getattr(stream, 'read1', stream.read)
+        self.chunk = chunk
+        self.output = output
+        self.tokens = []
+        self.index = 0
+        # Start of a token cut by the end of the last chunk
+        self.rest = b''
+        # Bytes read from stream so far
+        self.consumed = 0
+
+    def fill(self):
+        while self.index == len(self.tokens):
+            if self.output != None:
+                self.output.flush()
+
+            data = self.read(self.chunk)
+            if isinstance(data, str):
+                data = data.encode()
+            self.consumed += len(data)
+
+            if len(data) == 0:
+                if len(self.rest) == 0:
+                    raise VMError("EOFError: EOF when reading a line")
+                self.tokens = [self.rest]
+                self.rest = b''
+            else:
+                data = self.rest + data
+                self.tokens = data.split()
+                self.rest = b''
+                if not data[-1:].isspace() and len(self.tokens) > 0:
+                    self.rest = self.tokens.pop()
+            self.index = 0
+
+    def token(self):
+        """
+        Return the next token, as bytes.
+        """
+        if self.index == len(self.tokens):
+            self.fill()
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def error(self, message):
+        raise VMError("ValueError: " + message)
+
+    def read_int(self):
+        token = self.token()
+        try:
+            return int(token)
+        except ValueError:
+            self.error("expected an 'int', found 'string'")
+
+    def read_char(self):
+        token = self.token().decode()
+        if len(token) > 1:
+            self.error("expected a 'char', found a 'string'")
+        return ord(token)
+
+    def read_string(self):
+        """
+        Return the character codes of the next token.
+        """
+        return [ord(c) for c in self.token().decode()]
+
+def render(heap):
+    """
+    Return the string literals of heap as str, for prc.
+    """
+    return [''.join(map(chr, s)) for s in heap]
+
+def show(kind, value):
+    """
+    Return value as printed by prv kind.
+    """
+    if kind == PRINT_CHAR:
+        return chr(value)
+    elif kind == PRINT_BOOL:
+        return 'True ' if value else 'False '
+    return str(value) + ' '
+
+def find_labels(program):
+    labels = {}
+
+    for pc in range(len(program)):
+        t = program[pc]
+
+        if t[0] == 'lbl':
+            i = t[1]
+
+            if i in labels:
+                raise VMError("LabelError: label " + str(i) + " declared at " + str(labels[i]) + " and " + str(pc))
+
+            labels[i] = pc
+
+    return labels
+
+def decode(program):
+    """
+    Translate a list of LVM tuples into four parallel lists: integer
+    opcodes, first, second and third operands. Labels of the instructions
+    in JUMPS are replaced by the absolute pc they refer to. A jump to an
+    undeclared label stays where it is, as in VirtualMachine.execute.
+    """
+    labels = find_labels(program)
+    ops = []
+    arg1 = []
+    arg2 = []
+    arg3 = []
+
+    for pc in range(len(program)):
+        t = program[pc]
+        name = t[0]
+        a = t[1] if len(t) > 1 else None
+        b = t[2] if len(t) > 2 else None
+        c = t[3] if len(t) > 3 else None
+
+        if name in JUMPS:
+            a = labels.get(a, pc)
+        elif name not in OPCODE:
+            name, a = '???', name
+
+        ops.append(OPCODE[name])
+        arg1.append(a)
+        arg2.append(b)
+        arg3.append(c)
+
+    return ops, arg1, arg2, arg3
+
 class VirtualMachine:
-    def execute(program, heap = [], debug = False):
-        labels = {}
+    """
+    A program loaded into the table engine, run a number of instructions
+    at a time:
+
+        vm = VirtualMachine(program, heap, Output(stream = out), Input(stream = inp))
+        while not vm.run(1000):
+            ...
+
+    Errors of the program, including reads past the end of its input,
+    raise VMError. restart runs the same program again without decoding it
+    again. The engines (execute, execute_table, execute_threaded) are plain
+    functions called on the class.
+    """
+
+    def __init__(self, program, heap = [], output = None, source = None, stack_size = MEMORY_SIZE, model = ListMemory):
+        self.program = program
+        self.heap = heap
+        self.stack_size = stack_size
+        self.model = model
+        self.decoded = decode(program)
+        self.restart(output, source)
+
+    def restart(self, output = None, source = None):
+        """
+        Start the program over, printing to output and reading from source
+        (by default stdout and stdin).
+        """
+        self.output = output if output != None else Output()
+        self.source = source if source != None else Input(output = self.output)
+        self.machine, self.state = VirtualMachine.load(self.program, self.heap, None, self.stack_size, self.model, self.output, self.source, None, self.decoded)
+        self.halted = False
+
+    def run(self, max_steps = None):
+        """
+        Run up to max_steps instructions, or up to the end of the program if
+        max_steps is None, and return whether the program has ended. Output
+        is flushed before returning.
+        """
+        try:
+            self.halted = self.machine(max_steps)
+        finally:
+            self.output.flush()
+        return self.halted
+
+    def step(self):
+        return self.run(1)
+
+    @property
+    def pc(self):
+        return self.state()[0]
+
+    @property
+    def sp(self):
+        return self.state()[1]
+
+    @property
+    def memory(self):
+        return self.state()[2]
+
+    @property
+    def display(self):
+        return self.state()[3]
+
+    @property
+    def peak(self):
+        """
+        Peak stack depth so far, in cells.
+        """
+        return self.state()[4] + 1
+
+    def execute(program, heap = [], stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None):
+        """
+        Run program and return the peak stack depth, in cells, as seen by
+        alc and cfu.
+
+        memory is allocated by model (ListMemory or TypedMemory). It starts
+        with stack_size cells (or the deepest stack of program, see
+        stack_margin) and is only extended, doubling its size, when alc or
+        cfu take sp past its highest value so far. Popped frames are reused
+        by the next calls.
+
+        Printed text goes through output (an Output, by default one that
+        flushes by size to stdout), which is flushed when the run stops.
+        read takes its values from source (an Input, by default on stdin).
+        """
         memory = []
         display = []
-        buf = []
         sp = 0
         pc = 0
 
-        for pc in range(len(program)):
-            t = program[pc]
+        margin = stack_margin(program)
+        peak = -1
 
-            if t[0] == 'lbl':
-                i = t[1]
+        if output == None:
+            output = Output()
+        if source == None:
+            source = Input(output = output)
+        write = output.write
+        heap_text = render(heap)
 
-                if i in labels:
-                    print("LabelError: label " + str(i) + " declared at " + str(labels[i]) + " and " + str(pc))
-                    exit(1)
+        labels = find_labels(program)
 
-                labels[i] = pc
+        try:
+            pc = 0
+            while True:
+                t = program[pc]
 
-        if debug:
-            print("Labels: " + str(labels))
+                if t[0] == 'ldc':
+                    k = t[1]
+                    sp += 1
+                    memory[sp] = k
 
-        pc = 0
-        while True:
-            t = program[pc]
+                elif t[0] == 'ldv':
+                    i = t[1]
+                    j = t[2]
 
-            if debug:
-                print("At line: " + str(pc))
-                print("Executing: " + str(t))
-                print("PC: " + str(pc))
-                print("SP: " + str(sp))
+                    sp += 1
+                    memory[sp] = memory[display[i] + j]
 
-            if t[0] == 'ldc':
-                k = t[1]
-                sp += 1
-                memory[sp] = k
+                elif t[0] == 'ldr':
+                    i = t[1]
+                    j = t[2]
 
-            elif t[0] == 'ldv':
-                i = t[1]
-                j = t[2]
+                    sp += 1
+                    memory[sp] = display[i] + j
 
-                sp += 1
-                memory[sp] = memory[display[i] + j]
+                elif t[0] == 'stv':
+                    i = t[1]
+                    j = t[2]
 
-            elif t[0] == 'ldr':
-                i = t[1]
-                j = t[2]
+                    memory[display[i] + j] = memory[sp]
+                    sp -= 1
 
-                sp += 1
-                memory[sp] = display[i] + j
+                elif t[0] == 'lrv':
+                    i = t[1]
+                    j = t[2]
 
-            elif t[0] == 'stv':
-                i = t[1]
-                j = t[2]
+                    sp += 1
+                    memory[sp] = memory[memory[display[i] + j]]
 
-                memory[display[i] + j] = memory[sp]
-                sp -= 1
+                elif t[0] == 'srv':
+                    i = t[1]
+                    j = t[2]
 
-            elif t[0] == 'lrv':
-                i = t[1]
-                j = t[2]
+                    memory[memory[display[i] + j]] = memory[sp]
+                    sp -= 1
 
-                sp += 1
-                memory[sp] = memory[memory[display[i] + j]]
+                elif t[0] == 'add':
+                    memory[sp - 1] = memory[sp - 1] + memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'srv':
-                i = t[1]
-                j = t[2]
+                elif t[0] == 'sub':
+                    memory[sp-1] = memory[sp - 1] - memory[sp]
+                    sp -= 1
 
-                memory[memory[display[i] + j]] = memory[sp]
-                sp -= 1
+                elif t[0] == 'mul':
+                    memory[sp - 1] = memory[sp - 1] * memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'add':
-                memory[sp - 1] = memory[sp - 1] + memory[sp]
-                sp -= 1
+                elif t[0] == 'div':
+                    memory[sp - 1] = int(memory[sp - 1] / memory[sp])
+                    sp -= 1
 
-            elif t[0] == 'sub':
-                memory[sp-1] = memory[sp - 1] - memory[sp]
-                sp -= 1
+                elif t[0] == 'mod':
+                    memory[sp - 1] = memory[sp - 1] % memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'mul':
-                memory[sp - 1] = memory[sp - 1] * memory[sp]
-                sp -= 1
+                elif t[0] == 'neg':
+                    memory[sp] = -memory[sp]
 
-            elif t[0] == 'div':
-                memory[sp - 1] = int(memory[sp - 1] / memory[sp])
-                sp -= 1
+                elif t[0] == 'abs':
+                    memory[sp] = abs(memory[sp])
 
-            elif t[0] == 'mod':
-                memory[sp - 1] = memory[sp - 1] % memory[sp]
-                sp -= 1
+                elif t[0] == 'num':
+                    t = memory[sp]
+                    num = 0
+                    for i in range(0,memory[t]):
+                        num *= 10
+                        num += memory[t+i+1] - ord('0')
+                    memory[sp] = num
 
-            elif t[0] == 'neg':
-                memory[sp] = -memory[sp]
+                elif t[0] == 'low':
+                    if memory[sp] >= 65 and memory[sp] <= 90:
+                        memory[sp] += 32
 
-            elif t[0] == 'abs':
-                memory[sp] = abs(memory[sp])
+                elif t[0] == 'upp':
+                    if memory[sp] >= 97 and memory[sp] <= 122:
+                        memory[sp] -= 32
 
-            elif t[0] == 'num':
-                t = memory[sp]
-                num = 0
-                for i in range(0,memory[t]):
-                    num *= 10
-                    num += memory[t+i+1] - ord('0')
-                memory[sp] = num
-
-            elif t[0] == 'low':
-                if memory[sp] >= 65 and memory[sp] <= 90:
-                    memory[sp] += 32
-
-            elif t[0] == 'upp':
-                if memory[sp] >= 97 and memory[sp] <= 122:
-                    memory[sp] -= 32
-
-            elif t[0] == 'and':
-                memory[sp - 1] = memory[sp - 1] and memory[sp]
-                sp -= 1
+                elif t[0] == 'and':
+                    memory[sp - 1] = memory[sp - 1] and memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'lor':
-                memory[sp - 1] = memory[sp - 1] or memory[sp]
-                sp -= 1
+                elif t[0] == 'lor':
+                    memory[sp - 1] = memory[sp - 1] or memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'not':
-                memory[sp] = not memory[sp]
+                elif t[0] == 'not':
+                    memory[sp] = not memory[sp]
 
-            elif t[0] == 'les':
-                memory[sp - 1] = memory[sp - 1] < memory[sp]
-                sp -= 1
+                elif t[0] == 'les':
+                    memory[sp - 1] = memory[sp - 1] < memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'leq':
-                memory[sp - 1] = memory[sp - 1] <= memory[sp]
-                sp -= 1
+                elif t[0] == 'leq':
+                    memory[sp - 1] = memory[sp - 1] <= memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'grt':
-                memory[sp - 1] = memory[sp - 1] > memory[sp]
-                sp -= 1
+                elif t[0] == 'grt':
+                    memory[sp - 1] = memory[sp - 1] > memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'gre':
-                memory[sp - 1] = memory[sp - 1] >= memory[sp]
-                sp -= 1
+                elif t[0] == 'gre':
+                    memory[sp - 1] = memory[sp - 1] >= memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'equ':
-                memory[sp - 1] = memory[sp - 1] == memory[sp]
-                sp -= 1
+                elif t[0] == 'equ':
+                    memory[sp - 1] = memory[sp - 1] == memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'neq':
-                memory[sp - 1] = memory[sp - 1] != memory[sp]
-                sp -= 1
+                elif t[0] == 'neq':
+                    memory[sp - 1] = memory[sp - 1] != memory[sp]
+                    sp -= 1
 
-            elif t[0] == 'jmp':
-                p = t[1]
+                elif t[0] == 'jmp':
+                    p = t[1]
+
+                    pc = labels.get(p, pc)
 
-                pc = labels.get(p, pc)
+                elif t[0] == 'jof':
+                    p = t[1]
 
-            elif t[0] == 'jof':
-                p = t[1]
+                    if not memory[sp]:
+                        pc = labels.get(p, pc)
 
-                if not memory[sp] or memory[sp] == 'false':
+                    sp -= 1
+
+                elif t[0] == 'alc':
+                    n = t[1]
+                    sp += n
+
+                    if sp > peak:
+                        peak = sp
+                        if peak + margin >= len(memory):
+                            model.grow(memory, peak + margin)
+
+                elif t[0] == 'dlc':
+                    n = t[1]
+                    sp -= n
+
+                elif t[0] == 'cfu':
+                    p = t[1]
+                    sp += 1
+                    memory[sp] = pc
                     pc = labels.get(p, pc)
 
-                sp -= 1
+                    if sp > peak:
+                        peak = sp
+                        if peak + margin >= len(memory):
+                            model.grow(memory, peak + margin)
 
-            elif t[0] == 'alc':
-                n = t[1]
+                elif t[0] == 'enf':
 
-                memory.extend([0] * n)
-                sp += n
+                    k = t[1]
+                    sp += 1
+                    memory[sp] = display[k]
+                    display[k] = sp + 1
 
-            elif t[0] == 'dlc':
-                n = t[1]
-                sp -= n
+                elif t[0] == 'ret':
+                    k = t[1]
+                    n = t[2]
 
-            elif t[0] == 'cfu':
-                p = t[1]
-                sp += 1
-                memory[sp] = pc
-                pc = labels.get(p, pc)
+                    display[k] = memory[sp]
+                    pc = memory[sp - 1]
 
-            elif t[0] == 'enf':
+                    sp -= (n + 2)
 
-                k = t[1]
-                sp += 1
-                memory[sp] = display[k]
-                display[k] = sp + 1
+                elif t[0] == 'idx':
+                    k = t[1]
 
-            elif t[0] == 'ret':
-                k = t[1]
-                n = t[2]
+                    memory[sp - 1] = memory[sp - 1] + memory[sp] * k
+                    sp -= 1
 
-                display[k] = memory[sp]
-                pc = memory[sp - 1]
+                elif t[0] == 'grc':
+                    memory[sp] = memory[memory[sp]]
 
-                sp -= (n + 2)
+                elif t[0] == 'lmv':
+                    k = t[1]
 
-            elif t[0] == 'idx':
-                k = t[1]
+                    model.move(memory, sp, memory[sp], k)
+                    sp += (k - 1)
 
-                memory[sp - 1] = memory[sp - 1] + memory[sp] * k
-                sp -= 1
+                elif t[0] == 'smv':
+                    k = t[1]
 
-            elif t[0] == 'grc':
-                memory[sp] = memory[memory[sp]]
+                    model.move(memory, memory[sp - k], sp - k + 1, k)
+                    sp -= (k + 1)
 
-            elif t[0] == 'lmv':
-                k = t[1]
+                elif t[0] == 'smr':
+                    k = t[1]
 
-                t = memory[sp]
-                memory[sp : sp + k] = memory[t : t + k]
-                sp += (k - 1)
+                    model.move(memory, memory[sp - 1], memory[sp], k)
+                    sp -= 1
 
-            elif t[0] == 'smv':
-                k = t[1]
+                elif t[0] == 'sts':
+                    k = t[1]
 
-                t = memory[sp - k]
-                memory[t : t + k] = memory[sp - k + 1 : sp + 1]
-                sp -= (k + 1)
+                    model.store(memory, memory[sp], heap[k])
+                    sp -= 1
 
-            elif t[0] == 'smr':
-                k = t[1]
+                elif t[0] == 'rdv':
+                    sp += 1
+                    memory[sp] = source.read_int()
 
-                t1 = memory[sp - 1]
-                t2 = memory[sp]
-                memory[t1 : t1 + k] = memory[t2 : t2 + k]
-                sp -= 1
+                elif t[0] == 'rdc':
+                    sp += 1
+                    memory[sp] = source.read_char()
 
-            elif t[0] == 'sts':
-                k = t[1]
+                elif t[0] == 'rds':
+                    model.store(memory, memory[sp], source.read_string())
+                    sp -= 1
 
-                adr = memory[sp]
-                memory[adr] = len(heap[k])
-                for c in heap[k]:
-                    adr = adr + 1
-                    memory[adr] = c;
-                sp -= 1
+                elif t[0] == 'prv':
+                    kind = t[1]
+
+                    write(show(kind, memory[sp]))
+                    sp -= 1
+
+                elif t[0] == 'prt':
+                    k = t[1]
+
+                    write(str(list(memory[sp - k + 1 : sp + 1])))
+                    sp -= (k-1)
+
+                elif t[0] == 'prc':
+                    i = t[1]
+                    write(heap_text[i])
+
+                elif t[0] == 'prs':
+                    write(model.text(memory, memory[sp]))
+                    sp -= 1
+
+                elif t[0] == 'stp':
+                    memory = model.allocate(max(stack_size, margin))
+                    display = [0] * DISPLAY_SIZE
+
+                    sp = -1
+                    peak = -1
+                    display[0] = 0
+
+                elif t[0] == 'lbl':
+                    # labels were preprocessed
+                    pass
+
+                elif t[0] == 'nop':
+                    pass
+
+                elif t[0] == 'end':
+                    break
+
+                elif t[0] == 'inv':
+                    i = t[1]
+                    j = t[2]
+                    k = t[3]
+
+                    memory[display[i] + j] += k
+
+                elif t[0] == 'cjf':
+                    p = t[1]
+                    c = t[2]
+
+                    if not COMPARE[c](memory[sp - 1], memory[sp]):
+                        pc = labels.get(p, pc)
+
+                    sp -= 2
+
+                elif t[0] == 'ldx':
+                    k = t[1]
+
+                    memory[sp - 1] = memory[memory[sp - 1] + memory[sp] * k]
+                    sp -= 1
+
+                elif t[0] == 'for':
+                    p = t[1]
+                    down = t[2]
 
-            elif t[0] == 'rdv':
-                if len(buf) == 0:
-                    buf = input().split()
-                value = int(buf[0])
-                buf = buf[1:]
+                    adr = memory[sp - 3]
+                    memory[adr] = memory[sp - 2]
+                    memory[sp - 2] = memory[sp - 1]
+                    memory[sp - 1] = memory[sp]
+                    sp -= 1
 
-                try:
-                    value = int(value)
-                except ValueError:
-                    print("ValueError: expected an 'int', found 'string'")
-                    exit(1)
+                    if memory[adr] < memory[sp - 1] if down else memory[adr] > memory[sp - 1]:
+                        pc = labels.get(p, pc)
 
+                elif t[0] == 'nxt':
+                    p = t[1]
+                    down = t[2]
+
+                    adr = memory[sp - 2]
+                    if down:
+                        memory[adr] -= memory[sp]
+                        if memory[adr] >= memory[sp - 1]:
+                            pc = labels.get(p, pc)
+                    else:
+                        memory[adr] += memory[sp]
+                        if memory[adr] <= memory[sp - 1]:
+                            pc = labels.get(p, pc)
+
+                else:
+                    raise VMError("UnknownCall: '" + t[0] + "' is not declared")
+
+                pc += 1
+        except OverflowError as error:
+            raise overflow(error)
+        finally:
+            output.flush()
+
+        return peak + 1
+
+    def execute_table(program, heap = [], tracer = None, stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None, watcher = None, decoded = None):
+        """
+        Same semantics as execute, but the program is decoded once into
+        integer opcodes and the main loop dispatches through a handler
+        table instead of comparing instruction names. See load for tracer,
+        watcher and decoded.
+        """
+        if output == None:
+            output = Output()
+        run, state = VirtualMachine.load(program, heap, tracer, stack_size, model, output, source, watcher, decoded)
+        try:
+            run()
+        finally:
+            output.flush()
+        return state()[4] + 1
+
+    def load(program, heap = [], tracer = None, stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None, watcher = None, decoded = None):
+        """
+        Build the table engine for program and return two functions:
+        run(steps), which runs up to steps instructions (or up to the end
+        if steps is None) and returns whether the program has ended, and
+        state(), which returns the current pc, sp, memory, display and
+        peak stack depth. decoded is the result of decode(program), if it
+        is already known.
+
+        If a tracer is given (see lya_tracejit), backward jumps (jmp and
+        nxt) count how many times they are taken. Once one of them reaches
+        tracer.threshold, the next iteration of its loop is recorded and
+        handed to tracer.compile, and later iterations run the compiled
+        trace.
+
+        If a watcher is given (see lya_steptrace), every handler is replaced
+        by watcher.watch(handler, state) before the run starts. Without a
+        watcher the loop runs the plain handlers.
+        """
+        ops, arg1, arg2, arg3 = decoded if decoded != None else decode(program)
+
+        # Original instruction of every lop
+        loops = {}
+
+        if tracer != None:
+            # Traces rewrite the program
+            ops = list(ops)
+            arg1 = list(arg1)
+            for i in range(len(ops)):
+                if ops[i] in (OPCODE['jmp'], OPCODE['nxt']) and arg1[i] < i:
+                    loops[i] = ops[i]
+                    ops[i] = OPCODE['lop']
+
+        memory = []
+        display = []
+        sp = 0
+        pc = 0
+
+        margin = stack_margin(program)
+        peak = -1
+
+        if output == None:
+            output = Output()
+        if source == None:
+            source = Input(output = output)
+        write = output.write
+        heap_text = render(heap)
+
+        def ldc(k, _):
+            nonlocal sp
+            sp += 1
+            memory[sp] = k
+
+        def ldv(i, j):
+            nonlocal sp
+            sp += 1
+            memory[sp] = memory[display[i] + j]
+
+        def ldr(i, j):
+            nonlocal sp
+            sp += 1
+            memory[sp] = display[i] + j
+
+        def stv(i, j):
+            nonlocal sp
+            memory[display[i] + j] = memory[sp]
+            sp -= 1
+
+        def lrv(i, j):
+            nonlocal sp
+            sp += 1
+            memory[sp] = memory[memory[display[i] + j]]
+
+        def srv(i, j):
+            nonlocal sp
+            memory[memory[display[i] + j]] = memory[sp]
+            sp -= 1
+
+        def add(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] + memory[sp]
+            sp -= 1
+
+        def sub(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] - memory[sp]
+            sp -= 1
+
+        def mul(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] * memory[sp]
+            sp -= 1
+
+        def div(_, __):
+            nonlocal sp
+            memory[sp - 1] = int(memory[sp - 1] / memory[sp])
+            sp -= 1
+
+        def mod(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] % memory[sp]
+            sp -= 1
+
+        def neg(_, __):
+            memory[sp] = -memory[sp]
+
+        def abs_(_, __):
+            memory[sp] = abs(memory[sp])
+
+        def num(_, __):
+            t = memory[sp]
+            n = 0
+            for i in range(0, memory[t]):
+                n *= 10
+                n += memory[t + i + 1] - ord('0')
+            memory[sp] = n
+
+        def low(_, __):
+            if memory[sp] >= 65 and memory[sp] <= 90:
+                memory[sp] += 32
+
+        def upp(_, __):
+            if memory[sp] >= 97 and memory[sp] <= 122:
+                memory[sp] -= 32
+
+        def and_(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] and memory[sp]
+            sp -= 1
+
+        def lor(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] or memory[sp]
+            sp -= 1
+
+        def not_(_, __):
+            memory[sp] = not memory[sp]
+
+        def les(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] < memory[sp]
+            sp -= 1
+
+        def leq(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] <= memory[sp]
+            sp -= 1
+
+        def grt(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] > memory[sp]
+            sp -= 1
+
+        def gre(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] >= memory[sp]
+            sp -= 1
+
+        def equ(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] == memory[sp]
+            sp -= 1
+
+        def neq(_, __):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] != memory[sp]
+            sp -= 1
+
+        def jmp(p, _):
+            nonlocal pc
+            pc = p
+
+        def jof(p, _):
+            nonlocal sp, pc
+            if not memory[sp]:
+                pc = p
+            sp -= 1
+
+        def alc(n, _):
+            nonlocal sp, peak
+            sp += n
+
+            if sp > peak:
+                peak = sp
+                if peak + margin >= len(memory):
+                    model.grow(memory, peak + margin)
+
+        def dlc(n, _):
+            nonlocal sp
+            sp -= n
+
+        def cfu(p, _):
+            nonlocal sp, pc, peak
+            sp += 1
+            memory[sp] = pc
+            pc = p
+
+            if sp > peak:
+                peak = sp
+                if peak + margin >= len(memory):
+                    model.grow(memory, peak + margin)
+
+        def enf(k, _):
+            nonlocal sp
+            sp += 1
+            memory[sp] = display[k]
+            display[k] = sp + 1
+
+        def ret(k, n):
+            nonlocal sp, pc
+            display[k] = memory[sp]
+            pc = memory[sp - 1]
+            sp -= (n + 2)
+
+        def idx(k, _):
+            nonlocal sp
+            memory[sp - 1] = memory[sp - 1] + memory[sp] * k
+            sp -= 1
+
+        def grc(_, __):
+            memory[sp] = memory[memory[sp]]
+
+        def lmv(k, _):
+            nonlocal sp
+            model.move(memory, sp, memory[sp], k)
+            sp += (k - 1)
+
+        def smv(k, _):
+            nonlocal sp
+            model.move(memory, memory[sp - k], sp - k + 1, k)
+            sp -= (k + 1)
+
+        def smr(k, _):
+            nonlocal sp
+            model.move(memory, memory[sp - 1], memory[sp], k)
+            sp -= 1
+
+        def sts(k, _):
+            nonlocal sp
+            model.store(memory, memory[sp], heap[k])
+            sp -= 1
+
+        def rdv(_, __):
+            nonlocal sp
+            sp += 1
+            memory[sp] = source.read_int()
+
+        def rdc(_, __):
+            nonlocal sp
+            sp += 1
+            memory[sp] = source.read_char()
+
+        def rds(_, __):
+            nonlocal sp
+            model.store(memory, memory[sp], source.read_string())
+            sp -= 1
+
+        def prv(kind, _):
+            nonlocal sp
+            write(show(kind, memory[sp]))
+            sp -= 1
+
+        def prt(k, _):
+            nonlocal sp
+            write(str(list(memory[sp - k + 1 : sp + 1])))
+            sp -= (k - 1)
+
+        def prc(i, _):
+            write(heap_text[i])
+
+        def prs(_, __):
+            nonlocal sp
+            write(model.text(memory, memory[sp]))
+            sp -= 1
+
+        def stp(_, __):
+            nonlocal sp, memory, display, peak
+            memory = model.allocate(max(stack_size, margin))
+            display = [0] * DISPLAY_SIZE
+
+            sp = -1
+            peak = -1
+            display[0] = 0
+
+        def nop(_, __):
+            # lbl is a nop once labels are resolved
+            pass
+
+        def end(_, __):
+            raise Halt()
+
+        def inv(i, j):
+            memory[display[i] + j] += arg3[pc]
+
+        def cjf(p, c):
+            nonlocal sp, pc
+            if not COMPARE[c](memory[sp - 1], memory[sp]):
+                pc = p
+            sp -= 2
+
+        def ldx(k, _):
+            nonlocal sp
+            memory[sp - 1] = memory[memory[sp - 1] + memory[sp] * k]
+            sp -= 1
+
+        def for_(p, down):
+            nonlocal sp, pc
+            adr = memory[sp - 3]
+            memory[adr] = memory[sp - 2]
+            memory[sp - 2] = memory[sp - 1]
+            memory[sp - 1] = memory[sp]
+            sp -= 1
+
+            if memory[adr] < memory[sp - 1] if down else memory[adr] > memory[sp - 1]:
+                pc = p
+
+        def nxt(p, down):
+            nonlocal pc
+            adr = memory[sp - 2]
+            if down:
+                memory[adr] -= memory[sp]
+                if memory[adr] >= memory[sp - 1]:
+                    pc = p
+            else:
+                memory[adr] += memory[sp]
+                if memory[adr] <= memory[sp - 1]:
+                    pc = p
+
+        def unknown(name, _):
+            raise VMError("UnknownCall: '" + name + "' is not declared")
+
+        counts = {}
+        traces = []
+        recording = None
+        recorded_loop = None
+
+        def record(handler):
+            def run(a, b):
+                recording.append(pc)
+                if len(recording) > tracer.limit:
+                    stop_recording(None)
+                handler(a, b)
+            return run
+
+        def stop_recording(trace):
+            # Without a trace the loop goes back to its original
+            # instruction for good.
+            nonlocal recording
+            handlers[:] = plain
+            ops[recorded_loop] = loops[recorded_loop]
+
+            if trace != None:
+                ops[recorded_loop] = OPCODE['trc']
+                arg1[recorded_loop] = len(traces)
+                traces.append(trace)
+
+            recording = None
+
+        def lop(p, b):
+            nonlocal recording, recorded_loop
+            here = pc
+            plain[loops[here]](p, b)
+
+            if pc != p:
+                # Loop is over
+                if recording != None and here == recorded_loop:
+                    handlers[:] = plain
+                    recording = None
+                    counts[here] = 0
+            elif recording != None:
+                if here == recorded_loop:
+                    # One full iteration. The trace starts with this
+                    # instruction, as it is where the trace is entered.
+                    ops[here] = loops[here]
+                    stop_recording(tracer.compile([here] + recording[:-1], ops, arg1, arg2, arg3))
+                else:
+                    # Nested loops are traced on their own
+                    stop_recording(None)
+            else:
+                n = counts.get(here, 0) + 1
+                counts[here] = n
+
+                if n == tracer.threshold:
+                    recording = []
+                    recorded_loop = here
+                    handlers[:] = recorders
+
+        def trc(i, _):
+            nonlocal pc, sp
+            pc, sp = traces[i](memory, display, sp)
+            pc -= 1
+
+        handlers = [
+            ldc, ldv, ldr, stv, lrv, srv,
+            add, sub, mul, div, mod, neg, abs_, num, low, upp,
+            and_, lor, not_, les, leq, grt, gre, equ, neq,
+            jmp, jof, alc, dlc, cfu, enf, ret,
+            idx, grc, lmv, smv, smr, sts,
+            rdv, rdc, rds, prv, prt, prc, prs,
+            stp, nop, nop, end,
+            inv, cjf, ldx,
+            for_, nxt,
+            unknown,
+            lop, trc
+        ]
+        def state():
+            return pc, sp, memory, display, peak
+
+        if watcher != None:
+            handlers = [watcher.watch(handler, state) for handler in handlers]
+
+        plain = list(handlers)
+        recorders = [record(handler) for handler in plain]
+
+        halted = False
+
+        def run(steps = None):
+            nonlocal pc, halted
+            if halted:
+                return True
+
+            try:
+                if steps == None:
+                    while True:
+                        handlers[ops[pc]](arg1[pc], arg2[pc])
+                        pc += 1
+
+                for _ in range(steps):
+                    handlers[ops[pc]](arg1[pc], arg2[pc])
+                    pc += 1
+            except Halt:
+                halted = True
+            except OverflowError as error:
+                raise overflow(error)
+
+            return halted
+
+        return run, state
+
+    def execute_threaded(program, heap = [], stack_size = MEMORY_SIZE, model = ListMemory, output = None, source = None):
+        """
+        Same semantics as execute, but every instruction is turned into a
+        closure with its operands already bound. Each closure returns the
+        pc of the next instruction to run.
+        """
+        ops, arg1, arg2, arg3 = decode(program)
+
+        memory = []
+        display = []
+        sp = 0
+
+        margin = stack_margin(program)
+        peak = -1
+
+        if output == None:
+            output = Output()
+        if source == None:
+            source = Input(output = output)
+        write = output.write
+        heap_text = render(heap)
+
+        def ldc(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                sp += 1
+                memory[sp] = k
+                return nxt
+            return run
+
+        def ldv(pc, i, j):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
                 sp += 1
-                memory[sp] = value
+                memory[sp] = memory[display[i] + j]
+                return nxt
+            return run
 
-            elif t[0] == 'rdc':
-                if len(buf) == 0:
-                    buf = input().split()
+        def ldr(pc, i, j):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                sp += 1
+                memory[sp] = display[i] + j
+                return nxt
+            return run
 
-                if len(list(buf[0])) > 1:
-                        print("ValueError: expected a 'char', found a 'string'")
-                        exit(1)
-                value = ord(list(buf[0])[0])
-                buf = buf[1:]
+        def stv(pc, i, j):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[display[i] + j] = memory[sp]
+                sp -= 1
+                return nxt
+            return run
 
+        def lrv(pc, i, j):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
                 sp += 1
-                memory[sp] = value
+                memory[sp] = memory[memory[display[i] + j]]
+                return nxt
+            return run
+
+        def srv(pc, i, j):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[memory[display[i] + j]] = memory[sp]
+                sp -= 1
+                return nxt
+            return run
+
+        def binary(operation):
+            def build(pc, _, __):
+                nxt = pc + 1
+                def run():
+                    nonlocal sp
+                    memory[sp - 1] = operation(memory[sp - 1], memory[sp])
+                    sp -= 1
+                    return nxt
+                return run
+            return build
+
+        def unary(operation):
+            def build(pc, _, __):
+                nxt = pc + 1
+                def run():
+                    memory[sp] = operation(memory[sp])
+                    return nxt
+                return run
+            return build
+
+        def add(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] + memory[sp]
+                sp -= 1
+                return nxt
+            return run
+
+        def sub(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] - memory[sp]
+                sp -= 1
+                return nxt
+            return run
+
+        def mul(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] * memory[sp]
+                sp -= 1
+                return nxt
+            return run
+
+        def les(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] < memory[sp]
+                sp -= 1
+                return nxt
+            return run
 
-            elif t[0] == 'rds':
-                if len(buf) == 0:
-                    buf = input().split()
-                st = buf[0]
-                buf = buf[1:]
+        def leq(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] <= memory[sp]
+                sp -= 1
+                return nxt
+            return run
 
-                adr = memory[sp]
-                memory[adr] = len(st)
+        def grt(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] > memory[sp]
+                sp -= 1
+                return nxt
+            return run
 
-                for k in st:
-                    adr = adr + 1
-                    memory[adr] = k
+        def gre(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] >= memory[sp]
+                sp -= 1
+                return nxt
+            return run
 
+        def equ(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] == memory[sp]
                 sp -= 1
+                return nxt
+            return run
 
-            elif t[0] == 'prv':
-                ischar = t[1]
+        def neq(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] != memory[sp]
+                sp -= 1
+                return nxt
+            return run
 
-                if ischar:
-                    print(chr(memory[sp]),end='')
-                else:
-                    print(memory[sp],end=' ')
+        def num(pc, _, __):
+            nxt = pc + 1
+            def run():
+                t = memory[sp]
+                n = 0
+                for i in range(0, memory[t]):
+                    n *= 10
+                    n += memory[t + i + 1] - ord('0')
+                memory[sp] = n
+                return nxt
+            return run
+
+        def low(c):
+            if c >= 65 and c <= 90:
+                c += 32
+            return c
+
+        def upp(c):
+            if c >= 97 and c <= 122:
+                c -= 32
+            return c
+
+        def jmp(pc, p, _):
+            def run():
+                return p + 1
+            return run
+
+        def jof(pc, p, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
                 sp -= 1
+                if not memory[sp + 1]:
+                    return p + 1
+                return nxt
+            return run
+
+        def alc(pc, n, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp, peak
+                sp += n
+
+                if sp > peak:
+                    peak = sp
+                    if peak + margin >= len(memory):
+                        model.grow(memory, peak + margin)
+                return nxt
+            return run
+
+        def dlc(pc, n, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                sp -= n
+                return nxt
+            return run
+
+        def cfu(pc, p, _):
+            def run():
+                nonlocal sp, peak
+                sp += 1
+                memory[sp] = pc
 
-            elif t[0] == 'prt':
-                k = t[1]
+                if sp > peak:
+                    peak = sp
+                    if peak + margin >= len(memory):
+                        model.grow(memory, peak + margin)
+                return p + 1
+            return run
+
+        def enf(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                sp += 1
+                memory[sp] = display[k]
+                display[k] = sp + 1
+                return nxt
+            return run
 
-                print(memory[sp - k + 1 : sp + 1], end='');
-                sp -= (k-1)
+        def ret(pc, k, n):
+            def run():
+                nonlocal sp
+                display[k] = memory[sp]
+                back = memory[sp - 1]
+                sp -= (n + 2)
+                return back + 1
+            return run
 
-            elif t[0] == 'prc':
-                i = t[1]
-                for c in heap[i]:
-                    print(chr(c),end="")
+        def idx(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[sp - 1] + memory[sp] * k
+                sp -= 1
+                return nxt
+            return run
 
-            elif t[0] == 'prs':
-                adr = memory[sp]
-                l = memory[adr]
-                for i in range(0,l):
-                    adr = adr + 1
-                    print(chr(memory[adr]), end = "")
+        def grc(pc, _, __):
+            nxt = pc + 1
+            def run():
+                memory[sp] = memory[memory[sp]]
+                return nxt
+            return run
+
+        def lmv(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                model.move(memory, sp, memory[sp], k)
+                sp += (k - 1)
+                return nxt
+            return run
+
+        def smv(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                model.move(memory, memory[sp - k], sp - k + 1, k)
+                sp -= (k + 1)
+                return nxt
+            return run
+
+        def smr(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                model.move(memory, memory[sp - 1], memory[sp], k)
+                sp -= 1
+                return nxt
+            return run
+
+        def sts(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                model.store(memory, memory[sp], heap[k])
                 sp -= 1
+                return nxt
+            return run
 
-            elif t[0] == 'stp':
-                memory = [0] * MEMORY_SIZE
+        def rdv(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                sp += 1
+                memory[sp] = source.read_int()
+                return nxt
+            return run
+
+        def rdc(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                sp += 1
+                memory[sp] = source.read_char()
+                return nxt
+            return run
+
+        def rds(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                model.store(memory, memory[sp], source.read_string())
+                sp -= 1
+                return nxt
+            return run
+
+        def prv(pc, kind, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                write(show(kind, memory[sp]))
+                sp -= 1
+                return nxt
+            return run
+
+        def prt(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                write(str(list(memory[sp - k + 1 : sp + 1])))
+                sp -= (k - 1)
+                return nxt
+            return run
+
+        def prc(pc, i, _):
+            nxt = pc + 1
+            string = heap_text[i]
+            def run():
+                write(string)
+                return nxt
+            return run
+
+        def prs(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                write(model.text(memory, memory[sp]))
+                sp -= 1
+                return nxt
+            return run
+
+        def stp(pc, _, __):
+            nxt = pc + 1
+            def run():
+                nonlocal sp, memory, display, peak
+                memory = model.allocate(max(stack_size, margin))
                 display = [0] * DISPLAY_SIZE
 
                 sp = -1
+                peak = -1
                 display[0] = 0
+                return nxt
+            return run
+
+        def nop(pc, _, __):
+            nxt = pc + 1
+            def run():
+                return nxt
+            return run
+
+        def end(pc, _, __):
+            def run():
+                raise Halt()
+            return run
+
+        def inv(pc, i, j):
+            nxt = pc + 1
+            k = arg3[pc]
+            def run():
+                memory[display[i] + j] += k
+                return nxt
+            return run
+
+        def cjf(pc, p, c):
+            nxt = pc + 1
+            compare = COMPARE[c]
+            def run():
+                nonlocal sp
+                sp -= 2
+                if not compare(memory[sp + 1], memory[sp + 2]):
+                    return p + 1
+                return nxt
+            return run
+
+        def ldx(pc, k, _):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                memory[sp - 1] = memory[memory[sp - 1] + memory[sp] * k]
+                sp -= 1
+                return nxt
+            return run
+
+        def for_(pc, p, down):
+            nxt = pc + 1
+            def run():
+                nonlocal sp
+                adr = memory[sp - 3]
+                memory[adr] = memory[sp - 2]
+                memory[sp - 2] = memory[sp - 1]
+                memory[sp - 1] = memory[sp]
+                sp -= 1
 
-            elif t[0] == 'lbl':
-                # labels were preprocessed
-                pass
-
-            elif t[0] == 'nop':
-                pass
-
-            elif t[0] == 'end':
-                break
-
+                if memory[adr] < memory[sp - 1] if down else memory[adr] > memory[sp - 1]:
+                    return p + 1
+                return nxt
+            return run
+
+        def next_(pc, p, down):
+            nxt = pc + 1
+            if down:
+                def run():
+                    adr = memory[sp - 2]
+                    memory[adr] -= memory[sp]
+                    if memory[adr] >= memory[sp - 1]:
+                        return p + 1
+                    return nxt
             else:
-                print("UnknownCall: '" + t[0] + "' is not declared")
-                exit(1)
+                def run():
+                    adr = memory[sp - 2]
+                    memory[adr] += memory[sp]
+                    if memory[adr] <= memory[sp - 1]:
+                        return p + 1
+                    return nxt
+            return run
+
+        def unknown(pc, name, _):
+            def run():
+                raise VMError("UnknownCall: '" + name + "' is not declared")
+            return run
+
+        builders = [
+            ldc, ldv, ldr, stv, lrv, srv,
+            add, sub, mul,
+            binary(lambda a, b: int(a / b)),
+            binary(lambda a, b: a % b),
+            unary(lambda a: -a),
+            unary(abs),
+            num,
+            unary(low),
+            unary(upp),
+            binary(lambda a, b: a and b),
+            binary(lambda a, b: a or b),
+            unary(lambda a: not a),
+            les, leq, grt, gre, equ, neq,
+            jmp, jof, alc, dlc, cfu, enf, ret,
+            idx, grc, lmv, smv, smr, sts,
+            rdv, rdc, rds, prv, prt, prc, prs,
+            stp, nop, nop, end,
+            inv, cjf, ldx,
+            for_, next_,
+            unknown
+        ]
+
+        code = [builders[ops[pc]](pc, arg1[pc], arg2[pc]) for pc in range(len(ops))]
 
-            if debug:
-                print(memory)
-                print(display)
-
-            pc += 1
+        pc = 0
+        try:
+            while True:
+                pc = code[pc]()
+        except Halt:
+            pass
+        except OverflowError as error:
+            raise overflow(error)
+        finally:
+            output.flush()
+
+        return peak + 1
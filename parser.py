@@ -1,4 +1,7 @@
 # Yacc example
+import marshal
+import os
+import sys
 import ply.yacc as yacc
 
 from lya_vm import VirtualMachine
@@ -8,17 +11,74 @@ from semantic import *
 
 # Get the token map from the lexer.  This is required.
 import lexer as lex
+import lya_tokens
+
+# Parsing tables of the frozen parser, written by freeze()
+TABLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsetab.marshal')
 
 class Parser:
 
-    def __init__(self):
+    # The tables of the frozen parsers, loaded by the first one. The rules
+    # keep no state, so they are bound to the methods of that Parser.
+    tables = None
+
+    def __init__(self, frozen = False):
+        """
+        Build the parser with yacc, which checks the grammar against the
+        source of this module and rewrites parsetab.py and parser.out when
+        it changes. A frozen parser loads the tables written by freeze
+        instead, after comparing their signature with the grammar, and
+        never looks at the source or writes files.
+        """
         self.lexer = lex.Lexer()
         self.tokens = self.lexer.tokens
-        self.build()
+        if frozen:
+            self.thaw()
+        else:
+            self.build()
 
     def build(self):
         self.parser = yacc.yacc(module=self, start='program')
 
+    def signature(self):
+        """
+        The signature yacc gives the grammar: start symbol, tokens and the
+        rules, in the order they are defined.
+        """
+        rules = sorted((f.__code__.co_firstlineno, f.__doc__) for name, f in vars(Parser).items() if name.startswith('p_') and name != 'p_error')
+        return 'program' + ' '.join(self.tokens) + ''.join(doc for _, doc in rules)
+
+    def thaw(self):
+        if Parser.tables == None:
+            Parser.tables = self.load()
+
+        if Parser.tables == None:
+            sys.stderr.write(TABLES + " is missing or out of date, run python3 parser.py\n")
+            self.parser = yacc.yacc(module=self, start='program', debug=False, write_tables=False)
+            return
+
+        self.parser = yacc.LRParser(Parser.tables, self.p_error)
+
+    def load(self):
+        """
+        Return the tables in TABLES, bound to the rules of this Parser, or
+        None if they are missing or were not written for this grammar.
+        """
+        try:
+            with open(TABLES, 'rb') as file:
+                version, signature, action, goto, productions = marshal.loads(file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != yacc.__tabversion__ or signature != self.signature():
+            return None
+
+        tables = yacc.LRTable()
+        tables.lr_action = action
+        tables.lr_goto = goto
+        tables.lr_productions = [yacc.MiniProduction(*p) for p in productions]
+        tables.bind_callables({name: getattr(self, name) for name in vars(Parser) if name.startswith('p_')})
+        return tables
+
     def p_program(self, p):
         'program : statement_list'
 
@@ -296,7 +356,7 @@ class Parser:
         '''boolean_literal : FALSE
                            | TRUE'''
 
-        p[0] = Boolean_Literal(p[1], lineno = p.lineno(1))
+        p[0] = Boolean_Literal(p[1] == 'true', lineno = p.lineno(1))
 
     def p_character_literal(self, p):
         '''character_literal : CCONST '''
@@ -589,9 +649,11 @@ class Parser:
         '''step_enumeration : loop_counter ASSIGN start_value end_value
                             | loop_counter ASSIGN start_value step_value end_value'''
         if (len(p) == 5):
-            p[0] = Step_Enumeration(p[1], p[3], None, p[4], lineno = p[1].lineno)
+            end_value, down = p[4]
+            p[0] = Step_Enumeration(p[1], p[3], None, end_value, down = down, lineno = p[1].lineno)
         elif (len(p) == 6):
-            p[0] = Step_Enumeration(p[1], p[3], p[4], p[5], lineno = p[1].lineno)
+            end_value, down = p[5]
+            p[0] = Step_Enumeration(p[1], p[3], p[4], end_value, down = down, lineno = p[1].lineno)
 
     def p_loop_counter(self, p):
         '''loop_counter :  identifier'''
@@ -608,10 +670,11 @@ class Parser:
     def p_end_value(self, p):
         '''end_value : TO discrete_expression
                      | DOWN TO discrete_expression'''
+        # The direction is kept along with the expression
         if (len(p) == 3):
-            p[0] = p[2]
+            p[0] = (p[2], False)
         elif(len(p) == 4):
-            p[0] = p[3]
+            p[0] = (p[3], True)
 
     def p_discrete_expression(self, p):
         '''discrete_expression : expression'''
@@ -623,7 +686,7 @@ class Parser:
         if (len(p) == 4):
             p[0] = Range_Enumeration(p[1], p[3], lineno = p[1].lineno)
         elif (len(p) == 5):
-            p[0] = Range_Enumeration(p[1], p[4], lineno = p[1].lineno)
+            p[0] = Range_Enumeration(p[1], p[4], down = True, lineno = p[1].lineno)
 
     def p_while_control(self, p):
         '''while_control :  WHILE boolean_expression'''
@@ -762,6 +825,11 @@ class Parser:
         print("Syntax error in input! Found unknown " + str(p))
 
     def parse(self, text):
+        """
+        Parse the source text, or the tokens of a lya_tokens.TokenStream.
+        """
+        if isinstance(text, lya_tokens.TokenStream):
+            return self.parser.parse(lexer = text.reader())
         return self.parser.parse(text, self.lexer)
 
 # Build the parser
@@ -809,3 +877,26 @@ while counter > 0:
 
     except EOFError:
         break
+
+def freeze():
+    """
+    Write the tables of the frozen parser, if the grammar has changed, and
+    the tables of the lexer.
+    """
+    lex.freeze()
+    parser = Parser()
+
+    # The tables are plain dicts, lists and tuples, which marshal loads
+    # faster than pickle, and without importing anything
+    productions = [(p.str, p.name, p.len, p.func, p.file, p.line) for p in parser.parser.productions]
+    data = marshal.dumps((yacc.__tabversion__, parser.signature(), parser.parser.action, parser.parser.goto, productions))
+    try:
+        with open(TABLES, 'rb') as file:
+            current = file.read() == data
+    except OSError:
+        current = False
+    if not current:
+        with open(TABLES, 'wb') as file:
+            file.write(data)
+
+if __name__ == "__main__": freeze()
@@ -5,9 +5,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programID PLUS MINUS TIMES DIVIDE ASSIGN COMMA COLON SEMI ARROW LPAREN RPAREN LBRACKET RBRACKET LESS LESSEQ GREATER GREATEREQ EQUAL AND OR STRCAT INCREASE DECREASE MULCREASE DIVCREASE MODCREASE DIFF MOD NOT ICONST CCONST SCONST DOWN ABS WHILE PROC FI OD NULL FOR RESULT BOOL ASC READ LENGTH THEN RETURNS CHARS PRINT ELSIF ELSE LOWER DCL DO SYN END ARRAY CHAR INT TYPE BY RETURN IF TRUE TO UPPER NUM REF LOC EXIT IN FALSEprogram : statement_liststatement_list : statement\n                          | statement_list statementstatement : declaration_statement\n                     | synonym_statement\n                     | newmode_statement\n                     | procedure_statement\n                     | action_statementdeclaration_statement : DCL declaration_list SEMIdeclaration_list : declaration\n                            | declaration_list COMMA declarationdeclaration : identifier_list mode\n                       | identifier_list mode initializationinitialization : ASSIGN expressionidentifier_list : identifier\n                           | identifier_list COMMA identifieridentifier : IDsynonym_statement : SYN synonym_list SEMIsynonym_list : synonym_definition\n                        | synonym_list synonym_definitionsynonym_definition : identifier_list ASSIGN constant_expression\n                              | identifier_list mode ASSIGN constant_expressionconstant_expression : expressionnewmode_statement : TYPE newmode_list SEMInewmode_list : mode_definition\n                        | newmode_list COMMA mode_definitionmode_definition : identifier_list ASSIGN modemode : mode_name\n                | discrete_mode\n                | reference_mode\n                | composite_modediscrete_mode : integer_mode\n                | boolean_mode\n                | character_mode\n                | discrete_range_modeinteger_mode : INTboolean_mode : BOOLcharacter_mode : CHARdiscrete_range_mode : identifier LPAREN literal_range RPAREN\n                               | discrete_mode LPAREN literal_range RPAREN mode_name : identifierliteral_range : lower_bound COLON upper_boundlower_bound : expressionupper_bound : expressionreference_mode : REF modecomposite_mode : string_mode\n                          | array_modestring_mode : CHARS LBRACKET ICONST RBRACKETarray_mode : ARRAY LBRACKET index_mode_list RBRACKET element_modeindex_mode_list : index_mode\n                           | index_mode_list COMMA index_modeindex_mode : discrete_mode\n                      | literal_rangeelement_mode : modeinteger_expression : expressionlocation : identifier\n                    | dereferenced_reference\n                    | array_element\n                    | array_slice\n                    | call_action dereferenced_reference : location ARROWarray_element : array_location LBRACKET expression_list RBRACKETexpression_list : expression\n                           | expression_list COMMA expressionarray_slice : array_location LBRACKET lower_bound COLON upper_bound RBRACKETarray_location : locationprimitive_value : literal\n                           | value_array_element\n                           | value_array_slice\n                           | parenthesized_expression literal : integer_literal\n                   | boolean_literal\n                   | character_literal\n                   | empty_literal\n                   | character_string_literal integer_literal : ICONSTboolean_literal : FALSE\n                           | TRUEcharacter_literal : CCONST empty_literal : NULLcharacter_string_literal : SCONSTvalue_array_element : array_primitive_value LBRACKET integer_expression RBRACKETvalue_array_slice : array_primitive_value LBRACKET lower_bound COLON upper_bound RBRACKETarray_primitive_value : primitive_valueparenthesized_expression : LPAREN expression RPARENexpression : operand0\n                      | conditional_expressionconditional_expression : IF boolean_expression then_expression else_expression FI\n                                  | IF boolean_expression then_expression elsif_expression else_expression FI boolean_expression : expressionthen_expression : THEN expressionelse_expression : ELSE expressionelsif_expression : ELSIF boolean_expression then_expression\n                            | elsif_expression ELSIF boolean_expression then_expression operand0 :  operand1\n            | operand0 operator1 operand1operator1 :  relational_operator\n            | membership_operatorrelational_operator :  AND\n            | OR\n            | EQUAL\n            | DIFF\n            | GREATER\n            | GREATEREQ\n            | LESS\n            | LESSEQmembership_operator :  INoperand1 :  operand2\n            | operand1 operator2 operand2operator2 :  arithmetic_additive_operator\n                     | string_concatenation_operatorarithmetic_additive_operator :  PLUS\n            | MINUSstring_concatenation_operator :  STRCAToperand2 :  operand3\n            | operand2 arithmetic_multiplicative_operator operand3arithmetic_multiplicative_operator :  TIMES\n            | DIVIDE\n            | MODoperand3 : operand4\n            | monadic_operator operand4monadic_operator :  MINUS\n            | NOToperand4 :  location\n            | referenced_location\n            | primitive_valuereferenced_location :  ARROW locationaction_statement :  action SEMI\n            | label_id COLON action SEMIlabel_id :  identifieraction :  bracketed_action\n            | assignment_action\n            | call_action\n            | exit_action\n            | return_action\n            | result_actionbracketed_action :  if_action\n            | do_actionassignment_action :  location assigning_operator expressionassigning_operator : ASSIGN\n                              | closed_dyadic_operatorclosed_dyadic_operator : INCREASE\n                                  | DECREASE\n                                  | MULCREASE\n                                  | DIVCREASE\n                                  | MODCREASEif_action :  IF boolean_expression then_clause FI\n                     | IF boolean_expression then_clause else_clause FIthen_clause :  THEN\n                       |  THEN action_statement_listaction_statement_list : action_statement\n                                 | action_statement_list action_statementelse_clause :  ELSE\n                        | ELSE action_statement_list\n                        | ELSIF boolean_expression then_clause\n                        | ELSIF boolean_expression then_clause else_clause do_action :  DO OD\n                     |  DO control_part SEMI OD\n                     |  DO action_statement_list OD\n                     |  DO control_part SEMI action_statement_list ODcontrol_part : while_control\n                        | FOR for_control\n                        | FOR for_control while_controlfor_control : iterationiteration : step_enumeration\n                     | range_enumerationstep_enumeration : loop_counter ASSIGN start_value end_value\n                            | loop_counter ASSIGN start_value step_value end_valueloop_counter :  identifierstart_value :  discrete_expressionstep_value :  BY integer_expressionend_value : TO discrete_expression\n                     | DOWN TO discrete_expressiondiscrete_expression : expressionrange_enumeration : loop_counter IN discrete_mode\n                             | loop_counter DOWN IN discrete_modewhile_control :  WHILE boolean_expressioncall_action :  procedure_call\n                        | builtin_callprocedure_call : identifier LPAREN RPAREN\n                          | identifier LPAREN parameter_list RPARENparameter_list :  parameter\n                          |  parameter_list COMMA parameterparameter :  expressionexit_action :  EXIT exit_label_idexit_label_id :  identifierreturn_action :  RETURN\n                         |  RETURN resultresult_action :  RESULT resultresult :  expressionbuiltin_call : builtin_name LPAREN RPAREN\n                        | builtin_name LPAREN parameter_list RPARENbuiltin_name : ABS\n                        | ASC\n                        | NUM\n                        | UPPER\n                        | LOWER\n                        | LENGTH\n                        | READ\n                        | PRINTprocedure_statement :  label_id COLON procedure_definition SEMIprocedure_definition :  formal_procedure_head END\n                                |  formal_procedure_head statement_list ENDformal_procedure_head : PROC parenthesis_gambiarra SEMI\n                                 | PROC parenthesis_gambiarra result_spec SEMIparenthesis_gambiarra : LPAREN RPAREN\n                                 | LPAREN formal_parameter_list RPARENformal_parameter_list :  formal_parameter\n                                 |  formal_parameter_list COMMA formal_parameterformal_parameter :  identifier_list parameter_specparameter_spec :  mode\n                          |  mode LOCresult_spec  :  RETURNS LPAREN mode RPAREN\n                        |  RETURNS LPAREN mode LOC RPAREN'
+_lr_signature = 'programID PLUS MINUS TIMES DIVIDE ASSIGN COMMA COLON SEMI ARROW LPAREN RPAREN LBRACKET RBRACKET LESS LESSEQ GREATER GREATEREQ EQUAL AND OR STRCAT INCREASE DECREASE MULCREASE DIVCREASE MODCREASE DIFF MOD NOT ICONST CCONST SCONST ARRAY BY CHARS DCL DO DOWN ELSE ELSIF END EXIT FI FOR IF IN LOC TYPE OD PROC REF RESULT RETURN RETURNS SYN THEN TO WHILE ABS ASC BOOL CHAR FALSE INT LENGTH LOWER NULL NUM PRINT READ TRUE UPPERprogram : statement_liststatement_list : statement\n                          | statement_list statementstatement : declaration_statement\n                     | synonym_statement\n                     | newmode_statement\n                     | procedure_statement\n                     | action_statementdeclaration_statement : DCL declaration_list SEMIdeclaration_list : declaration\n                            | declaration_list COMMA declarationdeclaration : identifier_list mode\n                       | identifier_list mode initializationinitialization : ASSIGN expressionidentifier_list : identifier\n                           | identifier_list COMMA identifieridentifier : IDsynonym_statement : SYN synonym_list SEMIsynonym_list : synonym_definition\n                        | synonym_list synonym_definitionsynonym_definition : identifier_list ASSIGN constant_expression\n                              | identifier_list mode ASSIGN constant_expressionconstant_expression : expressionnewmode_statement : TYPE newmode_list SEMInewmode_list : mode_definition\n                        | newmode_list COMMA mode_definitionmode_definition : identifier_list ASSIGN modemode : mode_name\n                | discrete_mode\n                | reference_mode\n                | composite_modediscrete_mode : integer_mode\n                | boolean_mode\n                | character_mode\n                | discrete_range_modeinteger_mode : INTboolean_mode : BOOLcharacter_mode : CHARdiscrete_range_mode : identifier LPAREN literal_range RPAREN\n                               | discrete_mode LPAREN literal_range RPAREN mode_name : identifierliteral_range : lower_bound COLON upper_boundlower_bound : expressionupper_bound : expressionreference_mode : REF modecomposite_mode : string_mode\n                          | array_modestring_mode : CHARS LBRACKET ICONST RBRACKETarray_mode : ARRAY LBRACKET index_mode_list RBRACKET element_modeindex_mode_list : index_mode\n                           | index_mode_list COMMA index_modeindex_mode : discrete_mode\n                      | literal_rangeelement_mode : modeinteger_expression : expressionlocation : identifier\n                    | dereferenced_reference\n                    | array_element\n                    | array_slice\n                    | call_action dereferenced_reference : location ARROWarray_element : array_location LBRACKET expression_list RBRACKETexpression_list : expression\n                           | expression_list COMMA expressionarray_slice : array_location LBRACKET lower_bound COLON upper_bound RBRACKETarray_location : locationprimitive_value : literal\n                           | value_array_element\n                           | value_array_slice\n                           | parenthesized_expression literal : integer_literal\n                   | boolean_literal\n                   | character_literal\n                   | empty_literal\n                   | character_string_literal integer_literal : ICONSTboolean_literal : FALSE\n                           | TRUEcharacter_literal : CCONST empty_literal : NULLcharacter_string_literal : SCONSTvalue_array_element : array_primitive_value LBRACKET integer_expression RBRACKETvalue_array_slice : array_primitive_value LBRACKET lower_bound COLON upper_bound RBRACKETarray_primitive_value : primitive_valueparenthesized_expression : LPAREN expression RPARENexpression : operand0\n                      | conditional_expressionconditional_expression : IF boolean_expression then_expression else_expression FI\n                                  | IF boolean_expression then_expression elsif_expression else_expression FI boolean_expression : expressionthen_expression : THEN expressionelse_expression : ELSE expressionelsif_expression : ELSIF boolean_expression then_expression\n                            | elsif_expression ELSIF boolean_expression then_expression operand0 :  operand1\n            | operand0 operator1 operand1operator1 :  relational_operator\n            | membership_operatorrelational_operator :  AND\n            | OR\n            | EQUAL\n            | DIFF\n            | GREATER\n            | GREATEREQ\n            | LESS\n            | LESSEQmembership_operator :  INoperand1 :  operand2\n            | operand1 operator2 operand2operator2 :  arithmetic_additive_operator\n                     | string_concatenation_operatorarithmetic_additive_operator :  PLUS\n            | MINUSstring_concatenation_operator :  STRCAToperand2 :  operand3\n            | operand2 arithmetic_multiplicative_operator operand3arithmetic_multiplicative_operator :  TIMES\n            | DIVIDE\n            | MODoperand3 : operand4\n            | monadic_operator operand4monadic_operator :  MINUS\n            | NOToperand4 :  location\n            | referenced_location\n            | primitive_valuereferenced_location :  ARROW locationaction_statement :  action SEMI\n            | label_id COLON action SEMIlabel_id :  identifieraction :  bracketed_action\n            | assignment_action\n            | call_action\n            | exit_action\n            | return_action\n            | result_actionbracketed_action :  if_action\n            | do_actionassignment_action :  location assigning_operator expressionassigning_operator : ASSIGN\n                              | closed_dyadic_operatorclosed_dyadic_operator : INCREASE\n                                  | DECREASE\n                                  | MULCREASE\n                                  | DIVCREASE\n                                  | MODCREASEif_action :  IF boolean_expression then_clause FI\n                     | IF boolean_expression then_clause else_clause FIthen_clause :  THEN\n                       |  THEN action_statement_listaction_statement_list : action_statement\n                                 | action_statement_list action_statementelse_clause :  ELSE\n                        | ELSE action_statement_list\n                        | ELSIF boolean_expression then_clause\n                        | ELSIF boolean_expression then_clause else_clause do_action :  DO OD\n                     |  DO control_part SEMI OD\n                     |  DO action_statement_list OD\n                     |  DO control_part SEMI action_statement_list ODcontrol_part : while_control\n                        | FOR for_control\n                        | FOR for_control while_controlfor_control : iterationiteration : step_enumeration\n                     | range_enumerationstep_enumeration : loop_counter ASSIGN start_value end_value\n                            | loop_counter ASSIGN start_value step_value end_valueloop_counter :  identifierstart_value :  discrete_expressionstep_value :  BY integer_expressionend_value : TO discrete_expression\n                     | DOWN TO discrete_expressiondiscrete_expression : expressionrange_enumeration : loop_counter IN discrete_mode\n                             | loop_counter DOWN IN discrete_modewhile_control :  WHILE boolean_expressioncall_action :  procedure_call\n                        | builtin_callprocedure_call : identifier LPAREN RPAREN\n                          | identifier LPAREN parameter_list RPARENparameter_list :  parameter\n                          |  parameter_list COMMA parameterparameter :  expressionexit_action :  EXIT exit_label_idexit_label_id :  identifierreturn_action :  RETURN\n                         |  RETURN resultresult_action :  RESULT resultresult :  expressionbuiltin_call : builtin_name LPAREN RPAREN\n                        | builtin_name LPAREN parameter_list RPARENbuiltin_name : ABS\n                        | ASC\n                        | NUM\n                        | UPPER\n                        | LOWER\n                        | LENGTH\n                        | READ\n                        | PRINTprocedure_statement :  label_id COLON procedure_definition SEMIprocedure_definition :  formal_procedure_head END\n                                |  formal_procedure_head statement_list ENDformal_procedure_head : PROC parenthesis_gambiarra SEMI\n                                 | PROC parenthesis_gambiarra result_spec SEMIparenthesis_gambiarra : LPAREN RPAREN\n                                 | LPAREN formal_parameter_list RPARENformal_parameter_list :  formal_parameter\n                                 |  formal_parameter_list COMMA formal_parameterformal_parameter :  identifier_list parameter_specparameter_spec :  mode\n                          |  mode LOCresult_spec  :  RETURNS LPAREN mode RPAREN\n                        |  RETURNS LPAREN mode LOC RPAREN'
     
-_lr_action_items = {'INT':([11,46,48,61,130,191,201,203,212,260,278,288,289,306,],[-17,124,-15,124,124,124,124,-16,124,124,124,124,124,124,]),'DO':([0,5,9,14,16,18,22,23,33,45,51,53,99,100,138,146,148,150,151,188,189,197,213,229,232,234,241,243,273,285,307,],[5,5,-7,-8,-5,-4,-2,-6,5,-128,-151,5,-3,5,-18,-152,5,5,-9,5,-24,5,5,-129,-201,5,5,5,-204,5,-205,]),'SYN':([0,9,14,16,18,22,23,33,45,99,138,151,188,189,229,232,234,273,307,],[2,-7,-8,-5,-4,-2,-6,2,-128,-3,-18,-9,2,-24,-129,-201,2,-204,-205,]),'MOD':([7,8,11,28,29,35,64,65,66,68,71,74,75,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,161,-74,-115,-73,-75,-70,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,161,-85,-62,-181,-56,-82,-65,-83,]),'SEMI':([1,6,7,8,10,11,12,15,21,25,28,29,32,35,36,43,47,49,52,54,56,58,59,60,62,64,65,66,67,68,69,70,71,74,75,77,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,101,102,106,115,117,118,119,120,121,122,124,126,127,128,131,132,134,135,136,139,140,141,142,144,147,149,153,157,169,184,185,187,196,199,204,205,206,209,214,215,217,219,220,221,225,226,230,233,235,236,238,240,245,256,257,261,263,264,266,275,279,280,284,287,292,293,294,299,305,309,312,315,316,320,321,324,326,332,335,336,],[45,-138,-58,-178,-135,-17,-137,-132,-133,-136,-57,-59,-187,-179,-131,-134,-19,138,-161,148,-157,-185,-186,151,-10,-78,-108,-74,-87,-115,-188,-95,-73,-75,-70,-190,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,189,-25,-90,-61,-189,-34,-33,-46,-47,-37,-36,-29,-28,-35,-31,-32,-41,-38,-30,-20,-165,-162,-164,-166,-159,-177,-12,-191,-127,-121,229,232,-180,-139,-45,-23,-21,-163,-158,-11,-13,-192,-116,-109,-96,-85,273,-202,-26,-27,-62,-181,-147,-22,-174,-175,-160,-14,-82,307,-206,-203,-148,-48,-40,-39,-167,-176,-88,-207,-65,-49,-54,-172,-168,-83,-89,-173,-213,-214,]),'SCONST':([32,41,44,55,63,76,78,84,86,97,104,105,108,109,110,111,112,113,114,116,133,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[92,92,92,92,92,-122,-123,92,92,92,92,92,-141,92,-144,-142,-140,-146,-143,-145,92,92,-117,-118,-119,-114,92,-111,-112,-113,-110,92,92,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),'TO':([7,8,11,28,29,35,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,257,258,259,266,295,297,305,312,322,323,324,326,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-174,-170,296,-82,319,296,-88,-65,-171,-55,-83,-89,]),'ICONST':([32,41,44,55,63,76,78,84,86,97,104,105,108,109,110,111,112,113,114,116,133,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,200,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[95,95,95,95,95,-122,-123,95,95,95,95,95,-141,95,-144,-142,-140,-146,-143,-145,95,95,-117,-118,-119,-114,95,-111,-112,-113,-110,95,95,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,246,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'LOWER':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[26,26,-7,-8,-5,-4,-2,-6,26,26,26,26,-128,-151,26,26,26,26,-122,-123,26,26,26,-3,26,26,26,-141,26,-144,-142,-140,-146,-143,-145,26,-18,-152,26,26,-9,26,-117,-118,-119,-114,26,-111,-112,-113,-110,26,26,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,26,-24,26,26,26,26,26,26,26,26,26,26,-129,-201,26,26,26,26,26,26,26,26,26,-204,26,26,26,26,26,26,26,-205,26,]),'PROC':([100,],[186,]),'MULCREASE':([7,8,11,21,28,29,35,40,42,96,115,157,196,219,238,240,312,],[-58,-178,-17,-60,-57,-59,-179,-56,110,-56,-61,-191,-180,-192,-62,-181,-65,]),'NUM':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[30,30,-7,-8,-5,-4,-2,-6,30,30,30,30,-128,-151,30,30,30,30,-122,-123,30,30,30,-3,30,30,30,-141,30,-144,-142,-140,-146,-143,-145,30,-18,-152,30,30,-9,30,-117,-118,-119,-114,30,-111,-112,-113,-110,30,30,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,30,-24,30,30,30,30,30,30,30,30,30,30,-129,-201,30,30,30,30,30,30,30,30,30,-204,30,30,30,30,30,30,30,-205,30,]),'IN':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,143,145,157,169,184,196,211,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,174,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,212,-169,-191,-127,-121,-180,260,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'BY':([7,8,11,28,29,35,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,257,258,259,266,305,312,324,326,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-174,-170,298,-82,-88,-65,-83,-89,]),'CHARS':([11,46,48,61,130,191,203,278,289,306,],[-17,123,-15,123,123,123,-16,123,123,123,]),'FOR':([5,],[50,]),'MODCREASE':([7,8,11,21,28,29,35,40,42,96,115,157,196,219,238,240,312,],[-58,-178,-17,-60,-57,-59,-179,-56,113,-56,-61,-191,-180,-192,-62,-181,-65,]),'ARROW':([7,8,11,21,28,29,32,35,40,41,42,44,55,63,76,78,80,84,86,96,97,98,104,105,108,109,110,111,112,113,114,115,116,133,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,196,201,202,207,208,210,216,218,219,227,237,238,239,240,244,252,267,270,271,288,290,291,296,298,301,312,319,],[-58,-178,-17,-60,-57,-59,73,-179,-56,73,115,73,73,73,-122,-123,-60,73,73,-56,73,115,73,73,-141,73,-144,-142,-140,-146,-143,-61,-145,73,-191,73,-117,-118,-119,-114,73,-111,-112,-113,-110,73,115,73,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,-180,73,73,73,73,73,73,73,-192,73,73,-62,73,-181,73,-56,73,73,73,73,73,73,73,73,73,-65,73,]),'COLON':([7,8,11,28,29,34,35,40,57,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,192,194,196,219,220,221,223,224,225,226,238,240,250,252,253,266,305,312,317,324,326,],[-58,-178,-17,-57,-59,100,-179,-130,150,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-43,239,-180,-192,-116,-109,-43,267,-96,-85,-62,-181,-43,-56,291,-82,-88,-65,-43,-83,-89,]),'ID':([0,2,5,7,8,9,11,14,16,18,20,22,23,27,28,29,32,33,35,38,41,44,45,46,47,48,49,50,51,53,55,61,63,64,65,66,67,68,70,71,73,74,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,105,108,109,110,111,112,113,114,115,116,129,130,133,138,139,146,148,150,151,152,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,184,188,189,190,191,196,197,201,202,203,205,206,207,208,210,212,213,216,218,219,220,221,225,226,227,229,231,232,234,237,238,239,240,241,243,244,256,260,266,267,270,271,273,278,285,288,289,290,291,296,298,301,305,306,307,308,312,319,324,326,],[11,11,11,-58,-178,-7,-17,-8,-5,-4,11,-2,-6,11,-57,-59,11,11,-179,11,11,11,-128,11,-19,-15,11,11,-151,11,11,11,11,-78,-108,-74,-87,-115,-95,-73,11,-75,-70,-122,-123,-86,-60,-126,-80,-77,11,-71,11,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,11,-124,-3,11,11,11,-141,11,-144,-142,-140,-146,-143,-61,-145,11,11,11,-18,-20,-152,11,11,-9,11,-191,11,-117,-118,-119,-114,11,-111,-112,-113,-110,11,-127,11,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,-121,11,-24,11,11,-180,11,11,11,-16,-23,-21,11,11,11,11,11,11,11,-192,-116,-109,-96,-85,11,-129,11,-201,11,11,-62,11,-181,11,11,11,-22,11,-82,11,11,11,-204,11,11,11,11,11,11,11,11,11,-88,11,-205,11,-65,11,-83,-89,]),'LOC':([11,118,119,120,121,122,124,126,127,128,131,132,134,135,136,204,287,292,293,311,315,316,328,],[-17,-34,-33,-46,-47,-37,-36,-29,-28,-35,-31,-32,-41,-38,-30,-45,-48,-40,-39,330,-49,-54,334,]),'LESS':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,171,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'PRINT':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[13,13,-7,-8,-5,-4,-2,-6,13,13,13,13,-128,-151,13,13,13,13,-122,-123,13,13,13,-3,13,13,13,-141,13,-144,-142,-140,-146,-143,-145,13,-18,-152,13,13,-9,13,-117,-118,-119,-114,13,-111,-112,-113,-110,13,13,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,13,-24,13,13,13,13,13,13,13,13,13,13,-129,-201,13,13,13,13,13,13,13,13,13,-204,13,13,13,13,13,13,13,-205,13,]),'OR':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,175,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'DIVIDE':([7,8,11,28,29,35,64,65,66,68,71,74,75,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,160,-74,-115,-73,-75,-70,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,160,-85,-62,-181,-56,-82,-65,-83,]),'CCONST':([32,41,44,55,63,76,78,84,86,97,104,105,108,109,110,111,112,113,114,116,133,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[87,87,87,87,87,-122,-123,87,87,87,87,87,-141,87,-144,-142,-140,-146,-143,-145,87,87,-117,-118,-119,-114,87,-111,-112,-113,-110,87,87,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,]),'MINUS':([7,8,11,28,29,32,35,41,44,55,63,64,65,66,68,70,71,74,75,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,98,104,105,108,109,110,111,112,113,114,115,116,133,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,184,196,201,202,207,208,210,216,218,219,220,221,225,226,227,237,238,239,240,244,252,266,267,270,271,288,290,291,296,298,301,312,319,324,],[-58,-178,-17,-57,-59,76,-179,76,76,76,76,-78,-108,-74,-115,166,-73,-75,-70,-60,-126,-80,-77,76,-71,76,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,76,76,-141,76,-144,-142,-140,-146,-143,-61,-145,76,-191,76,-117,-118,-119,-114,76,-111,-112,-113,-110,76,-127,76,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,-121,-180,76,76,76,76,76,76,76,-192,-116,-109,166,-85,76,76,-62,76,-181,76,-56,-82,76,76,76,76,76,76,76,76,76,-65,76,-83,]),'RBRACKET':([7,8,11,28,29,35,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,118,119,122,124,128,132,135,157,169,184,192,193,196,219,220,221,222,223,225,226,238,240,246,247,248,249,251,266,281,282,283,292,293,300,305,312,314,318,324,326,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-34,-33,-37,-36,-35,-32,-38,-191,-127,-121,-63,238,-180,-192,-116,-109,266,-55,-96,-85,-62,-181,287,-52,-50,289,-53,-82,-64,-44,312,-40,-39,324,-88,-65,-51,-42,-83,-89,]),'GREATER':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,177,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'TIMES':([7,8,11,28,29,35,64,65,66,68,71,74,75,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,159,-74,-115,-73,-75,-70,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,159,-85,-62,-181,-56,-82,-65,-83,]),'LBRACKET':([7,8,11,21,28,29,35,39,40,42,64,66,71,72,74,75,80,81,82,83,85,87,88,89,90,92,94,95,96,98,115,123,125,157,169,196,219,226,238,240,252,266,312,324,],[-58,-178,-17,-60,-57,-59,-179,104,-56,-66,-78,-74,-73,168,-75,-70,-60,-84,-80,-77,-71,-79,-69,-68,-67,-81,-72,-76,-56,-66,-61,200,201,-191,-66,-180,-192,-85,-62,-181,-56,-82,-65,-83,]),'LENGTH':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[17,17,-7,-8,-5,-4,-2,-6,17,17,17,17,-128,-151,17,17,17,17,-122,-123,17,17,17,-3,17,17,17,-141,17,-144,-142,-140,-146,-143,-145,17,-18,-152,17,17,-9,17,-117,-118,-119,-114,17,-111,-112,-113,-110,17,17,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,17,-24,17,17,17,17,17,17,17,17,17,17,-129,-201,17,17,17,17,17,17,17,17,17,-204,17,17,17,17,17,17,17,-205,17,]),'NOT':([32,41,44,55,63,84,86,104,105,108,109,110,111,112,113,114,116,133,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[78,78,78,78,78,78,78,78,78,-141,78,-144,-142,-140,-146,-143,-145,78,78,-117,-118,-119,-114,78,-111,-112,-113,-110,78,78,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'ASC':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[19,19,-7,-8,-5,-4,-2,-6,19,19,19,19,-128,-151,19,19,19,19,-122,-123,19,19,19,-3,19,19,19,-141,19,-144,-142,-140,-146,-143,-145,19,-18,-152,19,19,-9,19,-117,-118,-119,-114,19,-111,-112,-113,-110,19,19,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,19,-24,19,19,19,19,19,19,19,19,19,19,-129,-201,19,19,19,19,19,19,19,19,19,-204,19,19,19,19,19,19,19,-205,19,]),'END':([9,14,16,18,22,23,45,99,138,151,188,189,229,232,234,273,307,],[-7,-8,-5,-4,-2,-6,-128,-3,-18,-9,233,-24,-129,-201,280,-204,-205,]),'EXIT':([0,5,9,14,16,18,22,23,33,45,51,53,99,100,138,146,148,150,151,188,189,197,213,229,232,234,241,243,273,285,307,],[20,20,-7,-8,-5,-4,-2,-6,20,-128,-151,20,-3,20,-18,-152,20,20,-9,20,-24,20,20,-129,-201,20,20,20,-204,20,-205,]),'FI':([7,8,11,28,29,35,45,51,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,146,157,169,184,196,197,198,219,220,221,225,226,229,238,240,241,242,243,266,272,285,302,303,305,312,313,324,326,331,],[-58,-178,-17,-57,-59,-179,-128,-151,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-152,-191,-127,-121,-180,-149,245,-192,-116,-109,-96,-85,-129,-62,-181,-150,284,-153,-82,305,-154,326,-92,-88,-65,-155,-83,-89,-156,]),'BOOL':([11,46,48,61,130,191,201,203,212,260,278,288,289,306,],[-17,122,-15,122,122,122,122,-16,122,122,122,122,122,122,]),'NULL':([32,41,44,55,63,76,78,84,86,97,104,105,108,109,110,111,112,113,114,116,133,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[82,82,82,82,82,-122,-123,82,82,82,82,82,-141,82,-144,-142,-140,-146,-143,-145,82,82,-117,-118,-119,-114,82,-111,-112,-113,-110,82,82,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'DIFF':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,173,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'FALSE':([32,41,44,55,63,76,78,84,86,97,104,105,108,109,110,111,112,113,114,116,133,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[83,83,83,83,83,-122,-123,83,83,83,83,83,-141,83,-144,-142,-140,-146,-143,-145,83,83,-117,-118,-119,-114,83,-111,-112,-113,-110,83,83,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,]),'ABS':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[24,24,-7,-8,-5,-4,-2,-6,24,24,24,24,-128,-151,24,24,24,24,-122,-123,24,24,24,-3,24,24,24,-141,24,-144,-142,-140,-146,-143,-145,24,-18,-152,24,24,-9,24,-117,-118,-119,-114,24,-111,-112,-113,-110,24,24,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,24,-24,24,24,24,24,24,24,24,24,24,24,-129,-201,24,24,24,24,24,24,24,24,24,-204,24,24,24,24,24,24,24,-205,24,]),'LPAREN':([4,11,13,17,19,24,26,30,31,32,37,40,41,44,55,63,76,78,84,86,96,97,104,105,108,109,110,111,112,113,114,116,118,119,122,124,126,128,132,133,134,135,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,186,201,202,207,208,210,216,218,227,237,239,244,247,252,261,262,267,270,271,274,288,290,291,292,293,296,298,299,301,319,],[-199,-17,-200,-198,-194,-193,-197,-195,63,84,-196,105,84,84,84,84,-122,-123,84,84,105,84,84,84,-141,84,-144,-142,-140,-146,-143,-145,-34,-33,-37,-36,202,-35,-32,84,207,-38,84,-117,-118,-119,-114,84,-111,-112,-113,-110,84,84,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,231,84,84,84,84,84,84,84,84,84,84,84,202,290,202,207,84,84,84,306,84,84,84,-40,-39,84,84,202,84,84,]),'READ':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[4,4,-7,-8,-5,-4,-2,-6,4,4,4,4,-128,-151,4,4,4,4,-122,-123,4,4,4,-3,4,4,4,-141,4,-144,-142,-140,-146,-143,-145,4,-18,-152,4,4,-9,4,-117,-118,-119,-114,4,-111,-112,-113,-110,4,4,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,4,-24,4,4,4,4,4,4,4,4,4,4,-129,-201,4,4,4,4,4,4,4,4,4,-204,4,4,4,4,4,4,4,-205,4,]),'THEN':([7,8,11,28,29,35,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,106,107,115,157,169,183,184,196,219,220,221,225,226,238,240,266,286,304,305,312,324,325,326,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-90,197,-61,-191,-127,227,-121,-180,-192,-116,-109,-96,-85,-62,-181,-82,197,227,-88,-65,-83,227,-89,]),'AND':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,178,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'DCL':([0,9,14,16,18,22,23,33,45,99,138,151,188,189,229,232,234,273,307,],[27,-7,-8,-5,-4,-2,-6,27,-128,-3,-18,-9,27,-24,-129,-201,27,-204,-205,]),'STRCAT':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,162,-73,-75,-70,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,162,-85,-62,-181,-56,-82,-65,-83,]),'GREATEREQ':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,179,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'OD':([5,45,51,53,146,148,213,229,],[56,-128,-151,147,-152,214,263,-129,]),'RPAREN':([7,8,11,28,29,35,63,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,105,115,118,119,120,121,122,124,126,127,128,131,132,134,135,136,154,155,156,157,169,182,184,195,196,204,219,220,221,225,226,231,238,240,254,255,265,266,276,277,282,287,290,292,293,305,310,311,312,315,316,317,318,324,326,328,329,330,334,],[-58,-178,-17,-57,-59,-179,157,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,196,-61,-34,-33,-46,-47,-37,-36,-29,-28,-35,-31,-32,-41,-38,-30,219,-184,-182,-191,-127,226,-121,240,-180,-45,-192,-116,-109,-96,-85,279,-62,-181,292,293,-183,-82,-208,309,-44,-48,196,-40,-39,-88,-210,-211,-65,-49,-54,-184,-42,-83,-89,335,-209,-212,336,]),'DIVCREASE':([7,8,11,21,28,29,35,40,42,96,115,157,196,219,238,240,312,],[-58,-178,-17,-60,-57,-59,-179,-56,116,-56,-61,-191,-180,-192,-62,-181,-65,]),'ARRAY':([11,46,48,61,130,191,203,278,289,306,],[-17,125,-15,125,125,125,-16,125,125,125,]),'RETURN':([0,5,9,14,16,18,22,23,33,45,51,53,99,100,138,146,148,150,151,188,189,197,213,229,232,234,241,243,273,285,307,],[32,32,-7,-8,-5,-4,-2,-6,32,-128,-151,32,-3,32,-18,-152,32,32,-9,32,-24,32,32,-129,-201,32,32,32,-204,32,-205,]),'PLUS':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,165,-73,-75,-70,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,165,-85,-62,-181,-56,-82,-65,-83,]),'TRUE':([32,41,44,55,63,76,78,84,86,97,104,105,108,109,110,111,112,113,114,116,133,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[64,64,64,64,64,-122,-123,64,64,64,64,64,-141,64,-144,-142,-140,-146,-143,-145,64,64,-117,-118,-119,-114,64,-111,-112,-113,-110,64,64,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'RETURNS':([230,279,309,],[274,-206,-207,]),'LESSEQ':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,172,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'COMMA':([7,8,11,28,29,35,46,48,60,61,62,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,101,102,103,115,118,119,120,121,122,124,126,127,128,131,132,134,135,136,153,154,155,156,157,169,184,192,193,195,196,203,204,215,217,219,220,221,225,226,235,236,238,240,247,248,249,251,264,265,266,276,277,278,281,282,287,292,293,305,310,311,312,314,315,316,317,318,324,326,329,330,],[-58,-178,-17,-57,-59,-179,129,-15,152,129,-10,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,190,-25,129,-61,-34,-33,-46,-47,-37,-36,-29,-28,-35,-31,-32,-41,-38,-30,-12,218,-184,-182,-191,-127,-121,-63,237,218,-180,-16,-45,-11,-13,-192,-116,-109,-96,-85,-26,-27,-62,-181,-52,-50,288,-53,-14,-183,-82,-208,308,129,-64,-44,-48,-40,-39,-88,-210,-211,-65,-51,-49,-54,-184,-42,-83,-89,-209,-212,]),'REF':([11,46,48,61,130,191,203,278,289,306,],[-17,130,-15,130,130,130,-16,130,130,130,]),'INCREASE':([7,8,11,21,28,29,35,40,42,96,115,157,196,219,238,240,312,],[-58,-178,-17,-60,-57,-59,-179,-56,111,-56,-61,-191,-180,-192,-62,-181,-65,]),'UPPER':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,73,76,78,84,86,97,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,158,159,160,161,162,163,164,165,166,167,168,170,171,172,173,174,175,176,177,178,179,180,181,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[37,37,-7,-8,-5,-4,-2,-6,37,37,37,37,-128,-151,37,37,37,37,-122,-123,37,37,37,-3,37,37,37,-141,37,-144,-142,-140,-146,-143,-145,37,-18,-152,37,37,-9,37,-117,-118,-119,-114,37,-111,-112,-113,-110,37,37,-105,-106,-102,-107,-100,-101,-103,-99,-104,-97,-98,37,-24,37,37,37,37,37,37,37,37,37,37,-129,-201,37,37,37,37,37,37,37,37,37,-204,37,37,37,37,37,37,37,-205,37,]),'TYPE':([0,9,14,16,18,22,23,33,45,99,138,151,188,189,229,232,234,273,307,],[38,-7,-8,-5,-4,-2,-6,38,-128,-3,-18,-9,38,-24,-129,-201,38,-204,-205,]),'EQUAL':([7,8,11,28,29,35,64,65,66,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,157,169,184,196,219,220,221,225,226,238,240,252,266,312,324,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-115,-95,-73,-75,-70,176,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-56,-82,-65,-83,]),'ASSIGN':([7,8,11,21,28,29,35,40,42,46,48,96,103,115,118,119,120,121,122,124,126,127,128,131,132,134,135,136,137,143,145,153,157,196,203,204,219,238,240,287,292,293,312,315,316,],[-58,-178,-17,-60,-57,-59,-179,-56,112,133,-15,-56,191,-61,-34,-33,-46,-47,-37,-36,-29,-28,-35,-31,-32,-41,-38,-30,208,210,-169,216,-191,-180,-16,-45,-192,-62,-181,-48,-40,-39,-65,-49,-54,]),'DOWN':([7,8,11,28,29,35,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,143,145,157,169,184,196,219,220,221,225,226,238,240,257,258,259,266,297,305,312,322,323,324,326,],[-58,-178,-17,-57,-59,-179,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,211,-169,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-174,-170,295,-82,295,-88,-65,-171,-55,-83,-89,]),'$end':([3,9,14,16,18,22,23,33,45,99,138,151,189,229,232,],[0,-7,-8,-5,-4,-2,-6,-1,-128,-3,-18,-9,-24,-129,-201,]),'DECREASE':([7,8,11,21,28,29,35,40,42,96,115,157,196,219,238,240,312,],[-58,-178,-17,-60,-57,-59,-179,-56,114,-56,-61,-191,-180,-192,-62,-181,-65,]),'ELSE':([7,8,11,28,29,35,45,51,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,146,157,169,184,196,197,198,219,220,221,225,226,228,229,238,240,241,266,268,269,305,312,313,324,326,327,333,],[-58,-178,-17,-57,-59,-179,-128,-151,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-152,-191,-127,-121,-180,-149,243,-192,-116,-109,-96,-85,270,-129,-62,-181,-150,-82,-91,270,-88,-65,243,-83,-89,-93,-94,]),'CHAR':([11,46,48,61,130,191,201,203,212,260,278,288,289,306,],[-17,135,-15,135,135,135,135,-16,135,135,135,135,135,135,]),'WHILE':([5,7,8,11,28,29,35,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,118,119,122,124,128,132,135,140,141,142,144,157,169,184,196,219,220,221,225,226,238,240,257,261,266,292,293,294,299,305,312,320,321,324,326,332,],[55,-58,-178,-17,-57,-59,-179,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-34,-33,-37,-36,-35,-32,-38,-165,55,-164,-166,-191,-127,-121,-180,-192,-116,-109,-96,-85,-62,-181,-174,-175,-82,-40,-39,-167,-176,-88,-65,-172,-168,-83,-89,-173,]),'IF':([0,5,9,14,16,18,22,23,32,33,41,44,45,51,53,55,63,84,86,99,100,104,105,108,109,110,111,112,113,114,116,133,138,146,148,150,151,168,188,189,197,201,202,207,208,210,213,216,218,227,229,232,234,237,239,241,243,244,267,270,271,273,285,288,290,291,296,298,301,307,319,],[41,41,-7,-8,-5,-4,-2,-6,86,41,86,86,-128,-151,41,86,86,86,86,-3,41,86,86,-141,86,-144,-142,-140,-146,-143,-145,86,-18,-152,41,41,-9,86,41,-24,41,86,86,86,86,86,41,86,86,86,-129,-201,41,86,86,41,41,86,86,86,86,-204,41,86,86,86,86,86,86,-205,86,]),'ELSIF':([7,8,11,28,29,35,45,51,64,65,66,67,68,70,71,74,75,79,80,81,82,83,85,87,88,89,90,91,92,93,94,95,96,98,115,146,157,169,184,196,197,198,219,220,221,225,226,228,229,238,240,241,266,268,269,305,312,313,324,326,327,333,],[-58,-178,-17,-57,-59,-179,-128,-151,-78,-108,-74,-87,-115,-95,-73,-75,-70,-86,-60,-126,-80,-77,-71,-79,-69,-68,-67,-120,-81,-125,-72,-76,-56,-124,-61,-152,-191,-127,-121,-180,-149,244,-192,-116,-109,-96,-85,271,-129,-62,-181,-150,-82,-91,301,-88,-65,244,-83,-89,-93,-94,]),'RESULT':([0,5,9,14,16,18,22,23,33,45,51,53,99,100,138,146,148,150,151,188,189,197,213,229,232,234,241,243,273,285,307,],[44,44,-7,-8,-5,-4,-2,-6,44,-128,-151,44,-3,44,-18,-152,44,44,-9,44,-24,44,44,-129,-201,44,44,44,-204,44,-205,]),}
+_lr_action_items = {'DCL':([0,2,3,4,5,6,7,8,45,57,118,139,143,148,214,215,217,259,294,],[9,9,-2,-4,-5,-6,-7,-8,-3,-128,-9,-18,-24,9,-201,-129,9,-204,-205,]),'SYN':([0,2,3,4,5,6,7,8,45,57,118,139,143,148,214,215,217,259,294,],[10,10,-2,-4,-5,-6,-7,-8,-3,-128,-9,-18,-24,10,-201,-129,10,-204,-205,]),'TYPE':([0,2,3,4,5,6,7,8,45,57,118,139,143,148,214,215,217,259,294,],[11,11,-2,-4,-5,-6,-7,-8,-3,-128,-9,-18,-24,11,-201,-129,11,-204,-205,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,21,25,26,27,28,29,30,31,32,33,34,45,48,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,98,99,100,101,102,103,104,110,112,113,114,116,117,118,119,121,131,139,140,141,143,144,145,148,150,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,178,179,180,183,184,186,194,195,202,203,204,205,208,209,210,211,214,215,217,219,220,221,222,223,225,226,230,233,234,235,237,239,240,242,243,244,245,257,259,265,269,270,272,273,275,283,288,291,292,293,294,295,297,300,302,309,311,313,322,325,329,],[21,21,-2,-4,-5,-6,-7,-8,21,21,21,-17,-178,-179,21,21,21,21,21,-57,-58,-59,-3,21,-15,21,-19,21,21,-128,21,21,-61,-140,-141,-142,-143,-144,-145,-146,-86,-87,-95,21,-108,-115,-120,21,-124,-125,-126,-122,-123,-56,-60,21,-67,-68,-69,-70,-71,-72,-73,-74,-75,21,-76,-77,-78,-79,-80,-81,21,21,-151,21,21,21,-9,21,21,21,-18,-20,21,-24,21,21,21,-180,21,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,21,-110,-111,-112,-113,-114,21,-117,-118,-119,-121,-127,21,21,21,-152,21,-191,21,-16,21,21,21,-21,-23,21,-201,-129,21,21,-181,21,-96,-109,21,-116,-85,21,21,21,21,21,21,-192,-62,21,21,-22,-204,21,21,21,-82,21,21,21,21,21,21,21,-205,21,21,-88,21,21,21,-65,-89,-83,21,]),'EXIT':([0,2,3,4,5,6,7,8,31,45,56,57,110,113,118,139,143,148,183,184,186,194,214,215,217,233,235,237,259,275,294,],[27,27,-2,-4,-5,-6,-7,-8,27,-3,27,-128,27,-151,-9,-18,-24,27,27,27,-152,27,-201,-129,27,27,27,27,-204,27,-205,]),'RETURN':([0,2,3,4,5,6,7,8,31,45,56,57,110,113,118,139,143,148,183,184,186,194,214,215,217,233,235,237,259,275,294,],[28,28,-2,-4,-5,-6,-7,-8,28,-3,28,-128,28,-151,-9,-18,-24,28,28,28,-152,28,-201,-129,28,28,28,28,-204,28,-205,]),'RESULT':([0,2,3,4,5,6,7,8,31,45,56,57,110,113,118,139,143,148,183,184,186,194,214,215,217,233,235,237,259,275,294,],[29,29,-2,-4,-5,-6,-7,-8,29,-3,29,-128,29,-151,-9,-18,-24,29,29,29,-152,29,-201,-129,29,29,29,29,-204,29,-205,]),'IF':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,98,110,113,114,116,117,118,139,141,143,148,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[30,30,-2,-4,-5,-6,-7,-8,75,75,75,30,-3,30,-128,75,75,-140,-141,-142,-143,-144,-145,-146,75,75,30,-151,75,75,75,-9,-18,75,-24,30,75,30,30,-152,30,75,75,75,75,75,-201,-129,30,75,75,30,75,30,30,75,75,75,-204,75,75,75,30,75,75,75,-205,75,75,75,75,]),'DO':([0,2,3,4,5,6,7,8,31,45,56,57,110,113,118,139,143,148,183,184,186,194,214,215,217,233,235,237,259,275,294,],[31,31,-2,-4,-5,-6,-7,-8,31,-3,31,-128,31,-151,-9,-18,-24,31,31,31,-152,31,-201,-129,31,31,31,31,-204,31,-205,]),'ABS':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[37,37,-2,-4,-5,-6,-7,-8,37,37,37,37,-3,37,-128,37,37,-140,-141,-142,-143,-144,-145,-146,37,37,-122,-123,37,37,37,-151,37,37,37,-9,-18,37,-24,37,37,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,37,-110,-111,-112,-113,-114,37,-117,-118,-119,37,37,37,-152,37,37,37,37,37,37,-201,-129,37,37,37,37,37,37,37,37,37,37,-204,37,37,37,37,37,37,37,-205,37,37,37,37,]),'ASC':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[38,38,-2,-4,-5,-6,-7,-8,38,38,38,38,-3,38,-128,38,38,-140,-141,-142,-143,-144,-145,-146,38,38,-122,-123,38,38,38,-151,38,38,38,-9,-18,38,-24,38,38,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,38,-110,-111,-112,-113,-114,38,-117,-118,-119,38,38,38,-152,38,38,38,38,38,38,-201,-129,38,38,38,38,38,38,38,38,38,38,-204,38,38,38,38,38,38,38,-205,38,38,38,38,]),'NUM':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[39,39,-2,-4,-5,-6,-7,-8,39,39,39,39,-3,39,-128,39,39,-140,-141,-142,-143,-144,-145,-146,39,39,-122,-123,39,39,39,-151,39,39,39,-9,-18,39,-24,39,39,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,39,-110,-111,-112,-113,-114,39,-117,-118,-119,39,39,39,-152,39,39,39,39,39,39,-201,-129,39,39,39,39,39,39,39,39,39,39,-204,39,39,39,39,39,39,39,-205,39,39,39,39,]),'UPPER':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[40,40,-2,-4,-5,-6,-7,-8,40,40,40,40,-3,40,-128,40,40,-140,-141,-142,-143,-144,-145,-146,40,40,-122,-123,40,40,40,-151,40,40,40,-9,-18,40,-24,40,40,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,40,-110,-111,-112,-113,-114,40,-117,-118,-119,40,40,40,-152,40,40,40,40,40,40,-201,-129,40,40,40,40,40,40,40,40,40,40,-204,40,40,40,40,40,40,40,-205,40,40,40,40,]),'LOWER':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[41,41,-2,-4,-5,-6,-7,-8,41,41,41,41,-3,41,-128,41,41,-140,-141,-142,-143,-144,-145,-146,41,41,-122,-123,41,41,41,-151,41,41,41,-9,-18,41,-24,41,41,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,41,-110,-111,-112,-113,-114,41,-117,-118,-119,41,41,41,-152,41,41,41,41,41,41,-201,-129,41,41,41,41,41,41,41,41,41,41,-204,41,41,41,41,41,41,41,-205,41,41,41,41,]),'LENGTH':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[42,42,-2,-4,-5,-6,-7,-8,42,42,42,42,-3,42,-128,42,42,-140,-141,-142,-143,-144,-145,-146,42,42,-122,-123,42,42,42,-151,42,42,42,-9,-18,42,-24,42,42,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,42,-110,-111,-112,-113,-114,42,-117,-118,-119,42,42,42,-152,42,42,42,42,42,42,-201,-129,42,42,42,42,42,42,42,42,42,42,-204,42,42,42,42,42,42,42,-205,42,42,42,42,]),'READ':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[43,43,-2,-4,-5,-6,-7,-8,43,43,43,43,-3,43,-128,43,43,-140,-141,-142,-143,-144,-145,-146,43,43,-122,-123,43,43,43,-151,43,43,43,-9,-18,43,-24,43,43,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,43,-110,-111,-112,-113,-114,43,-117,-118,-119,43,43,43,-152,43,43,43,43,43,43,-201,-129,43,43,43,43,43,43,43,43,43,43,-204,43,43,43,43,43,43,43,-205,43,43,43,43,]),'PRINT':([0,2,3,4,5,6,7,8,28,29,30,31,45,56,57,58,59,61,62,63,64,65,66,67,75,79,83,84,87,98,110,113,114,116,117,118,139,141,143,148,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,183,184,186,194,202,204,205,208,211,214,215,217,221,225,233,234,235,237,239,244,245,259,269,270,273,275,288,292,293,294,302,309,311,329,],[44,44,-2,-4,-5,-6,-7,-8,44,44,44,44,-3,44,-128,44,44,-140,-141,-142,-143,-144,-145,-146,44,44,-122,-123,44,44,44,-151,44,44,44,-9,-18,44,-24,44,44,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,44,-110,-111,-112,-113,-114,44,-117,-118,-119,44,44,44,-152,44,44,44,44,44,44,-201,-129,44,44,44,44,44,44,44,44,44,44,-204,44,44,44,44,44,44,44,-205,44,44,44,44,]),'$end':([1,2,3,4,5,6,7,8,45,57,118,139,143,214,215,],[0,-1,-2,-4,-5,-6,-7,-8,-3,-128,-9,-18,-24,-201,-129,]),'END':([3,4,5,6,7,8,45,57,118,139,143,148,214,215,217,259,294,],[-2,-4,-5,-6,-7,-8,-3,-128,-9,-18,-24,216,-201,-129,258,-204,-205,]),'COLON':([12,14,21,25,26,32,33,34,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,115,150,178,179,195,198,199,220,222,223,226,228,229,230,242,243,248,249,256,272,300,313,318,322,325,],[56,-130,-17,-178,-179,-57,-58,-59,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,194,-180,-121,-127,-191,245,-43,-181,-96,-109,-116,273,-43,-85,-192,-62,288,-43,-56,-82,-88,-65,-43,-89,-83,]),'SEMI':([13,15,16,17,18,19,20,21,22,23,25,26,28,32,33,34,46,47,50,51,53,54,60,68,69,70,71,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,105,107,108,109,111,120,122,123,124,125,126,127,128,129,130,132,133,134,135,136,140,146,147,150,154,178,179,185,187,188,189,190,193,195,200,201,206,209,210,212,213,216,218,220,222,223,226,230,231,236,238,242,243,246,257,258,260,262,272,274,277,280,281,287,289,290,296,300,307,312,313,315,316,322,325,327,328,332,335,336,],[57,-131,-132,-133,-134,-135,-136,-17,-137,-138,-178,-179,-187,-57,-58,-59,118,-10,139,-19,143,-25,-61,-185,-186,-188,-190,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-189,-90,-157,184,-161,-12,-41,-28,-29,-30,-31,-32,-33,-34,-35,-46,-47,-36,-37,-38,-20,214,215,-180,-139,-121,-127,-159,-162,-164,-165,-166,-177,-191,-11,-13,-45,-21,-23,-26,-27,-202,259,-181,-96,-109,-116,-85,-147,-158,-163,-192,-62,-14,-22,-203,294,-206,-82,-148,-160,-174,-175,-39,-40,-48,-207,-88,-167,-176,-65,-49,-54,-89,-83,-168,-172,-213,-173,-214,]),'ARROW':([14,17,21,24,25,26,28,29,30,32,33,34,58,59,60,61,62,63,64,65,66,67,75,79,80,83,84,85,86,98,114,116,117,141,150,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,179,180,195,202,204,205,208,211,220,221,225,234,239,242,243,244,245,256,269,270,273,288,292,293,302,309,311,313,329,],[-56,-60,-17,60,-178,-179,87,87,87,-57,-58,-59,87,87,-61,-140,-141,-142,-143,-144,-145,-146,87,87,60,-122,-123,-56,-60,87,87,87,87,87,-180,87,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,87,-110,-111,-112,-113,-114,87,-117,-118,-119,60,87,-191,87,87,87,87,87,-181,87,87,87,87,-192,-62,87,87,-56,87,87,87,87,87,87,87,87,87,-65,87,]),'ASSIGN':([14,17,21,24,25,26,32,33,34,49,52,55,60,85,120,122,123,124,125,126,127,128,129,130,132,133,134,135,136,142,150,191,192,195,203,206,220,242,243,287,289,290,313,315,316,],[-56,-60,-17,61,-178,-179,-57,-58,-59,-15,141,145,-61,-56,202,-41,-28,-29,-30,-31,-32,-33,-34,-35,-46,-47,-36,-37,-38,211,-180,239,-169,-191,-16,-45,-181,-192,-62,-39,-40,-48,-65,-49,-54,]),'INCREASE':([14,17,21,24,25,26,32,33,34,60,85,150,195,220,242,243,313,],[-56,-60,-17,63,-178,-179,-57,-58,-59,-61,-56,-180,-191,-181,-192,-62,-65,]),'DECREASE':([14,17,21,24,25,26,32,33,34,60,85,150,195,220,242,243,313,],[-56,-60,-17,64,-178,-179,-57,-58,-59,-61,-56,-180,-191,-181,-192,-62,-65,]),'MULCREASE':([14,17,21,24,25,26,32,33,34,60,85,150,195,220,242,243,313,],[-56,-60,-17,65,-178,-179,-57,-58,-59,-61,-56,-180,-191,-181,-192,-62,-65,]),'DIVCREASE':([14,17,21,24,25,26,32,33,34,60,85,150,195,220,242,243,313,],[-56,-60,-17,66,-178,-179,-57,-58,-59,-61,-56,-180,-191,-181,-192,-62,-65,]),'MODCREASE':([14,17,21,24,25,26,32,33,34,60,85,150,195,220,242,243,313,],[-56,-60,-17,67,-178,-179,-57,-58,-59,-61,-56,-180,-191,-181,-192,-62,-65,]),'LBRACKET':([14,17,21,24,25,26,32,33,34,36,60,80,82,85,86,88,89,90,91,92,93,94,95,96,97,99,100,101,102,103,104,137,138,150,179,195,220,230,242,243,256,272,313,325,],[-56,-60,-17,-66,-178,-179,-57,-58,-59,117,-61,-66,-84,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,180,-76,-77,-78,-79,-80,-81,207,208,-180,-66,-191,-181,-85,-192,-62,-56,-82,-65,-83,]),'LPAREN':([14,21,28,29,30,35,37,38,39,40,41,42,43,44,58,59,61,62,63,64,65,66,67,75,79,83,84,85,98,114,116,117,122,124,127,128,129,130,134,135,136,141,149,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,208,211,221,225,234,239,244,245,254,256,261,269,270,273,281,282,287,288,289,292,293,302,309,311,312,329,],[58,-17,98,98,98,116,-193,-194,-195,-196,-197,-198,-199,-200,98,98,-140,-141,-142,-143,-144,-145,-146,98,98,-122,-123,58,98,98,98,98,204,205,-32,-33,-34,-35,-36,-37,-38,98,219,98,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,98,-110,-111,-112,-113,-114,98,-117,-118,-119,98,98,98,98,98,98,98,98,98,98,98,98,205,293,295,98,98,98,205,204,-39,98,-40,98,98,98,98,98,205,98,]),'COMMA':([21,25,26,32,33,34,46,47,48,49,52,53,54,55,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,120,122,123,124,125,126,127,128,129,130,132,133,134,135,136,150,151,152,153,178,179,195,196,197,199,200,201,203,206,212,213,220,222,223,226,230,242,243,246,252,253,254,255,263,264,265,266,272,284,286,287,289,290,298,299,300,313,314,315,316,317,318,320,321,322,325,],[-17,-178,-179,-57,-58,-59,119,-10,121,-15,121,144,-25,121,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-12,-41,-28,-29,-30,-31,-32,-33,-34,-35,-46,-47,-36,-37,-38,-180,221,-182,-184,-121,-127,-191,221,244,-63,-11,-13,-16,-45,-26,-27,-181,-96,-109,-116,-85,-192,-62,-14,292,-50,-52,-53,297,-208,121,-183,-82,-64,-44,-39,-40,-48,-210,-211,-88,-65,-42,-49,-54,-51,-184,-209,-212,-89,-83,]),'REF':([21,48,49,52,131,145,203,265,291,295,],[-17,131,-15,131,131,131,-16,131,131,131,]),'INT':([21,48,49,52,131,145,203,208,240,265,283,291,292,295,],[-17,134,-15,134,134,134,-16,134,134,134,134,134,134,134,]),'BOOL':([21,48,49,52,131,145,203,208,240,265,283,291,292,295,],[-17,135,-15,135,135,135,-16,135,135,135,135,135,135,135,]),'CHAR':([21,48,49,52,131,145,203,208,240,265,283,291,292,295,],[-17,136,-15,136,136,136,-16,136,136,136,136,136,136,136,]),'CHARS':([21,48,49,52,131,145,203,265,291,295,],[-17,137,-15,137,137,137,-16,137,137,137,]),'ARRAY':([21,48,49,52,131,145,203,265,291,295,],[-17,138,-15,138,138,138,-16,138,138,138,]),'TIMES':([21,25,26,32,33,34,60,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,175,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,175,-116,-85,-192,-62,-56,-82,-65,-83,]),'DIVIDE':([21,25,26,32,33,34,60,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,176,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,176,-116,-85,-192,-62,-56,-82,-65,-83,]),'MOD':([21,25,26,32,33,34,60,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,177,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,177,-116,-85,-192,-62,-56,-82,-65,-83,]),'PLUS':([21,25,26,32,33,34,60,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,170,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,170,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'MINUS':([21,25,26,28,29,30,32,33,34,58,59,60,61,62,63,64,65,66,67,74,75,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,98,99,100,101,102,103,104,114,116,117,141,150,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,178,179,180,195,202,204,205,208,211,220,221,222,223,225,226,230,234,239,242,243,244,245,256,269,270,272,273,288,292,293,302,309,311,313,325,329,],[-17,-178,-179,83,83,83,-57,-58,-59,83,83,-61,-140,-141,-142,-143,-144,-145,-146,171,83,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,83,-76,-77,-78,-79,-80,-81,83,83,83,83,-180,83,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,83,-110,-111,-112,-113,-114,83,-117,-118,-119,-121,-127,83,-191,83,83,83,83,83,-181,83,171,-109,83,-116,-85,83,83,-192,-62,83,83,-56,83,83,-82,83,83,83,83,83,83,83,-65,-83,83,]),'STRCAT':([21,25,26,32,33,34,60,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,172,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,172,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'AND':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,158,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'OR':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,159,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'EQUAL':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,160,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'DIFF':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,161,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'GREATER':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,162,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'GREATEREQ':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,163,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'LESS':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,164,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'LESSEQ':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,165,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-56,-82,-65,-83,]),'IN':([21,25,26,32,33,34,60,72,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,191,192,195,220,222,223,226,230,241,242,243,256,272,313,325,],[-17,-178,-179,-57,-58,-59,-61,166,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,240,-169,-191,-181,-96,-109,-116,-85,283,-192,-62,-56,-82,-65,-83,]),'THEN':([21,25,26,32,33,34,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,106,107,150,173,178,179,195,220,222,223,226,230,242,243,272,276,300,304,313,322,323,325,],[-17,-178,-179,-57,-58,-59,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,183,-90,-180,225,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-82,183,-88,225,-65,-89,225,-83,]),'RPAREN':([21,25,26,32,33,34,58,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,116,122,123,124,125,126,127,128,129,130,132,133,134,135,136,150,151,152,153,178,179,181,195,196,206,219,220,222,223,226,230,242,243,247,250,263,264,266,272,286,287,289,290,293,298,299,300,313,314,315,316,318,319,320,321,322,325,333,],[-17,-178,-179,-57,-58,-59,150,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,195,-41,-28,-29,-30,-31,-32,-33,-34,-35,-46,-47,-36,-37,-38,-180,220,-182,-184,-121,-127,230,-191,242,-45,262,-181,-96,-109,-116,-85,-192,-62,287,289,296,-208,-183,-82,-44,-39,-40,-48,150,-210,-211,-88,-65,-42,-49,-54,-184,332,-209,-212,-89,-83,336,]),'RBRACKET':([21,25,26,32,33,34,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,127,128,129,130,134,135,136,150,178,179,195,197,199,220,222,223,226,227,229,230,242,243,251,252,253,254,255,272,284,285,286,287,289,300,305,313,314,317,322,325,],[-17,-178,-179,-57,-58,-59,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-32,-33,-34,-35,-36,-37,-38,-180,-121,-127,-191,243,-63,-181,-96,-109,-116,272,-55,-85,-192,-62,290,291,-50,-52,-53,-82,-64,313,-44,-39,-40,-88,325,-65,-42,-51,-89,-83,]),'ELSE':([21,25,26,32,33,34,57,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,113,150,178,179,182,183,186,195,215,220,222,223,224,226,230,235,242,243,268,271,272,300,306,313,322,324,325,334,],[-17,-178,-179,-57,-58,-59,-128,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-151,-180,-121,-127,233,-149,-152,-191,-129,-181,-96,-109,269,-116,-85,-150,-192,-62,269,-91,-82,-88,233,-65,-89,-93,-83,-94,]),'ELSIF':([21,25,26,32,33,34,57,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,113,150,178,179,182,183,186,195,215,220,222,223,224,226,230,235,242,243,268,271,272,300,306,313,322,324,325,334,],[-17,-178,-179,-57,-58,-59,-128,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-151,-180,-121,-127,234,-149,-152,-191,-129,-181,-96,-109,270,-116,-85,-150,-192,-62,302,-91,-82,-88,234,-65,-89,-93,-83,-94,]),'TO':([21,25,26,32,33,34,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,272,278,279,280,300,308,310,313,322,325,330,331,],[-17,-178,-179,-57,-58,-59,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-82,309,-170,-174,-88,309,329,-65,-89,-83,-171,-55,]),'DOWN':([21,25,26,32,33,34,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,191,192,195,220,222,223,226,230,242,243,272,278,279,280,300,308,313,322,325,330,331,],[-17,-178,-179,-57,-58,-59,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,241,-169,-191,-181,-96,-109,-116,-85,-192,-62,-82,310,-170,-174,-88,310,-65,-89,-83,-171,-55,]),'BY':([21,25,26,32,33,34,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,150,178,179,195,220,222,223,226,230,242,243,272,278,279,280,300,313,322,325,],[-17,-178,-179,-57,-58,-59,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-180,-121,-127,-191,-181,-96,-109,-116,-85,-192,-62,-82,311,-170,-174,-88,-65,-89,-83,]),'FI':([21,25,26,32,33,34,57,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,113,150,178,179,182,183,186,195,215,220,222,223,226,230,232,233,235,242,243,267,272,275,300,301,303,306,313,322,325,326,],[-17,-178,-179,-57,-58,-59,-128,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-151,-180,-121,-127,231,-149,-152,-191,-129,-181,-96,-109,-116,-85,274,-153,-150,-192,-62,300,-82,-154,-88,322,-92,-155,-65,-89,-83,-156,]),'WHILE':([21,25,26,31,32,33,34,60,72,73,74,76,77,78,80,81,82,85,86,88,89,90,91,92,93,94,95,96,99,100,101,102,103,104,127,128,129,130,134,135,136,150,178,179,187,188,189,190,195,220,222,223,226,230,242,243,272,280,281,287,289,300,307,312,313,322,325,327,328,335,],[-17,-178,-179,114,-57,-58,-59,-61,-86,-87,-95,-108,-115,-120,-124,-125,-126,-56,-60,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-32,-33,-34,-35,-36,-37,-38,-180,-121,-127,114,-164,-165,-166,-191,-181,-96,-109,-116,-85,-192,-62,-82,-174,-175,-39,-40,-88,-167,-176,-65,-89,-83,-168,-172,-173,]),'LOC':([21,122,123,124,125,126,127,128,129,130,132,133,134,135,136,206,287,289,290,299,315,316,319,],[-17,-41,-28,-29,-30,-31,-32,-33,-34,-35,-46,-47,-36,-37,-38,-45,-39,-40,-48,321,-49,-54,333,]),'NOT':([28,29,30,58,59,61,62,63,64,65,66,67,75,98,114,116,117,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[84,84,84,84,84,-140,-141,-142,-143,-144,-145,-146,84,84,84,84,84,84,84,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,84,-110,-111,-112,-113,-114,84,-117,-118,-119,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,]),'ICONST':([28,29,30,58,59,61,62,63,64,65,66,67,75,79,83,84,98,114,116,117,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,207,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[99,99,99,99,99,-140,-141,-142,-143,-144,-145,-146,99,99,-122,-123,99,99,99,99,99,99,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,99,-110,-111,-112,-113,-114,99,-117,-118,-119,99,99,99,99,251,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,]),'FALSE':([28,29,30,58,59,61,62,63,64,65,66,67,75,79,83,84,98,114,116,117,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[100,100,100,100,100,-140,-141,-142,-143,-144,-145,-146,100,100,-122,-123,100,100,100,100,100,100,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,100,-110,-111,-112,-113,-114,100,-117,-118,-119,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,]),'TRUE':([28,29,30,58,59,61,62,63,64,65,66,67,75,79,83,84,98,114,116,117,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[101,101,101,101,101,-140,-141,-142,-143,-144,-145,-146,101,101,-122,-123,101,101,101,101,101,101,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,101,-110,-111,-112,-113,-114,101,-117,-118,-119,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'CCONST':([28,29,30,58,59,61,62,63,64,65,66,67,75,79,83,84,98,114,116,117,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[102,102,102,102,102,-140,-141,-142,-143,-144,-145,-146,102,102,-122,-123,102,102,102,102,102,102,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,102,-110,-111,-112,-113,-114,102,-117,-118,-119,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'NULL':([28,29,30,58,59,61,62,63,64,65,66,67,75,79,83,84,98,114,116,117,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[103,103,103,103,103,-140,-141,-142,-143,-144,-145,-146,103,103,-122,-123,103,103,103,103,103,103,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,103,-110,-111,-112,-113,-114,103,-117,-118,-119,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'SCONST':([28,29,30,58,59,61,62,63,64,65,66,67,75,79,83,84,98,114,116,117,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[104,104,104,104,104,-140,-141,-142,-143,-144,-145,-146,104,104,-122,-123,104,104,104,104,104,104,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,104,-110,-111,-112,-113,-114,104,-117,-118,-119,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'OD':([31,57,110,113,184,186,215,237,],[108,-128,185,-151,236,-152,-129,277,]),'FOR':([31,],[112,]),'PROC':([56,],[149,]),'RETURNS':([218,262,296,],[261,-206,-207,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[1,1,1,1,185,1,185,1,1,1,1,1,1,1,]),'conditional_expression':([32,41,44,55,63,84,86,104,105,109,133,168,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'do_action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'index_mode_list':([201,],[249,]),'result':([32,44,],[69,117,]),'array_element':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'then_clause':([107,286,],[198,313,]),'formal_parameter_list':([231,],[277,]),'constant_expression':([133,208,],[206,256,]),'discrete_mode':([46,61,130,191,201,212,260,278,288,289,306,],[126,126,126,126,247,261,299,126,247,126,126,]),'integer_expression':([168,298,],[222,322,]),'discrete_range_mode':([46,61,130,191,201,212,260,278,288,289,306,],[128,128,128,128,128,128,128,128,128,128,128,]),'operator2':([70,225,],[163,163,]),'array_location':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'string_concatenation_operator':([70,225,],[164,164,]),'expression':([32,41,44,55,63,84,86,104,105,109,133,168,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[77,106,77,106,155,182,106,192,155,199,205,223,250,250,250,205,257,264,155,268,281,282,106,282,303,106,250,317,282,257,323,106,257,]),'string_mode':([46,61,130,191,278,289,306,],[120,120,120,120,120,120,120,]),'loop_counter':([50,],[143,]),'mode_definition':([38,190,],[102,235,]),'operand0':([32,41,44,55,63,84,86,104,105,109,133,168,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'arithmetic_additive_operator':([70,225,],[167,167,]),'synonym_statement':([0,33,188,234,],[16,16,16,16,]),'character_mode':([46,61,130,191,201,212,260,278,288,289,306,],[118,118,118,118,118,118,118,118,118,118,118,]),'statement':([0,33,188,234,],[22,99,22,99,]),'expression_list':([104,],[193,]),'parameter':([63,105,218,290,],[156,156,265,156,]),'newmode_statement':([0,33,188,234,],[23,23,23,23,]),'identifier_list':([2,27,38,49,152,190,231,308,],[46,61,103,46,61,103,278,278,]),'parameter_spec':([278,],[310,]),'integer_literal':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),'statement_list':([0,188,],[33,234,]),'dereferenced_reference':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'array_slice':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'start_value':([210,],[259,]),'value_array_slice':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'for_control':([50,],[141,]),'initialization':([153,],[217,]),'operator1':([79,],[170,]),'value_array_element':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'elsif_expression':([228,],[269,]),'exit_label_id':([20,],[58,]),'builtin_call':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'referenced_location':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'closed_dyadic_operator':([42,],[108,]),'operand1':([32,41,44,55,63,84,86,104,105,109,133,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[70,70,70,70,70,70,70,70,70,70,70,70,225,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'discrete_expression':([210,296,319,],[258,320,332,]),'monadic_operator':([32,41,44,55,63,84,86,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'location':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[42,42,98,42,98,98,42,98,98,169,98,98,98,42,98,98,98,98,42,42,98,98,98,98,42,42,98,98,98,98,98,42,98,98,98,42,98,98,42,42,98,98,98,98,42,98,98,98,98,98,98,98,]),'lower_bound':([104,168,201,202,207,288,290,],[194,224,253,253,253,253,253,]),'mode':([46,61,130,191,278,289,306,],[137,153,204,236,311,316,328,]),'declaration':([27,152,],[62,215,]),'operand2':([32,41,44,55,63,84,86,104,105,109,133,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[65,65,65,65,65,65,65,65,65,65,65,221,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'program':([0,],[3,]),'boolean_mode':([46,61,130,191,201,212,260,278,288,289,306,],[119,119,119,119,119,119,119,119,119,119,119,]),'literal':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'builtin_name':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'operand3':([32,41,44,55,63,84,86,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[68,68,68,68,68,68,68,68,68,68,68,220,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'array_mode':([46,61,130,191,278,289,306,],[121,121,121,121,121,121,121,]),'procedure_call':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'procedure_statement':([0,33,188,234,],[9,9,9,9,]),'character_literal':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'array_primitive_value':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'range_enumeration':([50,],[144,]),'return_action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'synonym_definition':([2,49,],[47,139,]),'index_mode':([201,288,],[248,314,]),'parameter_list':([63,105,290,],[154,195,195,]),'arithmetic_multiplicative_operator':([65,221,],[158,158,]),'boolean_literal':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'parenthesized_expression':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'if_action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'action_statement':([0,5,33,53,148,188,197,213,234,241,243,285,],[14,51,14,146,51,14,51,146,14,146,51,146,]),'while_control':([5,141,],[52,209,]),'membership_operator':([79,],[181,]),'iteration':([50,],[142,]),'assigning_operator':([42,],[109,]),'action_statement_list':([5,148,197,243,],[53,213,241,285,]),'upper_bound':([239,267,291,],[283,300,318,]),'assignment_action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'declaration_statement':([0,33,188,234,],[18,18,18,18,]),'literal_range':([201,202,207,288,290,],[251,254,255,251,255,]),'step_enumeration':([50,],[140,]),'synonym_list':([2,],[49,]),'call_action':([0,5,32,33,41,44,53,55,63,73,84,86,97,100,104,105,109,133,148,150,158,163,168,170,188,197,201,202,207,208,210,213,216,218,227,234,237,239,241,243,244,267,270,271,285,288,290,291,296,298,301,319,],[21,21,80,21,80,80,21,80,80,80,80,80,80,21,80,80,80,80,21,21,80,80,80,80,21,21,80,80,80,80,80,21,80,80,80,21,80,80,21,21,80,80,80,80,21,80,80,80,80,80,80,80,]),'primitive_value':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'parenthesis_gambiarra':([186,],[230,]),'element_mode':([289,],[315,]),'procedure_definition':([100,],[187,]),'control_part':([5,],[54,]),'result_action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'result_spec':([230,],[275,]),'declaration_list':([27,],[60,]),'newmode_list':([38,],[101,]),'else_expression':([228,269,],[272,302,]),'else_clause':([198,313,],[242,331,]),'empty_literal':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'then_expression':([183,304,325,],[228,327,333,]),'relational_operator':([79,],[180,]),'end_value':([259,297,],[294,321,]),'mode_name':([46,61,130,191,278,289,306,],[127,127,127,127,127,127,127,]),'operand4':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[91,91,91,91,91,91,91,184,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'label_id':([0,5,33,53,148,188,197,213,234,241,243,285,],[34,57,34,57,57,34,57,57,34,57,57,57,]),'formal_parameter':([231,308,],[276,329,]),'bracketed_action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'composite_mode':([46,61,130,191,278,289,306,],[131,131,131,131,131,131,131,]),'integer_mode':([46,61,130,191,201,212,260,278,288,289,306,],[132,132,132,132,132,132,132,132,132,132,132,]),'character_string_literal':([32,41,44,55,63,84,86,97,104,105,109,133,158,163,168,170,201,202,207,208,210,216,218,227,237,239,244,267,270,271,288,290,291,296,298,301,319,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'formal_procedure_head':([100,],[188,]),'identifier':([0,2,5,20,27,32,33,38,41,44,46,49,50,53,55,61,63,73,84,86,97,100,104,105,109,129,130,133,148,150,152,158,163,168,170,188,190,191,197,201,202,207,208,210,212,213,216,218,227,231,234,237,239,241,243,244,260,267,270,271,278,285,288,289,290,291,296,298,301,306,308,319,],[40,48,40,59,48,96,40,48,96,96,134,48,145,40,96,134,96,96,96,96,96,96,96,96,96,203,134,96,40,96,48,96,96,96,96,40,48,134,40,252,96,96,96,96,262,40,96,96,96,48,40,96,96,40,40,96,262,96,96,96,134,40,252,134,96,96,96,96,96,134,48,96,]),'boolean_expression':([41,55,86,244,271,301,],[107,149,183,286,304,325,]),'step_value':([259,],[297,]),'exit_action':([0,5,33,53,100,148,150,188,197,213,234,241,243,285,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'reference_mode':([46,61,130,191,278,289,306,],[136,136,136,136,136,136,136,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,148,],[2,217,]),'statement':([0,2,148,217,],[3,45,3,45,]),'declaration_statement':([0,2,148,217,],[4,4,4,4,]),'synonym_statement':([0,2,148,217,],[5,5,5,5,]),'newmode_statement':([0,2,148,217,],[6,6,6,6,]),'procedure_statement':([0,2,148,217,],[7,7,7,7,]),'action_statement':([0,2,31,110,148,183,184,217,233,235,237,275,],[8,8,113,186,8,113,113,8,113,186,186,186,]),'label_id':([0,2,31,110,148,183,184,217,233,235,237,275,],[12,12,115,115,12,115,115,12,115,115,115,115,]),'action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[13,13,13,147,13,13,13,13,147,13,13,13,13,13,]),'identifier':([0,2,9,10,11,27,28,29,30,31,48,50,52,56,58,59,75,79,87,98,110,112,114,116,117,119,121,131,141,144,145,148,155,167,174,180,183,184,194,202,204,205,208,211,217,219,221,225,233,234,235,237,239,240,244,245,265,269,270,273,275,283,288,291,292,293,295,297,302,309,311,329,],[14,14,49,49,49,69,85,85,85,14,122,49,122,85,85,85,85,85,85,85,14,192,85,85,85,49,203,122,85,49,122,14,85,85,85,85,14,14,85,85,85,85,256,85,14,49,85,85,14,85,14,14,85,282,85,85,122,85,85,85,14,282,85,122,256,85,122,49,85,85,85,85,]),'bracketed_action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'assignment_action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'call_action':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[17,17,86,86,86,17,17,86,86,86,86,86,86,17,86,86,86,86,17,86,86,86,86,17,17,17,86,86,86,86,86,17,86,86,17,86,17,17,86,86,86,86,86,86,17,86,86,86,86,86,86,86,]),'exit_action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'return_action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'result_action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'if_action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'do_action':([0,2,31,56,110,148,183,184,194,217,233,235,237,275,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'location':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[24,24,80,80,80,24,24,80,80,80,80,179,80,24,80,80,80,80,24,80,80,80,80,24,24,24,80,80,80,80,80,24,80,80,24,80,24,24,80,80,80,80,80,80,24,80,80,80,80,80,80,80,]),'procedure_call':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'builtin_call':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'dereferenced_reference':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'array_element':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'array_slice':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'builtin_name':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'array_location':([0,2,28,29,30,31,56,58,59,75,79,87,98,110,114,116,117,141,148,155,167,174,180,183,184,194,202,204,205,208,211,217,221,225,233,234,235,237,239,244,245,269,270,273,275,288,292,293,302,309,311,329,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'declaration_list':([9,],[46,]),'declaration':([9,119,],[47,200,]),'identifier_list':([9,10,11,50,119,144,219,297,],[48,52,55,52,48,55,265,265,]),'synonym_list':([10,],[50,]),'synonym_definition':([10,50,],[51,140,]),'newmode_list':([11,],[53,]),'mode_definition':([11,144,],[54,212,]),'assigning_operator':([24,],[59,]),'closed_dyadic_operator':([24,],[62,]),'exit_label_id':([27,],[68,]),'result':([28,29,],[70,105,]),'expression':([28,29,30,58,59,75,98,114,116,117,141,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[71,71,107,153,154,107,181,107,153,199,210,229,246,249,249,249,210,153,271,107,280,284,286,303,107,286,286,249,318,107,280,331,280,]),'operand0':([28,29,30,58,59,75,98,114,116,117,141,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'conditional_expression':([28,29,30,58,59,75,98,114,116,117,141,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'operand1':([28,29,30,58,59,75,98,114,116,117,141,155,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[74,74,74,74,74,74,74,74,74,74,74,222,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'operand2':([28,29,30,58,59,75,98,114,116,117,141,155,167,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[76,76,76,76,76,76,76,76,76,76,76,76,223,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'operand3':([28,29,30,58,59,75,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[77,77,77,77,77,77,77,77,77,77,77,77,77,226,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'operand4':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[78,78,78,78,78,78,178,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'monadic_operator':([28,29,30,58,59,75,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'referenced_location':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'primitive_value':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'literal':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'value_array_element':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'value_array_slice':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'parenthesized_expression':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'integer_literal':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),'boolean_literal':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'character_literal':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'empty_literal':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'character_string_literal':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,]),'array_primitive_value':([28,29,30,58,59,75,79,98,114,116,117,141,155,167,174,180,202,204,205,208,211,221,225,234,239,244,245,269,270,273,288,292,293,302,309,311,329,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'boolean_expression':([30,75,114,234,270,302,],[106,173,193,276,304,323,]),'control_part':([31,],[109,]),'action_statement_list':([31,183,184,233,],[110,235,237,275,]),'while_control':([31,187,],[111,238,]),'mode':([48,52,131,145,265,291,295,],[120,142,206,213,299,316,319,]),'mode_name':([48,52,131,145,265,291,295,],[123,123,123,123,123,123,123,]),'discrete_mode':([48,52,131,145,208,240,265,283,291,292,295,],[124,124,124,124,254,281,124,312,124,254,124,]),'reference_mode':([48,52,131,145,265,291,295,],[125,125,125,125,125,125,125,]),'composite_mode':([48,52,131,145,265,291,295,],[126,126,126,126,126,126,126,]),'integer_mode':([48,52,131,145,208,240,265,283,291,292,295,],[127,127,127,127,127,127,127,127,127,127,127,]),'boolean_mode':([48,52,131,145,208,240,265,283,291,292,295,],[128,128,128,128,128,128,128,128,128,128,128,]),'character_mode':([48,52,131,145,208,240,265,283,291,292,295,],[129,129,129,129,129,129,129,129,129,129,129,]),'discrete_range_mode':([48,52,131,145,208,240,265,283,291,292,295,],[130,130,130,130,130,130,130,130,130,130,130,]),'string_mode':([48,52,131,145,265,291,295,],[132,132,132,132,132,132,132,]),'array_mode':([48,52,131,145,265,291,295,],[133,133,133,133,133,133,133,]),'procedure_definition':([56,],[146,]),'formal_procedure_head':([56,],[148,]),'parameter_list':([58,116,293,],[151,196,151,]),'parameter':([58,116,221,293,],[152,152,266,152,]),'operator1':([72,],[155,]),'relational_operator':([72,],[156,]),'membership_operator':([72,],[157,]),'operator2':([74,222,],[167,167,]),'arithmetic_additive_operator':([74,222,],[168,168,]),'string_concatenation_operator':([74,222,],[169,169,]),'arithmetic_multiplicative_operator':([76,223,],[174,174,]),'then_clause':([106,276,],[182,306,]),'for_control':([112,],[187,]),'iteration':([112,],[188,]),'step_enumeration':([112,],[189,]),'range_enumeration':([112,],[190,]),'loop_counter':([112,],[191,]),'expression_list':([117,],[197,]),'lower_bound':([117,180,204,205,208,292,293,],[198,228,248,248,248,248,248,]),'initialization':([120,],[201,]),'constant_expression':([141,211,],[209,257,]),'parenthesis_gambiarra':([149,],[218,]),'then_expression':([173,304,323,],[224,324,334,]),'integer_expression':([180,311,],[227,330,]),'else_clause':([182,306,],[232,326,]),'literal_range':([204,205,208,292,293,],[247,250,255,255,247,]),'index_mode_list':([208,],[252,]),'index_mode':([208,292,],[253,317,]),'result_spec':([218,],[260,]),'formal_parameter_list':([219,],[263,]),'formal_parameter':([219,297,],[264,320,]),'else_expression':([224,268,],[267,301,]),'elsif_expression':([224,],[268,]),'start_value':([239,],[278,]),'discrete_expression':([239,309,329,],[279,328,335,]),'upper_bound':([245,273,288,],[285,305,314,]),'parameter_spec':([265,],[298,]),'end_value':([278,308,],[307,327,]),'step_value':([278,],[308,]),'element_mode':([291,],[315,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -194,50 +194,50 @@ _lr_productions = [
   ('iteration -> range_enumeration','iteration',1,'p_iteration','parser.py',585),
   ('step_enumeration -> loop_counter ASSIGN start_value end_value','step_enumeration',4,'p_step_enumeration','parser.py',589),
   ('step_enumeration -> loop_counter ASSIGN start_value step_value end_value','step_enumeration',5,'p_step_enumeration','parser.py',590),
-  ('loop_counter -> identifier','loop_counter',1,'p_loop_counter','parser.py',597),
-  ('start_value -> discrete_expression','start_value',1,'p_start_value','parser.py',601),
-  ('step_value -> BY integer_expression','step_value',2,'p_step_value','parser.py',605),
-  ('end_value -> TO discrete_expression','end_value',2,'p_end_value','parser.py',609),
-  ('end_value -> DOWN TO discrete_expression','end_value',3,'p_end_value','parser.py',610),
-  ('discrete_expression -> expression','discrete_expression',1,'p_discrete_expression','parser.py',617),
-  ('range_enumeration -> loop_counter IN discrete_mode','range_enumeration',3,'p_range_enumeration','parser.py',621),
-  ('range_enumeration -> loop_counter DOWN IN discrete_mode','range_enumeration',4,'p_range_enumeration','parser.py',622),
-  ('while_control -> WHILE boolean_expression','while_control',2,'p_while_control','parser.py',629),
-  ('call_action -> procedure_call','call_action',1,'p_call_action','parser.py',633),
-  ('call_action -> builtin_call','call_action',1,'p_call_action','parser.py',634),
-  ('procedure_call -> identifier LPAREN RPAREN','procedure_call',3,'p_procedure_call','parser.py',638),
-  ('procedure_call -> identifier LPAREN parameter_list RPAREN','procedure_call',4,'p_procedure_call','parser.py',639),
-  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','parser.py',646),
-  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','parser.py',647),
-  ('parameter -> expression','parameter',1,'p_parameter','parser.py',654),
-  ('exit_action -> EXIT exit_label_id','exit_action',2,'p_exit_action','parser.py',662),
-  ('exit_label_id -> identifier','exit_label_id',1,'p_exit_label_id','parser.py',666),
-  ('return_action -> RETURN','return_action',1,'p_return_action','parser.py',670),
-  ('return_action -> RETURN result','return_action',2,'p_return_action','parser.py',671),
-  ('result_action -> RESULT result','result_action',2,'p_result_action','parser.py',678),
-  ('result -> expression','result',1,'p_result','parser.py',682),
-  ('builtin_call -> builtin_name LPAREN RPAREN','builtin_call',3,'p_builtin_call','parser.py',686),
-  ('builtin_call -> builtin_name LPAREN parameter_list RPAREN','builtin_call',4,'p_builtin_call','parser.py',687),
-  ('builtin_name -> ABS','builtin_name',1,'p_builtin_name','parser.py',694),
-  ('builtin_name -> ASC','builtin_name',1,'p_builtin_name','parser.py',695),
-  ('builtin_name -> NUM','builtin_name',1,'p_builtin_name','parser.py',696),
-  ('builtin_name -> UPPER','builtin_name',1,'p_builtin_name','parser.py',697),
-  ('builtin_name -> LOWER','builtin_name',1,'p_builtin_name','parser.py',698),
-  ('builtin_name -> LENGTH','builtin_name',1,'p_builtin_name','parser.py',699),
-  ('builtin_name -> READ','builtin_name',1,'p_builtin_name','parser.py',700),
-  ('builtin_name -> PRINT','builtin_name',1,'p_builtin_name','parser.py',701),
-  ('procedure_statement -> label_id COLON procedure_definition SEMI','procedure_statement',4,'p_procedure_statement','parser.py',705),
-  ('procedure_definition -> formal_procedure_head END','procedure_definition',2,'p_procedure_definition','parser.py',709),
-  ('procedure_definition -> formal_procedure_head statement_list END','procedure_definition',3,'p_procedure_definition','parser.py',710),
-  ('formal_procedure_head -> PROC parenthesis_gambiarra SEMI','formal_procedure_head',3,'p_formal_procedure_head','parser.py',717),
-  ('formal_procedure_head -> PROC parenthesis_gambiarra result_spec SEMI','formal_procedure_head',4,'p_formal_procedure_head','parser.py',718),
-  ('parenthesis_gambiarra -> LPAREN RPAREN','parenthesis_gambiarra',2,'p_parenthesis_gambiarra','parser.py',726),
-  ('parenthesis_gambiarra -> LPAREN formal_parameter_list RPAREN','parenthesis_gambiarra',3,'p_parenthesis_gambiarra','parser.py',727),
-  ('formal_parameter_list -> formal_parameter','formal_parameter_list',1,'p_formal_parameter_list','parser.py',734),
-  ('formal_parameter_list -> formal_parameter_list COMMA formal_parameter','formal_parameter_list',3,'p_formal_parameter_list','parser.py',735),
-  ('formal_parameter -> identifier_list parameter_spec','formal_parameter',2,'p_formal_parameter','parser.py',742),
-  ('parameter_spec -> mode','parameter_spec',1,'p_parameter_spec','parser.py',746),
-  ('parameter_spec -> mode LOC','parameter_spec',2,'p_parameter_spec','parser.py',747),
-  ('result_spec -> RETURNS LPAREN mode RPAREN','result_spec',4,'p_result_spec','parser.py',754),
-  ('result_spec -> RETURNS LPAREN mode LOC RPAREN','result_spec',5,'p_result_spec','parser.py',755),
+  ('loop_counter -> identifier','loop_counter',1,'p_loop_counter','parser.py',599),
+  ('start_value -> discrete_expression','start_value',1,'p_start_value','parser.py',603),
+  ('step_value -> BY integer_expression','step_value',2,'p_step_value','parser.py',607),
+  ('end_value -> TO discrete_expression','end_value',2,'p_end_value','parser.py',611),
+  ('end_value -> DOWN TO discrete_expression','end_value',3,'p_end_value','parser.py',612),
+  ('discrete_expression -> expression','discrete_expression',1,'p_discrete_expression','parser.py',620),
+  ('range_enumeration -> loop_counter IN discrete_mode','range_enumeration',3,'p_range_enumeration','parser.py',624),
+  ('range_enumeration -> loop_counter DOWN IN discrete_mode','range_enumeration',4,'p_range_enumeration','parser.py',625),
+  ('while_control -> WHILE boolean_expression','while_control',2,'p_while_control','parser.py',632),
+  ('call_action -> procedure_call','call_action',1,'p_call_action','parser.py',636),
+  ('call_action -> builtin_call','call_action',1,'p_call_action','parser.py',637),
+  ('procedure_call -> identifier LPAREN RPAREN','procedure_call',3,'p_procedure_call','parser.py',641),
+  ('procedure_call -> identifier LPAREN parameter_list RPAREN','procedure_call',4,'p_procedure_call','parser.py',642),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','parser.py',649),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','parser.py',650),
+  ('parameter -> expression','parameter',1,'p_parameter','parser.py',657),
+  ('exit_action -> EXIT exit_label_id','exit_action',2,'p_exit_action','parser.py',665),
+  ('exit_label_id -> identifier','exit_label_id',1,'p_exit_label_id','parser.py',669),
+  ('return_action -> RETURN','return_action',1,'p_return_action','parser.py',673),
+  ('return_action -> RETURN result','return_action',2,'p_return_action','parser.py',674),
+  ('result_action -> RESULT result','result_action',2,'p_result_action','parser.py',681),
+  ('result -> expression','result',1,'p_result','parser.py',685),
+  ('builtin_call -> builtin_name LPAREN RPAREN','builtin_call',3,'p_builtin_call','parser.py',689),
+  ('builtin_call -> builtin_name LPAREN parameter_list RPAREN','builtin_call',4,'p_builtin_call','parser.py',690),
+  ('builtin_name -> ABS','builtin_name',1,'p_builtin_name','parser.py',697),
+  ('builtin_name -> ASC','builtin_name',1,'p_builtin_name','parser.py',698),
+  ('builtin_name -> NUM','builtin_name',1,'p_builtin_name','parser.py',699),
+  ('builtin_name -> UPPER','builtin_name',1,'p_builtin_name','parser.py',700),
+  ('builtin_name -> LOWER','builtin_name',1,'p_builtin_name','parser.py',701),
+  ('builtin_name -> LENGTH','builtin_name',1,'p_builtin_name','parser.py',702),
+  ('builtin_name -> READ','builtin_name',1,'p_builtin_name','parser.py',703),
+  ('builtin_name -> PRINT','builtin_name',1,'p_builtin_name','parser.py',704),
+  ('procedure_statement -> label_id COLON procedure_definition SEMI','procedure_statement',4,'p_procedure_statement','parser.py',708),
+  ('procedure_definition -> formal_procedure_head END','procedure_definition',2,'p_procedure_definition','parser.py',712),
+  ('procedure_definition -> formal_procedure_head statement_list END','procedure_definition',3,'p_procedure_definition','parser.py',713),
+  ('formal_procedure_head -> PROC parenthesis_gambiarra SEMI','formal_procedure_head',3,'p_formal_procedure_head','parser.py',720),
+  ('formal_procedure_head -> PROC parenthesis_gambiarra result_spec SEMI','formal_procedure_head',4,'p_formal_procedure_head','parser.py',721),
+  ('parenthesis_gambiarra -> LPAREN RPAREN','parenthesis_gambiarra',2,'p_parenthesis_gambiarra','parser.py',729),
+  ('parenthesis_gambiarra -> LPAREN formal_parameter_list RPAREN','parenthesis_gambiarra',3,'p_parenthesis_gambiarra','parser.py',730),
+  ('formal_parameter_list -> formal_parameter','formal_parameter_list',1,'p_formal_parameter_list','parser.py',737),
+  ('formal_parameter_list -> formal_parameter_list COMMA formal_parameter','formal_parameter_list',3,'p_formal_parameter_list','parser.py',738),
+  ('formal_parameter -> identifier_list parameter_spec','formal_parameter',2,'p_formal_parameter','parser.py',745),
+  ('parameter_spec -> mode','parameter_spec',1,'p_parameter_spec','parser.py',749),
+  ('parameter_spec -> mode LOC','parameter_spec',2,'p_parameter_spec','parser.py',750),
+  ('result_spec -> RETURNS LPAREN mode RPAREN','result_spec',4,'p_result_spec','parser.py',757),
+  ('result_spec -> RETURNS LPAREN mode LOC RPAREN','result_spec',5,'p_result_spec','parser.py',758),
 ]
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Peephole optimizer for LVM code.
+#
+# Runs between Program.generate_code and the virtual machine. Local rules look
+# at a few instructions starting at a given position and propose a
+# replacement; global rules look at the whole program (jump threading, dead
+# code and unused labels). Every rule is applied until none of them fires.
+# Fusion rules then replace common sequences by superinstructions.
+
+from lya_vm import JUMPS
+
+BINARY_FOLDS = {
+    'add': lambda a, b: a + b,
+    'sub': lambda a, b: a - b,
+    'mul': lambda a, b: a * b,
+    'les': lambda a, b: a < b,
+    'leq': lambda a, b: a <= b,
+    'grt': lambda a, b: a > b,
+    'gre': lambda a, b: a >= b,
+    'equ': lambda a, b: a == b,
+    'neq': lambda a, b: a != b,
+}
+
+# Instructions that push one value without looking at the stack
+PUSHES = ('ldc', 'ldv', 'ldr', 'lrv')
+
+# Instructions after which the next one only runs if it has a label
+UNCONDITIONAL = ('jmp', 'ret', 'end')
+
+COMPARISONS = ('les', 'leq', 'grt', 'gre', 'equ', 'neq')
+
+def op(code, i):
+    if i < len(code):
+        return code[i][0]
+    return None
+
+# Local rules. Each one gets the program and a position, and returns the
+# number of instructions to replace and their replacement, or None.
+
+def fold_constants(code, i):
+    # ldc a; ldc b; add  =>  ldc a+b
+    if op(code, i) == 'ldc' and op(code, i + 1) == 'ldc' and op(code, i + 2) in BINARY_FOLDS:
+        a = code[i][1]
+        b = code[i + 1][1]
+        return 3, [('ldc', BINARY_FOLDS[op(code, i + 2)](a, b))]
+    return None
+
+def drop_identity(code, i):
+    # ldc 0; add  =>  (nothing)
+    if op(code, i) == 'ldc':
+        k = code[i][1]
+        if k == 0 and op(code, i + 1) in ('add', 'sub'):
+            return 2, []
+        if k == 1 and op(code, i + 1) == 'mul':
+            return 2, []
+    return None
+
+def fold_index_offset(code, i):
+    # ldr i j; ldv x; ldc c; add; idx k  =>  ldr i j+c*k; ldv x; idx k
+    # Covers the +1 of every string index and non-zero array lower bounds.
+    if op(code, i) == 'ldr' and op(code, i + 1) in PUSHES and op(code, i + 2) == 'ldc' \
+            and op(code, i + 3) in ('add', 'sub') and op(code, i + 4) == 'idx':
+        c = code[i + 2][1]
+        k = code[i + 4][1]
+        if op(code, i + 3) == 'sub':
+            c = -c
+        base = ('ldr', code[i][1], code[i][2] + c * k)
+        return 5, [base, code[i + 1], code[i + 4]]
+    return None
+
+def reuse_constant(code, i):
+    # ldc k; stv x; ldv x  =>  ldc k; stv x; ldc k
+    if op(code, i) == 'ldc' and op(code, i + 1) == 'stv' and op(code, i + 2) == 'ldv' \
+            and code[i + 1][1:] == code[i + 2][1:]:
+        return 3, [code[i], code[i + 1], code[i]]
+    return None
+
+def drop_empty_frame(code, i):
+    # alc 0 / dlc 0  =>  (nothing)
+    if op(code, i) in ('alc', 'dlc') and code[i][1] == 0:
+        return 1, []
+    return None
+
+def drop_jump_to_next(code, i):
+    # jmp L; lbl L  =>  lbl L
+    if op(code, i) == 'jmp':
+        j = i + 1
+        while op(code, j) == 'lbl':
+            if code[j][1] == code[i][1]:
+                return 1, []
+            j += 1
+    return None
+
+# Global rules. Each one gets the program and returns the new program and
+# how many times it fired.
+
+def labels_of(code):
+    return {t[1]: pc for pc, t in enumerate(code) if t[0] == 'lbl'}
+
+def thread_jumps(code):
+    # jmp L ... L: jmp M  =>  jmp M
+    labels = labels_of(code)
+    count = 0
+    out = []
+
+    for t in code:
+        if t[0] in ('jmp', 'jof', 'cjf') and t[1] in labels:
+            target = t[1]
+            seen = {target}
+            while True:
+                pc = labels[target]
+                while op(code, pc) == 'lbl':
+                    pc += 1
+                if op(code, pc) != 'jmp' or code[pc][1] not in labels or code[pc][1] in seen:
+                    break
+                target = code[pc][1]
+                seen.add(target)
+            if target != t[1]:
+                t = (t[0], target) + t[2:]
+                count += 1
+        out.append(t)
+
+    return out, count
+
+def remove_unreachable(code):
+    # Code after jmp, ret or end runs only if it is jumped to
+    labels = labels_of(code)
+    count = 0
+    out = []
+    reachable = True
+
+    for t in code:
+        if t[0] == 'lbl':
+            reachable = True
+        if reachable:
+            out.append(t)
+        else:
+            count += 1
+        if t[0] in UNCONDITIONAL and (t[0] != 'jmp' or t[1] in labels):
+            # A jump to an undeclared label falls through
+            reachable = False
+
+    return out, count
+
+def remove_unused_labels(code):
+    used = set(t[1] for t in code if t[0] in JUMPS)
+    out = [t for t in code if t[0] != 'lbl' or t[1] in used]
+    return out, len(code) - len(out)
+
+# Fusion rules. Local rules that emit superinstructions; they run last so the
+# rules above only ever see the basic instruction set.
+
+def fuse_increment(code, i):
+    # ldv x; ldc k; add; stv x  =>  inv x k
+    # ldc k; ldv x; add; stv x  =>  inv x k   (loop counters)
+    if op(code, i + 2) in ('add', 'sub') and op(code, i + 3) == 'stv':
+        store = code[i + 3]
+        first = code[i]
+        second = code[i + 1]
+
+        if first[0] == 'ldv' and first[1:] == store[1:] and second[0] == 'ldc':
+            k = second[1]
+        elif op(code, i + 2) == 'add' and first[0] == 'ldc' and second[0] == 'ldv' \
+                and second[1:] == store[1:]:
+            k = first[1]
+        else:
+            return None
+
+        if op(code, i + 2) == 'sub':
+            k = -k
+        return 4, [('inv', store[1], store[2], k)]
+    return None
+
+def fuse_compare_jump(code, i):
+    # leq; jof L  =>  cjf L leq
+    if op(code, i) in COMPARISONS and op(code, i + 1) == 'jof':
+        return 2, [('cjf', code[i + 1][1], code[i][0])]
+    return None
+
+def fuse_indexed_load(code, i):
+    # idx k; grc  =>  ldx k
+    if op(code, i) == 'idx' and op(code, i + 1) == 'grc':
+        return 2, [('ldx', code[i][1])]
+    return None
+
+LOCAL_RULES = [
+    fold_constants,
+    drop_identity,
+    fold_index_offset,
+    reuse_constant,
+    drop_empty_frame,
+    drop_jump_to_next,
+]
+
+GLOBAL_RULES = [
+    thread_jumps,
+    remove_unreachable,
+    remove_unused_labels,
+]
+
+FUSION_RULES = [
+    fuse_increment,
+    fuse_compare_jump,
+    fuse_indexed_load,
+]
+
+def kept(code, out, sites):
+    # Global rules either rewrite instructions in place or drop some of
+    # them, keeping the others as they are.
+    if len(out) == len(code):
+        return sites
+    left = []
+    k = 0
+    for t, site in zip(code, sites):
+        if k < len(out) and out[k] is t:
+            left.append(site)
+            k += 1
+    return left
+
+class Peephole:
+    """
+    Apply rules to LVM code until it stops changing, then fuse it into
+    superinstructions. self.stats maps the name of every rule to how many
+    times it fired, and self.sites holds the source site (see
+    ast.AST.sites) of every instruction of the optimized code. An
+    instruction that replaces others takes the site of the first one.
+    """
+
+    def __init__(self, local_rules = LOCAL_RULES, global_rules = GLOBAL_RULES, fusion_rules = FUSION_RULES):
+        self.local_rules = local_rules
+        self.global_rules = global_rules
+        self.fusion_rules = fusion_rules
+        self.stats = {rule.__name__: 0 for rule in local_rules + global_rules + fusion_rules}
+        self.sites = []
+
+    def run_local(self, code, rules):
+        changed = False
+        i = 0
+
+        while i < len(code):
+            for rule in rules:
+                match = rule(code, i)
+                if match != None:
+                    n, replacement = match
+                    code[i : i + n] = replacement
+                    self.sites[i : i + n] = self.sites[i : i + 1] * len(replacement)
+                    self.stats[rule.__name__] += 1
+                    changed = True
+                    # Back up so patterns ending inside the replacement match
+                    i = max(i - 4, 0)
+                    break
+            else:
+                i += 1
+
+        return code, changed
+
+    def optimize(self, code, sites = None):
+        code = list(code)
+        self.sites = list(sites) if sites != None else [None] * len(code)
+        changed = True
+
+        while changed:
+            code, changed = self.run_local(code, self.local_rules)
+            for rule in self.global_rules:
+                out, count = rule(code)
+                self.sites = kept(code, out, self.sites)
+                code = out
+                self.stats[rule.__name__] += count
+                changed = changed or count > 0
+
+        code, _ = self.run_local(code, self.fusion_rules)
+        return code
+
+    def print_stats(self):
+        for name, count in self.stats.items():
+            print("{:<22} {}".format(name, count))
@@ -0,0 +1,594 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Scanner generator.
+#
+#   python3 scangen.py
+#
+# Writes SCANTAB (scantab.py), a scanner specialized to the rules of
+# lexer.Lexer, which Lexer runs instead of the ply lexer. The rules are read
+# the way ply reads them, functions in the order they are defined and then
+# strings, longest regular expression first, and the scanner returns the
+# same tokens as ply would, but:
+#
+#   - the first character of a token picks the only rules that can match
+#     there, from the first characters of their regular expressions, instead
+#     of trying one alternation of all of them
+#   - rules that are plain strings are compared with startswith, and a one
+#     character rule that is the only candidate is not compared at all
+#   - the rules in ACTIONS run inline, identifiers are looked up in a copy
+#     of Lexer.reserved, and other function rules are called as ply calls them
+#   - tokens are Token records with slots, printed like ply's LexToken
+#
+# A function rule only runs inline if it compiles to the same code as the
+# body ACTIONS expects, so a rule that changes is called until its action
+# here is updated.
+
+import os
+import re
+import sys
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+import ply.lex as lex
+
+import lexer
+
+# Function rules run inline: the body the rule must have, then the statement
+# run on the text of the match, for rules that discard it, or the type and
+# value of the token they return
+ACTIONS = {
+    't_COMMENT': ('t.lexer.lineno += t.value.count("\\n")', 'lineno += text.count("\\n")', None),
+    't_newline': ('t.lexer.lineno += t.value.count("\\n")', 'lineno += text.count("\\n")', None),
+    't_ID': ("t.type = self.reserved.get(t.value, 'ID')\nreturn t", None, ("KEYWORDS.get(text, 'ID')", 'text')),
+    't_ICONST': ('t.value = int(t.value)\nreturn t', None, (None, 'int(text)')),
+    't_CCONST': ('t.value = ord(t.value[1:-1])\nreturn t', None, (None, 'ord(text[1:-1])')),
+    't_SCONST': ('ascii_list = []\nfor character in t.value:\n    ascii_list.append(ord(character))\nt.value = ascii_list\nreturn t', None, (None, 'list(map(ord, text))')),
+}
+
+# The first characters the scanner dispatches on one at a time. Any other
+# one can start whatever rule a non ascii character can.
+ASCII = [chr(c) for c in range(128)]
+OTHER = '\x80'
+
+DIGITS = '0123456789'
+SPACES = ' \t\n\r\f\v'
+WORD = DIGITS + 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'
+
+# Characters of the categories such as \d, and whether they are negated. In
+# str patterns they also match characters past ascii.
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: (DIGITS, False),
+    sre_constants.CATEGORY_NOT_DIGIT: (DIGITS, True),
+    sre_constants.CATEGORY_SPACE: (SPACES, False),
+    sre_constants.CATEGORY_NOT_SPACE: (SPACES, True),
+    sre_constants.CATEGORY_WORD: (WORD, False),
+    sre_constants.CATEGORY_NOT_WORD: (WORD, True),
+}
+
+def category(name):
+    if name not in CATEGORIES:
+        return set(ASCII) | {OTHER}
+    chars, negated = CATEGORIES[name]
+    if negated:
+        return set(ASCII) - set(chars) | {OTHER}
+    return set(chars) | {OTHER}
+
+def charset(items):
+    result = set()
+    negated = False
+    for op, av in items:
+        if op == sre_constants.NEGATE:
+            negated = True
+        elif op == sre_constants.LITERAL:
+            result.add(chr(av) if av < 128 else OTHER)
+        elif op == sre_constants.RANGE:
+            result |= {chr(c) for c in range(av[0], min(av[1], 127) + 1)}
+            if av[1] >= 128:
+                result.add(OTHER)
+        elif op == sre_constants.CATEGORY:
+            result |= category(av)
+        else:
+            result |= set(ASCII) | {OTHER}
+    if negated:
+        return set(ASCII) - result | {OTHER}
+    return result
+
+def first(pattern):
+    """
+    Return the characters a match of the parsed pattern can start with, and
+    whether it can be empty. Anything that is not understood can start with
+    any character.
+    """
+    chars = set()
+    for op, av in pattern:
+        if op == sre_constants.LITERAL:
+            start, empty = {chr(av) if av < 128 else OTHER}, False
+        elif op == sre_constants.NOT_LITERAL:
+            start, empty = set(ASCII) - {chr(av)} | {OTHER}, False
+        elif op == sre_constants.ANY:
+            start, empty = set(ASCII) - {'\n'} | {OTHER}, False
+        elif op == sre_constants.IN:
+            start, empty = charset(av), False
+        elif op == sre_constants.BRANCH:
+            start, empty = set(), False
+            for branch in av[1]:
+                s, e = first(branch)
+                start |= s
+                empty = empty or e
+        elif op == sre_constants.SUBPATTERN:
+            start, empty = first(av[-1])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, getattr(sre_constants, 'POSSESSIVE_REPEAT', None)):
+            start, empty = first(av[2])
+            empty = empty or av[0] == 0
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT, sre_constants.AT):
+            start, empty = set(), True
+        else:
+            start, empty = set(ASCII) | {OTHER}, True
+        chars |= start
+        if not empty:
+            return chars, False
+    return chars, True
+
+def literal(pattern):
+    """
+    Return the string the parsed pattern matches, if it is a plain string.
+    """
+    if all(op == sre_constants.LITERAL for op, _ in pattern):
+        return ''.join(chr(av) for _, av in pattern)
+    return None
+
+def inline(name, function):
+    """
+    Return the action of ACTIONS for the rule function, if its code is the
+    body the action was written for.
+    """
+    if name not in ACTIONS:
+        return None
+    body, statement, token = ACTIONS[name]
+    source = 'def %s(self, t):\n    %r\n' % (name, function.__doc__) + ''.join('    ' + line + '\n' for line in body.split('\n'))
+    scope = {}
+    exec(source, scope)
+    expected = scope[name].__code__
+    code = function.__code__
+    if (code.co_code, code.co_consts, code.co_names, code.co_varnames) != (expected.co_code, expected.co_consts, expected.co_names, expected.co_varnames):
+        sys.stderr.write(name + " does not match its inline action, it is called instead\n")
+        return None
+    return statement, token
+
+class Rule:
+
+    def __init__(self, name, regex, function = None):
+        """
+        The rule t_name, with ply's token type for it, its regular
+        expression and, for function rules, the function and its inline
+        action.
+        """
+        self.name = name
+        self.type = name[len('t_'):]
+        self.regex = regex
+        self.function = function
+        self.action = inline(name, function) if function != None else None
+
+        pattern = sre_parse.parse(regex, re.VERBOSE)
+        self.chars, empty = first(pattern)
+        if empty:
+            self.chars = set(ASCII) | {OTHER}
+        self.literal = literal(pattern)
+
+    def ignored(self):
+        return self.function == None and self.type.startswith('ignore_')
+
+def rules(module):
+    """
+    Return the Rules of the ply lexer module, in the order ply tries them,
+    and its ignored characters.
+    """
+    reflect = lex.LexerReflect({name: getattr(module, name) for name in dir(module)}, reflags = re.VERBOSE)
+    reflect.get_all()
+    if reflect.validate_all() or len(reflect.stateinfo) > 1:
+        raise ValueError("the scanner generator only takes valid lexers with one state")
+
+    result = [Rule(name, function.__doc__, function) for name, function in reflect.funcsym['INITIAL']]
+    result += [Rule(name, regex) for name, regex in reflect.strsym['INITIAL']]
+    return result, reflect.ignore.get('INITIAL', '')
+
+class Writer:
+
+    def __init__(self):
+        self.lines = []
+        self.depth = 0
+
+    def line(self, text = ''):
+        self.lines.append('    ' * self.depth + text if text != '' else '')
+
+    def source(self):
+        return '\n'.join(self.lines) + '\n'
+
+def emit_keep(out, kind, value, columns):
+    """
+    Write the code that keeps a token at pos with the type and value of the
+    expressions kind and value, making a Token or, for columns, adding it
+    to the stream, with str values interned inline.
+    """
+    if columns:
+        out.line('kind(%s)' % kind)
+        out.line('start(pos)')
+        out.line('line(lineno)')
+        if value in ('text', 'c') or value[0] in '\'"':
+            out.line('value(interned[%s] if %s in interned else intern(%s))' % (value, value, value))
+        else:
+            out.line('value(intern(%s))' % value)
+        return
+    out.line('t = Token()')
+    out.line('t.type = ' + kind)
+    out.line('t.value = ' + value)
+    out.line('t.lineno = lineno')
+    out.line('t.lexpos = pos')
+
+def emit_token(out, rule, value, end, columns):
+    """
+    Write the code that keeps the token of rule or discards its match,
+    given expressions for the value of a string rule and where the match
+    ends. The text of the match of a function rule is in text.
+    """
+    if rule.ignored():
+        out.line('pos = ' + end)
+        out.line('continue')
+        return
+
+    if rule.function != None and rule.action == None:
+        # Called with the token, as ply calls it
+        out.line('t = Token()')
+        out.line('t.type = %r' % rule.type)
+        out.line('t.value = text')
+        out.line('t.lineno = lineno')
+        out.line('t.lexpos = pos')
+        out.line('t.lexer = self')
+        out.line('self.lineno = lineno')
+        out.line('self.lexmatch = m')
+        out.line('self.lexpos = ' + end)
+        out.line('t = self.module.%s(t)' % rule.name)
+        out.line('pos = self.lexpos')
+        out.line('lineno = self.lineno')
+        out.line('if t:')
+        out.line('    add(t)' if columns else '    yield t')
+        out.line('continue')
+        return
+
+    kind = None
+    if rule.function != None:
+        statement, token = rule.action
+        if token == None:
+            if statement != None:
+                out.line(statement)
+            out.line('pos = ' + end)
+            out.line('continue')
+            return
+        kind, value = token
+
+    if kind == None:
+        kind = repr(rule.type)
+    if columns:
+        kind = 'codes[%s]' % kind
+    emit_keep(out, kind, value, columns)
+    if not columns and rule.function != None:
+        out.line('t.lexer = self')
+    out.line('pos = ' + end)
+    out.line('continue' if columns else 'yield t')
+    if not columns:
+        out.line('continue')
+
+def emit_candidates(out, rules, chars, columns):
+    """
+    Write the code that tries rules, in order, at a character of chars.
+    """
+    for rule in rules:
+        if rule.literal != None:
+            value, end = repr(rule.literal), 'pos + %d' % len(rule.literal)
+            always = len(rule.literal) == 1 and chars == {rule.literal}
+            if not always:
+                out.line('if data.startswith(%r, pos):' % rule.literal)
+                out.depth += 1
+            if rule.function != None:
+                out.line('m = None')
+                out.line('text = ' + value)
+            emit_token(out, rule, value, end, columns)
+            if always:
+                # Always matches, and hides the rules after it
+                return
+        elif rule.function != None and rule.action == None:
+            out.line('m = match_%s(data, pos)' % rule.type)
+            out.line('if m:')
+            out.depth += 1
+            out.line('text = m.group()')
+            emit_token(out, rule, 'text', 'm.end()', columns)
+        else:
+            # The match goes on over the ignored characters after the token
+            out.line('m = skip_%s(data, pos)' % rule.type)
+            out.line('if m:')
+            out.depth += 1
+            out.line('text = m.group(1)')
+            emit_token(out, rule, 'text', 'm.end()', columns)
+        out.depth -= 1
+
+def emit_groups(out, order, low, high, columns):
+    """
+    Write the code of the groups low to high - 1 of order, numbered from 2,
+    found by halving the range of k.
+    """
+    if high - low == 1:
+        emit_candidates(out, order[low][0], order[low][1], columns)
+        return
+    middle = (low + high) // 2
+    out.line('if k < %d:' % (middle + 2))
+    out.depth += 1
+    emit_groups(out, order, low, middle, columns)
+    out.depth -= 1
+    out.line('else:')
+    out.depth += 1
+    emit_groups(out, order, middle, high, columns)
+    out.depth -= 1
+
+def emit_loop(out, order, error, columns):
+    """
+    Write the loop that scans from pos to end, with a branch for every group
+    of first characters, and calls t_error where no rule matches.
+    """
+    out.line('while pos < end:')
+    out.depth += 1
+    out.line('c = data[pos]')
+    out.line('k = classes(c, OTHER)')
+    # Identifiers (usually the biggest group), ignored characters and tokens
+    # of one character first
+    if len(order) > 0:
+        out.line('if k == 2:')
+        out.depth += 1
+        emit_candidates(out, order[0][0], order[0][1], columns)
+        out.depth -= 1
+    out.line('elif k == 0:' if len(order) > 0 else 'if k == 0:')
+    out.line('    pos += 1')
+    out.line('    continue')
+    out.line('elif k == 1:')
+    out.depth += 1
+    emit_keep(out, 'codes[SINGLES[c]]' if columns else 'SINGLES[c]', 'c', columns)
+    out.line('pos += 1')
+    if not columns:
+        out.line('yield t')
+    out.line('continue')
+    out.depth -= 1
+    if len(order) > 1:
+        out.line('elif k > 2:')
+        out.depth += 1
+        emit_groups(out, order, 1, len(order), columns)
+        out.depth -= 1
+
+    out.line()
+    out.line('# No rule matches')
+    out.line('self.lineno = lineno')
+    out.line('self.lexpos = pos')
+    if error == None:
+        out.line('raise LexError("Illegal character \'%s\' at index %d" % (data[pos], pos), data[pos:])')
+    else:
+        out.line('t = Token()')
+        out.line('t.value = data[pos:]')
+        out.line('t.lineno = lineno')
+        out.line('t.type = \'error\'')
+        out.line('t.lexer = self')
+        out.line('t.lexpos = pos')
+        out.line('t = self.module.t_error(t)')
+        out.line('if pos == self.lexpos:')
+        out.line('    raise LexError("Scanning error. Illegal character \'%s\'" % (data[pos]), data[pos:])')
+        out.line('pos = self.lexpos')
+        out.line('lineno = self.lineno')
+        out.line('if t:')
+        out.line('    add(t)' if columns else '    yield t')
+    out.depth -= 1
+
+# The Token and the parts of the Scanner that do not depend on the rules
+SCANNER = """
+class Token:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    def __repr__(self):
+        return str(self)
+
+class Scanner:
+
+    types = TYPES
+
+    def __init__(self, module):
+        \"\"\"
+        Scanner running the function rules and t_error of module.
+        \"\"\"
+        self.module = module
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.lexmatch = None
+
+    def clone(self, module):
+        return Scanner(module)
+
+    def begin(self, state):
+        if state != 'INITIAL':
+            raise ValueError('Undefined state')
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+        # Tokens come from a generator, which keeps its place in locals, and
+        # the parser calls it without going through a method
+        self.token = self.scan().__next__
+
+    def token(self):
+        raise RuntimeError('No input string given with input()')
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t == None:
+            raise StopIteration
+        return t
+"""
+
+def generate(module, signature):
+    """
+    Return the source of the scanner for the ply lexer module.
+    """
+    ordered, ignore = rules(module)
+
+    # Characters with the same candidates share their code, except those
+    # that are always the token of a string rule of that one character
+    groups = {}
+    singles = {}
+    for c in ASCII + [OTHER]:
+        if c in ignore:
+            continue
+        candidates = tuple(rule for rule in ordered if c in rule.chars)
+        if len(candidates) > 0 and candidates[0].literal == c and candidates[0].function == None and not candidates[0].ignored():
+            singles[c] = candidates[0].type
+        elif len(candidates) > 0:
+            groups.setdefault(candidates, set()).add(c)
+    # Bigger groups first, identifiers and numbers before punctuation
+    order = sorted(groups.items(), key = lambda group: (-len(group[1]), min(group[1])))
+
+    patterns = [rule for rule in ordered if rule.literal == None and any(rule in candidates for candidates in groups)]
+
+    # The declared tokens, then the types of the other rules
+    types = list(module.tokens)
+    types += [rule.type for rule in ordered if not rule.ignored() and rule.type not in types]
+
+    out = Writer()
+    out.line('# scantab.py. This file was written by scangen.py from the rules of')
+    out.line('# lexer.Lexer. Do not edit it, run python3 parser.py instead.')
+    out.line()
+    if len(patterns) > 0:
+        out.line('import re')
+    out.line('from ply.lex import LexError')
+    out.line()
+    out.line('SIGNATURE = %r' % signature)
+    out.line()
+    if hasattr(module, 'reserved'):
+        out.line('KEYWORDS = {')
+        for word, kind in sorted(module.reserved.items()):
+            out.line('    %r: %r,' % (word, kind))
+        out.line('}')
+        out.line()
+
+    out.line('# Token types, by their code in columns')
+    out.line('TYPES = (')
+    for kind in types:
+        out.line('    %r,' % kind)
+    out.line(')')
+    out.line('CODES = {kind: code for code, kind in enumerate(TYPES)}')
+    out.line()
+
+    out.line('# Tokens of one character')
+    out.line('SINGLES = {')
+    for c in sorted(singles):
+        out.line('    %r: %r,' % (c, singles[c]))
+    out.line('}')
+    out.line()
+
+    out.line('# Group of the code that scans a token starting with a character, 0 for')
+    out.line('# ignored characters and 1 for SINGLES. Characters past ascii are in')
+    out.line('# OTHER.')
+    classes = {c: 0 for c in ignore}
+    classes.update({c: 1 for c in singles})
+    other = -1
+    for k, (candidates, chars) in enumerate(order, 2):
+        for c in sorted(chars):
+            if c == OTHER:
+                other = k
+            else:
+                classes[c] = k
+    out.line('CLASSES = {')
+    for c in ASCII:
+        if c in classes:
+            out.line('    %r: %d,' % (c, classes[c]))
+    out.line('}')
+    out.line('OTHER = %d' % other)
+    out.line()
+
+    # Rules that call a function match alone. The others go on over the
+    # ignored characters after them, from a lookahead so that the text of
+    # the token is what the rule matches alone.
+    ignored = '[' + ''.join(re.escape(c) for c in ignore) + ']*' if ignore != '' else ''
+    for rule in patterns:
+        if rule.function != None and rule.action == None:
+            out.line('match_%s = re.compile(%r, re.VERBOSE).match' % (rule.type, rule.regex))
+        else:
+            out.line('skip_%s = re.compile(%r, re.VERBOSE).match' % (rule.type, '(?=(' + rule.regex + '\n))\\1' + ignored))
+    out.lines += SCANNER.split('\n')
+
+    error = getattr(module, 't_error', None)
+    out.depth = 1
+    out.line('def scan(self):')
+    out.depth += 1
+    out.line('classes = CLASSES.get')
+    out.line('data = self.lexdata')
+    out.line('pos = self.lexpos')
+    out.line('lineno = self.lineno')
+    out.line('end = self.lexlen')
+    out.line('while True:')
+    out.depth += 1
+    emit_loop(out, order, error, False)
+    out.line()
+    out.line('# At the end ply moves one past it on every call')
+    out.line('pos += 1')
+    out.line('self.lexpos = pos')
+    out.line('self.lineno = lineno')
+    out.line('yield None')
+    out.depth -= 2
+    out.line()
+
+    out.line('def columns(self, stream):')
+    out.line('    """')
+    out.line('    Scan the rest of the input into stream, a lya_tokens.TokenStream for')
+    out.line('    TYPES, as the token generator would return it.')
+    out.line('    """')
+    out.depth += 1
+    out.line('classes = CLASSES.get')
+    out.line('codes = CODES')
+    out.line('data = self.lexdata')
+    out.line('pos = self.lexpos')
+    out.line('lineno = self.lineno')
+    out.line('end = self.lexlen')
+    out.line('kind = stream.kinds.append')
+    out.line('start = stream.starts.append')
+    out.line('line = stream.lines.append')
+    out.line('value = stream.values.append')
+    out.line('interned = stream.interned')
+    out.line('intern = stream.intern')
+    out.line('add = stream.add')
+    emit_loop(out, order, error, True)
+    out.line()
+    out.line('self.lexpos = pos + 1')
+    out.line('self.lineno = lineno')
+    return out.source()
+
+def write():
+    """
+    Write the scanner of lexer.Lexer to SCANTAB, next to the lexer.
+    """
+    source = generate(lexer.Lexer.__new__(lexer.Lexer), lexer.scanner_signature())
+    with open(os.path.join(lexer.DIRECTORY, lexer.SCANTAB + '.py'), 'w') as file:
+        file.write(source)
+
+if __name__ == "__main__": write()
@@ -0,0 +1,938 @@
+# scantab.py. This file was written by scangen.py from the rules of
+# lexer.Lexer. Do not edit it, run python3 parser.py instead.
+
+import re
+from ply.lex import LexError
+
+SIGNATURE = 'ea78fe593388c453d89dd8f91155d0c0f7dc5075eefb7bad2f2bbd525b4b5d68'
+
+KEYWORDS = {
+    'abs': 'ABS',
+    'array': 'ARRAY',
+    'asc': 'ASC',
+    'bool': 'BOOL',
+    'by': 'BY',
+    'char': 'CHAR',
+    'chars': 'CHARS',
+    'dcl': 'DCL',
+    'do': 'DO',
+    'down': 'DOWN',
+    'else': 'ELSE',
+    'elsif': 'ELSIF',
+    'end': 'END',
+    'exit': 'EXIT',
+    'false': 'FALSE',
+    'fi': 'FI',
+    'for': 'FOR',
+    'if': 'IF',
+    'in': 'IN',
+    'int': 'INT',
+    'length': 'LENGTH',
+    'loc': 'LOC',
+    'lower': 'LOWER',
+    'null': 'NULL',
+    'num': 'NUM',
+    'od': 'OD',
+    'print': 'PRINT',
+    'proc': 'PROC',
+    'read': 'READ',
+    'ref': 'REF',
+    'result': 'RESULT',
+    'return': 'RETURN',
+    'returns': 'RETURNS',
+    'syn': 'SYN',
+    'then': 'THEN',
+    'to': 'TO',
+    'true': 'TRUE',
+    'type': 'TYPE',
+    'upper': 'UPPER',
+    'while': 'WHILE',
+}
+
+# Token types, by their code in columns
+TYPES = (
+    'ID',
+    'PLUS',
+    'MINUS',
+    'TIMES',
+    'DIVIDE',
+    'ASSIGN',
+    'COMMA',
+    'COLON',
+    'SEMI',
+    'ARROW',
+    'LPAREN',
+    'RPAREN',
+    'LBRACKET',
+    'RBRACKET',
+    'LESS',
+    'LESSEQ',
+    'GREATER',
+    'GREATEREQ',
+    'EQUAL',
+    'AND',
+    'OR',
+    'STRCAT',
+    'INCREASE',
+    'DECREASE',
+    'MULCREASE',
+    'DIVCREASE',
+    'MODCREASE',
+    'DIFF',
+    'MOD',
+    'NOT',
+    'ICONST',
+    'CCONST',
+    'SCONST',
+    'ARRAY',
+    'BY',
+    'CHARS',
+    'DCL',
+    'DO',
+    'DOWN',
+    'ELSE',
+    'ELSIF',
+    'END',
+    'EXIT',
+    'FI',
+    'FOR',
+    'IF',
+    'IN',
+    'LOC',
+    'TYPE',
+    'OD',
+    'PROC',
+    'REF',
+    'RESULT',
+    'RETURN',
+    'RETURNS',
+    'SYN',
+    'THEN',
+    'TO',
+    'WHILE',
+    'ABS',
+    'ASC',
+    'BOOL',
+    'CHAR',
+    'FALSE',
+    'INT',
+    'LENGTH',
+    'LOWER',
+    'NULL',
+    'NUM',
+    'PRINT',
+    'READ',
+    'TRUE',
+    'UPPER',
+    'COMMENT',
+    'newline',
+    'error_STRING',
+)
+CODES = {kind: code for code, kind in enumerate(TYPES)}
+
+# Tokens of one character
+SINGLES = {
+    '(': 'LPAREN',
+    ')': 'RPAREN',
+    ',': 'COMMA',
+    ':': 'COLON',
+    ';': 'SEMI',
+    '[': 'LBRACKET',
+    ']': 'RBRACKET',
+}
+
+# Group of the code that scans a token starting with a character, 0 for
+# ignored characters and 1 for SINGLES. Characters past ascii are in
+# OTHER.
+CLASSES = {
+    '\t': 0,
+    '\n': 4,
+    ' ': 0,
+    '!': 5,
+    '"': 6,
+    '%': 7,
+    '&': 8,
+    "'": 9,
+    '(': 1,
+    ')': 1,
+    '*': 10,
+    '+': 11,
+    ',': 1,
+    '-': 12,
+    '/': 13,
+    '0': 3,
+    '1': 3,
+    '2': 3,
+    '3': 3,
+    '4': 3,
+    '5': 3,
+    '6': 3,
+    '7': 3,
+    '8': 3,
+    '9': 3,
+    ':': 1,
+    ';': 1,
+    '<': 14,
+    '=': 15,
+    '>': 16,
+    'A': 2,
+    'B': 2,
+    'C': 2,
+    'D': 2,
+    'E': 2,
+    'F': 2,
+    'G': 2,
+    'H': 2,
+    'I': 2,
+    'J': 2,
+    'K': 2,
+    'L': 2,
+    'M': 2,
+    'N': 2,
+    'O': 2,
+    'P': 2,
+    'Q': 2,
+    'R': 2,
+    'S': 2,
+    'T': 2,
+    'U': 2,
+    'V': 2,
+    'W': 2,
+    'X': 2,
+    'Y': 2,
+    'Z': 2,
+    '[': 1,
+    ']': 1,
+    '_': 2,
+    'a': 2,
+    'b': 2,
+    'c': 2,
+    'd': 2,
+    'e': 2,
+    'f': 2,
+    'g': 2,
+    'h': 2,
+    'i': 2,
+    'j': 2,
+    'k': 2,
+    'l': 2,
+    'm': 2,
+    'n': 2,
+    'o': 2,
+    'p': 2,
+    'q': 2,
+    'r': 2,
+    's': 2,
+    't': 2,
+    'u': 2,
+    'v': 2,
+    'w': 2,
+    'x': 2,
+    'y': 2,
+    'z': 2,
+    '|': 17,
+}
+OTHER = 3
+
+skip_COMMENT = re.compile('(?=(/\\*[^*]*\\*+([^/*][^*]*\\*+)*/|//.*\n))\\1[\\ \\\t]*', re.VERBOSE).match
+skip_ID = re.compile('(?=([A-Za-z_][a-zA-Z0-9_]*\n))\\1[\\ \\\t]*', re.VERBOSE).match
+skip_ICONST = re.compile('(?=(\\d+\n))\\1[\\ \\\t]*', re.VERBOSE).match
+skip_CCONST = re.compile('(?=(\\\'(\\\\\\"|\\\\\\\'|[^\\\'\\"])\\\'\n))\\1[\\ \\\t]*', re.VERBOSE).match
+skip_SCONST = re.compile('(?=(\\"(\\\\\\"|\\\\\\\'|[^\\\'\\"\\n])*\\"\n))\\1[\\ \\\t]*', re.VERBOSE).match
+skip_newline = re.compile('(?=(\\n+\n))\\1[\\ \\\t]*', re.VERBOSE).match
+match_error_STRING = re.compile('\\".*', re.VERBOSE).match
+skip_DIVIDE = re.compile('(?=(/(?!\\*)\n))\\1[\\ \\\t]*', re.VERBOSE).match
+
+class Token:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    def __repr__(self):
+        return str(self)
+
+class Scanner:
+
+    types = TYPES
+
+    def __init__(self, module):
+        """
+        Scanner running the function rules and t_error of module.
+        """
+        self.module = module
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.lexmatch = None
+
+    def clone(self, module):
+        return Scanner(module)
+
+    def begin(self, state):
+        if state != 'INITIAL':
+            raise ValueError('Undefined state')
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+        # Tokens come from a generator, which keeps its place in locals, and
+        # the parser calls it without going through a method
+        self.token = self.scan().__next__
+
+    def token(self):
+        raise RuntimeError('No input string given with input()')
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t == None:
+            raise StopIteration
+        return t
+
+    def scan(self):
+        classes = CLASSES.get
+        data = self.lexdata
+        pos = self.lexpos
+        lineno = self.lineno
+        end = self.lexlen
+        while True:
+            while pos < end:
+                c = data[pos]
+                k = classes(c, OTHER)
+                if k == 2:
+                    m = skip_ID(data, pos)
+                    if m:
+                        text = m.group(1)
+                        t = Token()
+                        t.type = KEYWORDS.get(text, 'ID')
+                        t.value = text
+                        t.lineno = lineno
+                        t.lexpos = pos
+                        t.lexer = self
+                        pos = m.end()
+                        yield t
+                        continue
+                elif k == 0:
+                    pos += 1
+                    continue
+                elif k == 1:
+                    t = Token()
+                    t.type = SINGLES[c]
+                    t.value = c
+                    t.lineno = lineno
+                    t.lexpos = pos
+                    pos += 1
+                    yield t
+                    continue
+                elif k > 2:
+                    if k < 10:
+                        if k < 6:
+                            if k < 4:
+                                m = skip_ICONST(data, pos)
+                                if m:
+                                    text = m.group(1)
+                                    t = Token()
+                                    t.type = 'ICONST'
+                                    t.value = int(text)
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    t.lexer = self
+                                    pos = m.end()
+                                    yield t
+                                    continue
+                            else:
+                                if k < 5:
+                                    m = skip_newline(data, pos)
+                                    if m:
+                                        text = m.group(1)
+                                        lineno += text.count("\n")
+                                        pos = m.end()
+                                        continue
+                                else:
+                                    if data.startswith('!=', pos):
+                                        t = Token()
+                                        t.type = 'DIFF'
+                                        t.value = '!='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'NOT'
+                                    t.value = '!'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                        else:
+                            if k < 8:
+                                if k < 7:
+                                    m = skip_SCONST(data, pos)
+                                    if m:
+                                        text = m.group(1)
+                                        t = Token()
+                                        t.type = 'SCONST'
+                                        t.value = list(map(ord, text))
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        t.lexer = self
+                                        pos = m.end()
+                                        yield t
+                                        continue
+                                    m = match_error_STRING(data, pos)
+                                    if m:
+                                        text = m.group()
+                                        t = Token()
+                                        t.type = 'error_STRING'
+                                        t.value = text
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        t.lexer = self
+                                        self.lineno = lineno
+                                        self.lexmatch = m
+                                        self.lexpos = m.end()
+                                        t = self.module.t_error_STRING(t)
+                                        pos = self.lexpos
+                                        lineno = self.lineno
+                                        if t:
+                                            yield t
+                                        continue
+                                else:
+                                    if data.startswith('%=', pos):
+                                        t = Token()
+                                        t.type = 'MODCREASE'
+                                        t.value = '%='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'MOD'
+                                    t.value = '%'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                            else:
+                                if k < 9:
+                                    if data.startswith('&&', pos):
+                                        t = Token()
+                                        t.type = 'AND'
+                                        t.value = '&&'
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'STRCAT'
+                                    t.value = '&'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                                else:
+                                    m = skip_CCONST(data, pos)
+                                    if m:
+                                        text = m.group(1)
+                                        t = Token()
+                                        t.type = 'CCONST'
+                                        t.value = ord(text[1:-1])
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        t.lexer = self
+                                        pos = m.end()
+                                        yield t
+                                        continue
+                    else:
+                        if k < 14:
+                            if k < 12:
+                                if k < 11:
+                                    if data.startswith('*=', pos):
+                                        t = Token()
+                                        t.type = 'MULCREASE'
+                                        t.value = '*='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'TIMES'
+                                    t.value = '*'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                                else:
+                                    if data.startswith('+=', pos):
+                                        t = Token()
+                                        t.type = 'INCREASE'
+                                        t.value = '+='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'PLUS'
+                                    t.value = '+'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                            else:
+                                if k < 13:
+                                    if data.startswith('->', pos):
+                                        t = Token()
+                                        t.type = 'ARROW'
+                                        t.value = '->'
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    if data.startswith('-=', pos):
+                                        t = Token()
+                                        t.type = 'DECREASE'
+                                        t.value = '-='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'MINUS'
+                                    t.value = '-'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                                else:
+                                    m = skip_COMMENT(data, pos)
+                                    if m:
+                                        text = m.group(1)
+                                        lineno += text.count("\n")
+                                        pos = m.end()
+                                        continue
+                                    m = skip_DIVIDE(data, pos)
+                                    if m:
+                                        text = m.group(1)
+                                        t = Token()
+                                        t.type = 'DIVIDE'
+                                        t.value = text
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = m.end()
+                                        yield t
+                                        continue
+                                    if data.startswith('/=', pos):
+                                        t = Token()
+                                        t.type = 'DIVCREASE'
+                                        t.value = '/='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                        else:
+                            if k < 16:
+                                if k < 15:
+                                    if data.startswith('<=', pos):
+                                        t = Token()
+                                        t.type = 'LESSEQ'
+                                        t.value = '<='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'LESS'
+                                    t.value = '<'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                                else:
+                                    if data.startswith('==', pos):
+                                        t = Token()
+                                        t.type = 'EQUAL'
+                                        t.value = '=='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'ASSIGN'
+                                    t.value = '='
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                            else:
+                                if k < 17:
+                                    if data.startswith('>=', pos):
+                                        t = Token()
+                                        t.type = 'GREATEREQ'
+                                        t.value = '>='
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+                                    t = Token()
+                                    t.type = 'GREATER'
+                                    t.value = '>'
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    pos = pos + 1
+                                    yield t
+                                    continue
+                                else:
+                                    if data.startswith('||', pos):
+                                        t = Token()
+                                        t.type = 'OR'
+                                        t.value = '||'
+                                        t.lineno = lineno
+                                        t.lexpos = pos
+                                        pos = pos + 2
+                                        yield t
+                                        continue
+
+                # No rule matches
+                self.lineno = lineno
+                self.lexpos = pos
+                t = Token()
+                t.value = data[pos:]
+                t.lineno = lineno
+                t.type = 'error'
+                t.lexer = self
+                t.lexpos = pos
+                t = self.module.t_error(t)
+                if pos == self.lexpos:
+                    raise LexError("Scanning error. Illegal character '%s'" % (data[pos]), data[pos:])
+                pos = self.lexpos
+                lineno = self.lineno
+                if t:
+                    yield t
+
+            # At the end ply moves one past it on every call
+            pos += 1
+            self.lexpos = pos
+            self.lineno = lineno
+            yield None
+
+    def columns(self, stream):
+        """
+        Scan the rest of the input into stream, a lya_tokens.TokenStream for
+        TYPES, as the token generator would return it.
+        """
+        classes = CLASSES.get
+        codes = CODES
+        data = self.lexdata
+        pos = self.lexpos
+        lineno = self.lineno
+        end = self.lexlen
+        kind = stream.kinds.append
+        start = stream.starts.append
+        line = stream.lines.append
+        value = stream.values.append
+        interned = stream.interned
+        intern = stream.intern
+        add = stream.add
+        while pos < end:
+            c = data[pos]
+            k = classes(c, OTHER)
+            if k == 2:
+                m = skip_ID(data, pos)
+                if m:
+                    text = m.group(1)
+                    kind(codes[KEYWORDS.get(text, 'ID')])
+                    start(pos)
+                    line(lineno)
+                    value(interned[text] if text in interned else intern(text))
+                    pos = m.end()
+                    continue
+            elif k == 0:
+                pos += 1
+                continue
+            elif k == 1:
+                kind(codes[SINGLES[c]])
+                start(pos)
+                line(lineno)
+                value(interned[c] if c in interned else intern(c))
+                pos += 1
+                continue
+            elif k > 2:
+                if k < 10:
+                    if k < 6:
+                        if k < 4:
+                            m = skip_ICONST(data, pos)
+                            if m:
+                                text = m.group(1)
+                                kind(codes['ICONST'])
+                                start(pos)
+                                line(lineno)
+                                value(intern(int(text)))
+                                pos = m.end()
+                                continue
+                        else:
+                            if k < 5:
+                                m = skip_newline(data, pos)
+                                if m:
+                                    text = m.group(1)
+                                    lineno += text.count("\n")
+                                    pos = m.end()
+                                    continue
+                            else:
+                                if data.startswith('!=', pos):
+                                    kind(codes['DIFF'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['!='] if '!=' in interned else intern('!='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['NOT'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['!'] if '!' in interned else intern('!'))
+                                pos = pos + 1
+                                continue
+                    else:
+                        if k < 8:
+                            if k < 7:
+                                m = skip_SCONST(data, pos)
+                                if m:
+                                    text = m.group(1)
+                                    kind(codes['SCONST'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(intern(list(map(ord, text))))
+                                    pos = m.end()
+                                    continue
+                                m = match_error_STRING(data, pos)
+                                if m:
+                                    text = m.group()
+                                    t = Token()
+                                    t.type = 'error_STRING'
+                                    t.value = text
+                                    t.lineno = lineno
+                                    t.lexpos = pos
+                                    t.lexer = self
+                                    self.lineno = lineno
+                                    self.lexmatch = m
+                                    self.lexpos = m.end()
+                                    t = self.module.t_error_STRING(t)
+                                    pos = self.lexpos
+                                    lineno = self.lineno
+                                    if t:
+                                        add(t)
+                                    continue
+                            else:
+                                if data.startswith('%=', pos):
+                                    kind(codes['MODCREASE'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['%='] if '%=' in interned else intern('%='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['MOD'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['%'] if '%' in interned else intern('%'))
+                                pos = pos + 1
+                                continue
+                        else:
+                            if k < 9:
+                                if data.startswith('&&', pos):
+                                    kind(codes['AND'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['&&'] if '&&' in interned else intern('&&'))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['STRCAT'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['&'] if '&' in interned else intern('&'))
+                                pos = pos + 1
+                                continue
+                            else:
+                                m = skip_CCONST(data, pos)
+                                if m:
+                                    text = m.group(1)
+                                    kind(codes['CCONST'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(intern(ord(text[1:-1])))
+                                    pos = m.end()
+                                    continue
+                else:
+                    if k < 14:
+                        if k < 12:
+                            if k < 11:
+                                if data.startswith('*=', pos):
+                                    kind(codes['MULCREASE'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['*='] if '*=' in interned else intern('*='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['TIMES'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['*'] if '*' in interned else intern('*'))
+                                pos = pos + 1
+                                continue
+                            else:
+                                if data.startswith('+=', pos):
+                                    kind(codes['INCREASE'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['+='] if '+=' in interned else intern('+='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['PLUS'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['+'] if '+' in interned else intern('+'))
+                                pos = pos + 1
+                                continue
+                        else:
+                            if k < 13:
+                                if data.startswith('->', pos):
+                                    kind(codes['ARROW'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['->'] if '->' in interned else intern('->'))
+                                    pos = pos + 2
+                                    continue
+                                if data.startswith('-=', pos):
+                                    kind(codes['DECREASE'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['-='] if '-=' in interned else intern('-='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['MINUS'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['-'] if '-' in interned else intern('-'))
+                                pos = pos + 1
+                                continue
+                            else:
+                                m = skip_COMMENT(data, pos)
+                                if m:
+                                    text = m.group(1)
+                                    lineno += text.count("\n")
+                                    pos = m.end()
+                                    continue
+                                m = skip_DIVIDE(data, pos)
+                                if m:
+                                    text = m.group(1)
+                                    kind(codes['DIVIDE'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned[text] if text in interned else intern(text))
+                                    pos = m.end()
+                                    continue
+                                if data.startswith('/=', pos):
+                                    kind(codes['DIVCREASE'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['/='] if '/=' in interned else intern('/='))
+                                    pos = pos + 2
+                                    continue
+                    else:
+                        if k < 16:
+                            if k < 15:
+                                if data.startswith('<=', pos):
+                                    kind(codes['LESSEQ'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['<='] if '<=' in interned else intern('<='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['LESS'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['<'] if '<' in interned else intern('<'))
+                                pos = pos + 1
+                                continue
+                            else:
+                                if data.startswith('==', pos):
+                                    kind(codes['EQUAL'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['=='] if '==' in interned else intern('=='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['ASSIGN'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['='] if '=' in interned else intern('='))
+                                pos = pos + 1
+                                continue
+                        else:
+                            if k < 17:
+                                if data.startswith('>=', pos):
+                                    kind(codes['GREATEREQ'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['>='] if '>=' in interned else intern('>='))
+                                    pos = pos + 2
+                                    continue
+                                kind(codes['GREATER'])
+                                start(pos)
+                                line(lineno)
+                                value(interned['>'] if '>' in interned else intern('>'))
+                                pos = pos + 1
+                                continue
+                            else:
+                                if data.startswith('||', pos):
+                                    kind(codes['OR'])
+                                    start(pos)
+                                    line(lineno)
+                                    value(interned['||'] if '||' in interned else intern('||'))
+                                    pos = pos + 2
+                                    continue
+
+            # No rule matches
+            self.lineno = lineno
+            self.lexpos = pos
+            t = Token()
+            t.value = data[pos:]
+            t.lineno = lineno
+            t.type = 'error'
+            t.lexer = self
+            t.lexpos = pos
+            t = self.module.t_error(t)
+            if pos == self.lexpos:
+                raise LexError("Scanning error. Illegal character '%s'" % (data[pos]), data[pos:])
+            pos = self.lexpos
+            lineno = self.lineno
+            if t:
+                add(t)
+
+        self.lexpos = pos + 1
+        self.lineno = lineno
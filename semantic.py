@@ -437,7 +437,8 @@ class Visitor(NodeVisitor):
         if node.lower_bound.expression.raw_type != None and node.upper_bound.expression.raw_type != None:
             if node.lower_bound.expression.raw_type != node.upper_bound.expression.raw_type:
                 self.print_error(node.lineno, "Mismatching bound types in literal range")
-            else:
+            elif node.lower_bound.expression.value != None and node.upper_bound.expression.value != None:
+                # Bounds only known at run time are fine for range enumerations
                 node.size = node.upper_bound.expression.value - node.lower_bound.expression.value + 1
                 if node.size < 0:
                     self.print_error(node.lineno, "Upper bound must be greater than lower bound")
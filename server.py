@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Fork server for compile.py.
+#
+#   python3 server.py serve socket
+#   python3 server.py run socket file.lya [compile.py options]
+#
+# serve imports the compiler and builds the parser and lexer once, then
+# listens on a Unix socket. run sends its arguments, working directory and
+# stdin, stdout and stderr to the server, which forks a child that takes
+# over those files and runs compile.main as if it had been started there.
+# The exit status of the child is sent back and becomes the status of run,
+# so a request only costs the compile and the run of the program.
+
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+
+# Bytes of a request, its arguments and working directory, in json
+REQUEST_SIZE = 65536
+
+def serve(path):
+    # The client side (run) does not need any of this
+    import compile
+    from parser import Parser
+
+    parser = Parser(frozen = True)
+
+    # Children are reaped by the kernel
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(64)
+
+    print("Listening on " + path)
+    sys.stdout.flush()
+
+    while True:
+        connection, _ = server.accept()
+        data, fds, _, _ = socket.recv_fds(connection, REQUEST_SIZE, 3)
+
+        if len(fds) == 3 and os.fork() == 0:
+            server.close()
+            handle(connection, json.loads(data), fds, compile, parser)
+
+        connection.close()
+        for fd in fds:
+            os.close(fd)
+
+def handle(connection, request, fds, compile, parser):
+    # Runs in the child, and never returns
+    status = 0
+    try:
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.chdir(request['cwd'])
+        sys.argv = ['compile.py'] + request['argv']
+
+        try:
+            compile.main(parser)
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else int(e.code != None)
+    except Exception:
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        connection.sendall(str(status).encode())
+        os._exit(status)
+
+def run(path, argv):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(path)
+
+    request = json.dumps({'argv': argv, 'cwd': os.getcwd()}).encode()
+    socket.send_fds(client, [request], [0, 1, 2])
+
+    status = b''
+    while True:
+        data = client.recv(16)
+        if len(data) == 0:
+            break
+        status += data
+    return int(status) if len(status) > 0 else 1
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ('serve', 'run'):
+        print("Usage: python3 server.py serve socket")
+        print("       python3 server.py run socket file.lya <compile.py options>")
+        return 1
+
+    if sys.argv[1] == 'serve':
+        serve(sys.argv[2])
+        return 0
+    return run(sys.argv[2], sys.argv[3:])
+
+if __name__ == "__main__": exit(main())
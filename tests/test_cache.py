@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Constants past 64 bits, which lya_object packs apart
+BIG = 'dcl x int = 99999999999999999999; print(x*2);\n'
+
+class CacheTest(unittest.TestCase):
+
+    def compile(self, *args):
+        return subprocess.run([sys.executable, os.path.join(ROOT, 'compile.py')] + list(args), cwd = ROOT, stdout = subprocess.PIPE, stderr = subprocess.PIPE, text = True)
+
+    def test_big_literal(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'big.lya')
+            with open(source, 'w') as file:
+                file.write(BIG)
+            cache = '--cache=' + os.path.join(directory, 'cache')
+
+            # Compiled and stored, then run from the cache
+            for _ in range(2):
+                result = self.compile(source, cache)
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertEqual(result.stdout.strip(), '199999999999999999998')
+            self.assertEqual(len(os.listdir(os.path.join(directory, 'cache'))), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Nested counted loops, the inner one with a conditional jump back to the
+# head of its trace
+NESTED = '''f: proc (n int) returns (int);
+  dcl s, i, j int;
+  s = 0;
+  do for i = 1 to n;
+    do for j = 1 to n;
+      if j % 7 == 0 then
+        s += i;
+      fi;
+    od;
+  od;
+  return s;
+end;
+print(f(60));
+'''
+
+class TraceEngineTest(unittest.TestCase):
+
+    def run_engine(self, file_name, engine, data = ''):
+        result = subprocess.run([sys.executable, os.path.join(ROOT, 'compile.py'), file_name, '--engine=' + engine, '--no-cache'], cwd = ROOT, input = data, stdout = subprocess.PIPE, stderr = subprocess.PIPE, text = True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout
+
+    def assertSameOutput(self, file_name, data = ''):
+        self.assertEqual(self.run_engine(file_name, 'trace', data), self.run_engine(file_name, 'classic', data))
+
+    def test_sample11(self):
+        self.assertSameOutput(os.path.join(ROOT, 'samples', 'sample11.lya'), '2 100\n')
+
+    def test_nested_for(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'nested.lya')
+            with open(source, 'w') as file:
+                file.write(NESTED)
+            self.assertSameOutput(source)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lya_object
+
+class ObjectTest(unittest.TestCase):
+
+    def test_versions(self):
+        for name in os.listdir(os.path.join(ROOT, 'lvm_code')):
+            with open(os.path.join(ROOT, 'lvm_code', name), 'rb') as file:
+                header = lya_object.HEADER.unpack_from(file.read(lya_object.HEADER.size))
+            self.assertEqual(header[1], lya_object.VERSION, name)
+
+    def test_truncated(self):
+        file_name = os.path.join(ROOT, 'lvm_code', 'sample1.o')
+        with open(file_name, 'rb') as file:
+            data = file.read()
+        lya_object.load(file_name)
+
+        with tempfile.TemporaryDirectory() as directory:
+            cut = os.path.join(directory, 'cut.o')
+            for size in range(1, len(data)):
+                with open(cut, 'wb') as file:
+                    file.write(data[:size])
+                with self.assertRaises(ValueError):
+                    lya_object.load(cut)
+
+if __name__ == '__main__':
+    unittest.main()